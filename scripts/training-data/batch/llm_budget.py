@@ -0,0 +1,161 @@
+"""
+Cross-process LLM call budget shared by every pipeline-runner on the host.
+
+automation.max_aggregate_llm_calls in pipeline.config.json caps the number of Claude calls in
+flight across all concurrently running sub-batches. Each runner still limits itself with
+--parallel; this module adds the host-wide cap on top of that.
+
+The budget is a directory of N slot files (slot-000.lock ... slot-NNN.lock). Holding a slot
+means holding an exclusive flock on one of them, so a crashed or killed runner releases its
+slots with its file descriptors. No daemon and no stale counters. Waiters poll the slots in
+order with a short sleep, which is cheap next to calls that take minutes.
+
+Processes configured with different capacities share the low-numbered slots, so the effective
+host-wide cap is the largest capacity in use.
+
+Environment overrides (inherited by runners that run-campaign or sub-batch-pipeline spawn):
+  PIPELINE_LLM_BUDGET=N        capacity (0 disables the shared budget)
+  PIPELINE_LLM_BUDGET_DIR=dir  slot directory (default: data/validation/llm_budget)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional, TextIO
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-posix fallback
+    fcntl = None
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent.parent.parent
+CONFIG_PATH = SCRIPT_DIR / "pipeline.config.json"
+DEFAULT_BUDGET_DIR = REPO_ROOT / "data" / "validation" / "llm_budget"
+
+BUDGET_ENV = "PIPELINE_LLM_BUDGET"
+BUDGET_DIR_ENV = "PIPELINE_LLM_BUDGET_DIR"
+
+POLL_SECONDS = 0.25
+
+
+def configured_capacity(config_path: Path = CONFIG_PATH) -> Optional[int]:
+    """PIPELINE_LLM_BUDGET, else automation.max_aggregate_llm_calls; None when unset/disabled."""
+    raw = os.environ.get(BUDGET_ENV, "").strip()
+    if raw:
+        try:
+            value = int(raw)
+        except ValueError:
+            return None
+        return value if value > 0 else None
+    try:
+        cfg = json.loads(config_path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    automation = cfg.get("automation", {}) if isinstance(cfg, dict) else {}
+    value = automation.get("max_aggregate_llm_calls") if isinstance(automation, dict) else None
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return None
+
+
+def configured_dir() -> Path:
+    raw = os.environ.get(BUDGET_DIR_ENV, "").strip()
+    return Path(raw) if raw else DEFAULT_BUDGET_DIR
+
+
+class LLMBudget:
+    """Counting semaphore over flock'd slot files; usable from threads and asyncio tasks."""
+
+    def __init__(self, capacity: int, budget_dir: Optional[Path] = None):
+        if capacity < 1:
+            raise ValueError("LLM budget capacity must be >= 1")
+        self.capacity = capacity
+        self.budget_dir = budget_dir or configured_dir()
+
+    @classmethod
+    def from_config(cls, capacity: Optional[int] = None) -> Optional["LLMBudget"]:
+        """Budget for this host, or None when disabled (no cap configured, or no fcntl)."""
+        if fcntl is None:
+            return None
+        cap = capacity if capacity is not None else configured_capacity()
+        if cap is None or cap < 1:
+            return None
+        return cls(cap)
+
+    def _slot_path(self, index: int) -> Path:
+        return self.budget_dir / f"slot-{index:03d}.lock"
+
+    def try_acquire(self) -> Optional[TextIO]:
+        """Lock the first free slot and return its handle, or None when all are held."""
+        self.budget_dir.mkdir(parents=True, exist_ok=True)
+        for index in range(self.capacity):
+            handle = self._slot_path(index).open("a+", encoding="utf-8")
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                handle.close()
+                continue
+            handle.seek(0)
+            handle.truncate()
+            handle.write(f"{os.getpid()}\n")
+            handle.flush()
+            return handle
+        return None
+
+    @staticmethod
+    def release(handle: TextIO) -> None:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            handle.close()
+
+    def held(self) -> int:
+        """Slots currently held by any process (probe only; racy by nature)."""
+        if not self.budget_dir.exists():
+            return 0
+        busy = 0
+        for index in range(self.capacity):
+            path = self._slot_path(index)
+            if not path.exists():
+                continue
+            with path.open("a+", encoding="utf-8") as handle:
+                try:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    busy += 1
+                else:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        return busy
+
+    @contextlib.contextmanager
+    def slot(self, timeout: Optional[float] = None) -> Iterator[None]:
+        """Blocking acquire; raises TimeoutError when timeout elapses first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        handle = self.try_acquire()
+        while handle is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"no LLM budget slot free within {timeout}s ({self.budget_dir})")
+            time.sleep(POLL_SECONDS)
+            handle = self.try_acquire()
+        try:
+            yield
+        finally:
+            self.release(handle)
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Acquire without blocking the event loop (polls with asyncio.sleep)."""
+        handle = self.try_acquire()
+        while handle is None:
+            await asyncio.sleep(POLL_SECONDS)
+            handle = self.try_acquire()
+        try:
+            yield
+        finally:
+            self.release(handle)
@@ -0,0 +1,275 @@
+"""
+Park-and-resume handling for Claude usage limits inside one pipeline-runner run.
+
+When a stage call reports a usage limit ("You've hit your limit · resets 5pm
+(Europe/Copenhagen)"), the runner trips the controller instead of failing the video:
+
+  - LLM stage calls park in wait_available() until capacity returns; DET/EXT stages
+    and validators are not gated and keep running for every other video.
+  - One background task probes Claude at the parsed reset time (plus a grace period),
+    else with exponential backoff, and resumes all parked calls on the first healthy
+    probe. Parked calls are released in ticket order, so a video keeps the place in
+    the LLM queue it had when it first asked for the stage.
+  - probe() is the only way the runner checks capacity mid-run: concurrent callers
+    share one in-flight probe and recent results are cached for PROBE_TTL_SECONDS.
+  - max_wait_seconds is a budget for the whole run: time parked across every outage
+    counts against it. Once it is spent the controller gives up and parked calls fail as
+    before (claude_limit_exhausted, runner exit 3). max_wait_seconds=0 disables parking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import re
+import time
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - python < 3.9
+    ZoneInfo = None
+
+ProbeResult = Tuple[bool, Optional[str]]
+
+DEFAULT_MAX_WAIT_MINUTES = 360
+INITIAL_BACKOFF_SECONDS = 60.0
+MAX_BACKOFF_SECONDS = 1800.0
+RESET_GRACE_SECONDS = 30.0
+PROBE_TTL_SECONDS = 30.0
+
+_MONTHS = {m: i for i, m in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1
+)}
+# "Claude AI usage limit reached|1760882400" (older CLI builds report the reset epoch).
+_RESET_EPOCH_RE = re.compile(r"limit reached\|(\d{10})\b", re.IGNORECASE)
+# "try again in 25 minutes", "retry after 2 hours"
+_RESET_IN_RE = re.compile(r"\b(?:in|after)\s+(\d+)\s*(seconds?|secs?|minutes?|mins?|hours?|hrs?)\b", re.IGNORECASE)
+# "resets 5pm (Europe/Copenhagen)", "resets 12:30am", "resets Oct 21, 3pm (UTC)", "resets 12pm Europe/Copenhagen"
+_RESET_CLOCK_RE = re.compile(
+    r"resets\s+(?:at\s+)?"
+    r"(?:(?P<mon>[A-Za-z]{3})[a-z]*\s+(?P<day>\d{1,2}),?\s+(?:at\s+)?)?"
+    r"(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>am|pm)?"
+    r"(?:\s*\(?(?P<tz>[A-Za-z_]+(?:/[A-Za-z_+\-0-9]+)+|UTC|GMT)\)?)?",
+    re.IGNORECASE,
+)
+
+
+def _zone(name: Optional[str]) -> Optional[tzinfo]:
+    if not name:
+        return None
+    if name.upper() in {"UTC", "GMT"}:
+        return timezone.utc
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+def parse_reset_time(text: str, now: Optional[float] = None) -> Optional[float]:
+    """Epoch seconds at which a Claude limit message says capacity resets, or None."""
+    if not text:
+        return None
+    now = time.time() if now is None else now
+
+    m = _RESET_EPOCH_RE.search(text)
+    if m:
+        return float(m.group(1))
+
+    m = _RESET_CLOCK_RE.search(text)
+    if m:
+        hour = int(m.group("hour"))
+        minute = int(m.group("minute") or 0)
+        ampm = (m.group("ampm") or "").lower()
+        if ampm:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if ampm == "pm" else 0)
+        if hour > 23 or minute > 59:
+            return None
+        zone = _zone(m.group("tz"))
+        current = datetime.fromtimestamp(now, tz=zone) if zone else datetime.fromtimestamp(now).astimezone()
+        candidate = current.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        mon = (m.group("mon") or "").lower()
+        if mon in _MONTHS and m.group("day"):
+            try:
+                candidate = candidate.replace(month=_MONTHS[mon], day=int(m.group("day")))
+            except ValueError:
+                return None
+            if candidate.timestamp() <= now:
+                try:
+                    candidate = candidate.replace(year=candidate.year + 1)
+                except ValueError:
+                    return None
+        elif candidate.timestamp() <= now:
+            candidate += timedelta(days=1)
+        return candidate.timestamp()
+
+    m = _RESET_IN_RE.search(text)
+    if m:
+        unit = m.group(2).lower()
+        scale = 3600 if unit.startswith(("hour", "hr")) else 60 if unit.startswith("min") else 1
+        return now + int(m.group(1)) * scale
+    return None
+
+
+class LLMOutageController:
+    """Shared by every run_video task of one run; must be used from the event loop thread."""
+
+    def __init__(
+        self,
+        probe: Callable[[], Awaitable[ProbeResult]],
+        *,
+        max_wait_seconds: float,
+        initial_backoff: float = INITIAL_BACKOFF_SECONDS,
+        max_backoff: float = MAX_BACKOFF_SECONDS,
+        reset_grace: float = RESET_GRACE_SECONDS,
+        probe_ttl: float = PROBE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self._probe_fn = probe
+        self.max_wait_seconds = max(0.0, float(max_wait_seconds))
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.reset_grace = reset_grace
+        self.probe_ttl = probe_ttl
+        self._clock = clock
+        self._sleep = sleep
+
+        self.parked = False
+        self.gave_up = False
+        self.reason: Optional[str] = None
+        self.reset_at: Optional[float] = None
+        self.park_count = 0
+        self.probe_count = 0
+        self.parked_seconds = 0.0
+        self._parked_since: Optional[float] = None
+        self._tickets = itertools.count()
+        self._waiters: List[Tuple[int, asyncio.Future]] = []
+        self._resume_task: Optional[asyncio.Task] = None
+        self._probe_task: Optional[asyncio.Task] = None
+        self._probe_result: Optional[ProbeResult] = None
+        self._probe_at = float("-inf")
+
+    @property
+    def can_park(self) -> bool:
+        return self.max_wait_seconds > 0 and not self.gave_up and self.parked_seconds < self.max_wait_seconds
+
+    def _deadline(self) -> float:
+        """When the current outage exhausts what is left of the run's park budget."""
+        assert self._parked_since is not None
+        return self._parked_since + self.max_wait_seconds - self.parked_seconds
+
+    def ticket(self) -> int:
+        """Queue position for one LLM stage call; keep it across retries of that call."""
+        return next(self._tickets)
+
+    async def probe(self, *, fresh: bool = False) -> ProbeResult:
+        """Capacity check shared by all callers (one in flight, cached for probe_ttl)."""
+        if self._probe_task is None:
+            if (
+                not fresh
+                and self._probe_result is not None
+                and self._clock() - self._probe_at < self.probe_ttl
+            ):
+                return self._probe_result
+            self._probe_task = asyncio.get_running_loop().create_task(self._run_probe())
+        return await asyncio.shield(self._probe_task)
+
+    async def _run_probe(self) -> ProbeResult:
+        try:
+            self.probe_count += 1
+            result = await self._probe_fn()
+        finally:
+            self._probe_task = None
+        self._probe_result = result
+        self._probe_at = self._clock()
+        return result
+
+    def trip(self, message: Optional[str]) -> None:
+        """Park LLM calls after a usage-limit signal; no-op once given up or when disabled."""
+        if not self.can_park:
+            return
+        now = self._clock()
+        reset = parse_reset_time(message or "", now=now)
+        if self.parked:
+            if reset is not None and (self.reset_at is None or reset > self.reset_at):
+                self.reset_at = reset
+            return
+        self.parked = True
+        self.reason = message
+        self.reset_at = reset
+        self.park_count += 1
+        self._parked_since = now
+        # Whatever was cached predates the limit.
+        self._probe_result = (False, message)
+        self._probe_at = now
+        self._resume_task = asyncio.get_running_loop().create_task(self._resume_loop())
+
+    async def wait_available(self, ticket: int) -> bool:
+        """True once LLM calls may run; False when the controller gave up on this outage."""
+        if self.gave_up:
+            return False
+        if not self.parked:
+            return True
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append((ticket, fut))
+        return await fut
+
+    def _release(self, ok: bool) -> None:
+        if self._parked_since is not None:
+            self.parked_seconds += max(0.0, self._clock() - self._parked_since)
+        self._parked_since = None
+        self.parked = False
+        self.gave_up = self.gave_up or not ok
+        waiters = sorted(self._waiters, key=lambda w: w[0])
+        self._waiters = []
+        for _, fut in waiters:
+            if not fut.done():
+                fut.set_result(ok)
+
+    def _next_probe_at(self, delay: float) -> float:
+        now = self._clock()
+        if self.reset_at is not None and self.reset_at > now:
+            target = self.reset_at + self.reset_grace
+        else:
+            target = now + delay
+        return min(target, self._deadline())
+
+    async def _resume_loop(self) -> None:
+        delay = self.initial_backoff
+        while True:
+            used_reset = self.reset_at is not None and self.reset_at > self._clock()
+            target = self._next_probe_at(delay)
+            if not used_reset:
+                delay = min(self.max_backoff, delay * 2)
+            self.reset_at = None
+            await self._sleep(max(0.0, target - self._clock()))
+            ok, reason = await self.probe(fresh=True)
+            if ok:
+                self._release(True)
+                return
+            if self._clock() >= self._deadline():
+                self.reason = reason or self.reason
+                self._release(False)
+                return
+            reset = parse_reset_time(reason or "", now=self._clock())
+            if reset is not None and reset > self._clock():
+                self.reset_at = reset
+
+    async def close(self) -> None:
+        """Stop probing (end of run); any parked callers are released as given up."""
+        task = self._resume_task
+        self._resume_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self.parked:
+            self._release(False)
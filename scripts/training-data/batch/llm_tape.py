@@ -0,0 +1,125 @@
+"""
+Recorded Claude responses ("tapes") for deterministic end-to-end benchmarks of stages 06-08.
+
+batch/claude-tape sits where the Claude CLI would (CLAUDE_BINARY) and either records or
+replays. pipeline-runner wires it up with --llm-record DIR / --llm-replay DIR:
+
+  - record: forwards each call to the real CLI and stores the response and its latency under
+    a key of (model, prompt). Only successful, non-empty answers are stored; failures pass
+    through unchanged, so the stage's own retry is what ends up on tape.
+  - replay: serves stored responses without touching the network, sleeping the recorded
+    latency, none, or a scaled amount (LLM_TAPE_LATENCY = recorded | zero | <factor>).
+    A prompt with no recording fails the call ("no recorded response"), which shows up
+    as a stage failure instead of silently spending quota. Preflight probes always pass.
+
+A prompt maps to one stored response (the latest recording), so replaying the same corpus
+against the same code is deterministic and output directories can be diffed across code
+versions. Changing a prompt template changes the keys; re-record after doing that.
+
+Tape layout:
+  DIR/responses/<key[:2]>/<key>.json   {"version", "key", "stage", "model", "prompt_chars",
+                                        "response", "latency_seconds", "recorded_at"}
+  DIR/calls.jsonl                      one line per call, in record and replay mode
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-posix fallback
+    fcntl = None
+
+TAPE_VERSION = 1
+
+MODE_ENV = "LLM_TAPE_MODE"
+DIR_ENV = "LLM_TAPE_DIR"
+REAL_BINARY_ENV = "LLM_TAPE_REAL_BINARY"
+LATENCY_ENV = "LLM_TAPE_LATENCY"
+
+MODES = ("record", "replay")
+
+
+def tape_key(model: Optional[str], prompt: str) -> str:
+    """Stable id for one call: the model it asked for plus the exact prompt text."""
+    digest = hashlib.sha256()
+    digest.update((model or "").encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def replay_delay(recorded_seconds: float, latency: str) -> float:
+    """Seconds to sleep before serving a replayed response."""
+    mode = (latency or "recorded").strip().lower()
+    if mode == "recorded":
+        return max(0.0, recorded_seconds)
+    if mode == "zero":
+        return 0.0
+    try:
+        factor = float(mode)
+    except ValueError:
+        factor = -1.0
+    if not factor >= 0:
+        raise ValueError(f"{LATENCY_ENV} must be recorded, zero or a factor >= 0, got {latency!r}")
+    return max(0.0, recorded_seconds * factor)
+
+
+class LLMTape:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.responses_dir = self.root / "responses"
+        self.calls_path = self.root / "calls.jsonl"
+
+    def _path(self, key: str) -> Path:
+        return self.responses_dir / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != TAPE_VERSION:
+            return None
+        if not isinstance(entry.get("response"), str):
+            return None
+        return entry
+
+    def store(
+        self,
+        key: str,
+        *,
+        stage: str,
+        model: Optional[str],
+        prompt_chars: int,
+        response: str,
+        latency_seconds: float,
+    ) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "version": TAPE_VERSION,
+            "key": key,
+            "stage": stage,
+            "model": model,
+            "prompt_chars": prompt_chars,
+            "response": response,
+            "latency_seconds": round(latency_seconds, 3),
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def log_call(self, row: Dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self.calls_path.open("a", encoding="utf-8") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+near_dup_index.py — Cross-video near-duplicate transcript index (MinHash + LSH).
+
+Coaches reupload the same infield under new video IDs, or cut it into compilations, and
+ID-based dedup (dedup-cross-producer.sh, manifest_parser._pick_preferred_path) cannot see
+that. This index covers every video with a transcript (04.EXT.diarize, else
+02.EXT.transcribe). Each transcript is normalized and cut into overlapping word-shingle
+windows, and each window gets a MinHash signature banded into an LSH table. A query returns
+candidate videos that share windows; each candidate is then verified by segment-level overlap
+against the actual transcripts.
+
+Index files (data/.near-dup/):
+  index.json    params + per-video rows {video_id, source, folder, transcript, mtime_ns, window_start, window_count}
+  index.npz     "signatures": uint32 [windows, NUM_PERM], rows grouped per video
+  .lock         flock held around every load and every load-update-save of the index
+
+02.EXT.transcribe and 04.EXT.diarize index each transcript as they write it
+(index_finished_transcript), so `build` is only needed to backfill older data. Manifest
+checks (`query`, batch-create, sub-batch-create) only read the persisted index.
+
+Usage:
+  # Index (or refresh) every transcript under data/:
+  python3 near_dup_index.py build
+
+  # Check a manifest (or single video IDs) against the index:
+  python3 near_dup_index.py query --manifest docs/pipeline/batches/P001.txt
+  python3 near_dup_index.py query --video-id 4x9bvKaVWBc
+"""
+
+import argparse
+import contextlib
+import json
+import re
+import os
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    from manifest_parser import extract_video_id
+except ImportError:  # imported as batch.near_dup_index by the 02/04 stage scripts
+    from batch.manifest_parser import extract_video_id
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-posix fallback
+    fcntl = None
+
+INDEX_VERSION = 1
+
+# 128 permutations in 32 bands of 4 rows: a window pair with Jaccard s collides in at least one
+# band with probability 1 - (1 - s^4)^32 (~0.5 at s=0.42, ~0.99 at s=0.65), so reworded
+# reuploads still surface as candidates and verification does the precise filtering.
+NUM_PERM = 128
+LSH_BANDS = 32
+SHINGLE_WORDS = 5
+# ~200 shingles is roughly 1.5-2 minutes of speech: small enough that a reupload cut into a
+# compilation still matches window-for-window, large enough that chit-chat doesn't collide.
+WINDOW_SHINGLES = 200
+WINDOW_STRIDE = 100
+# Verification: fraction of the query's words sitting in segments whose shingles are mostly
+# (SEGMENT_MATCH_RATIO) present in the candidate transcript.
+SEGMENT_MATCH_RATIO = 0.5
+MIN_SEGMENT_WORDS = 4
+FLAG_OVERLAP = 0.5
+# Near-total overlap in both directions: same content (a reupload), not a clip or compilation.
+REUPLOAD_OVERLAP = 0.9
+
+TRANSCRIPT_STAGES = ("04.EXT.diarize", "02.EXT.transcribe")
+
+_MERSENNE_31 = np.uint64((1 << 31) - 1)
+_rng = np.random.RandomState(20240601)
+_PERM_A = _rng.randint(1, (1 << 31) - 1, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, (1 << 31) - 1, size=NUM_PERM).astype(np.uint64)
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def repo_root() -> Path:
+    return Path(__file__).resolve().parent.parent.parent.parent
+
+
+def default_index_dir() -> Path:
+    return repo_root() / "data" / ".near-dup"
+
+
+# ── Transcript normalization ───────────────────────────────────────────────
+
+def normalize_words(text: str) -> List[str]:
+    return _TOKEN_RE.findall(str(text or "").lower().replace("’", "'"))
+
+
+def find_transcript(data_root: Path, source: str, folder: str) -> Optional[Path]:
+    """Latest transcript for a video: 04.EXT.diarize, else 02.EXT.transcribe."""
+    for stage in TRANSCRIPT_STAGES:
+        path = data_root / stage / source / folder / f"{folder}.full.json"
+        if path.exists():
+            return path
+    return None
+
+
+def load_segment_words(path: Path) -> List[List[str]]:
+    """Normalized words per transcript segment (empty segments dropped)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return []
+    out: List[List[str]] = []
+    for seg in data.get("segments", []) if isinstance(data, dict) else []:
+        if isinstance(seg, dict):
+            words = normalize_words(seg.get("text", ""))
+            if words:
+                out.append(words)
+    return out
+
+
+def shingle_hashes(words: List[str]) -> np.ndarray:
+    """Stable 32-bit hashes of every SHINGLE_WORDS-word shingle (in order, with repeats)."""
+    if len(words) < SHINGLE_WORDS:
+        return np.zeros(0, dtype=np.uint64)
+    return np.fromiter(
+        (
+            zlib.crc32(" ".join(words[i:i + SHINGLE_WORDS]).encode("utf-8"))
+            for i in range(len(words) - SHINGLE_WORDS + 1)
+        ),
+        dtype=np.uint64,
+    )
+
+
+def minhash(hashes: np.ndarray) -> np.ndarray:
+    """MinHash signature (NUM_PERM uint32) of a set of shingle hashes."""
+    if hashes.size == 0:
+        return np.full(NUM_PERM, np.iinfo(np.uint32).max, dtype=np.uint32)
+    # a < 2^31 and x < 2^32 keep a*x + b inside uint64.
+    permuted = (hashes[:, None] * _PERM_A[None, :] + _PERM_B[None, :]) % _MERSENNE_31
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def window_signatures(segment_words: List[List[str]]) -> np.ndarray:
+    """MinHash per overlapping shingle window over the whole transcript: [windows, NUM_PERM]."""
+    hashes = shingle_hashes([w for seg in segment_words for w in seg])
+    if hashes.size == 0:
+        return np.zeros((0, NUM_PERM), dtype=np.uint32)
+    starts = list(range(0, max(1, hashes.size - WINDOW_SHINGLES + 1), WINDOW_STRIDE))
+    if starts[-1] + WINDOW_SHINGLES < hashes.size:
+        starts.append(hashes.size - WINDOW_SHINGLES)
+    return np.stack([minhash(np.unique(hashes[s:s + WINDOW_SHINGLES])) for s in starts])
+
+
+def segment_overlap(query: List[List[str]], candidate: List[List[str]]) -> float:
+    """Word-weighted fraction of query segments whose shingles mostly occur in candidate."""
+    cand = set(shingle_hashes([w for seg in candidate for w in seg]).tolist())
+    if not cand:
+        return 0.0
+    matched = 0
+    total = 0
+    for words in query:
+        if len(words) < MIN_SEGMENT_WORDS:
+            continue
+        total += len(words)
+        seg_hashes = shingle_hashes(words)
+        if seg_hashes.size == 0:
+            # Shorter than a shingle: look the whole segment up as one shingle-ish unit.
+            seg_hashes = np.array([zlib.crc32(" ".join(words).encode("utf-8"))], dtype=np.uint64)
+        hits = sum(1 for h in seg_hashes.tolist() if h in cand)
+        if hits / float(seg_hashes.size) >= SEGMENT_MATCH_RATIO:
+            matched += len(words)
+    return matched / float(total) if total else 0.0
+
+
+def _band_keys(signature: np.ndarray) -> List[Tuple[int, bytes]]:
+    rows = NUM_PERM // LSH_BANDS
+    return [(b, signature[b * rows:(b + 1) * rows].tobytes()) for b in range(LSH_BANDS)]
+
+
+# ── Index ──────────────────────────────────────────────────────────────────
+
+def _atomic_write(path: Path, write: Callable[[Any], Any]) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            write(fh)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+class NearDupIndex:
+    """Window-level MinHash signatures for every indexed video, with an in-memory LSH table."""
+
+    def __init__(self, index_dir: Path):
+        self.index_dir = Path(index_dir)
+        self.videos: Dict[str, Dict[str, Any]] = {}
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._buckets: Dict[Tuple[int, bytes], Set[str]] = {}
+
+    @classmethod
+    def load(cls, index_dir: Optional[Path] = None) -> "NearDupIndex":
+        index = cls(index_dir or default_index_dir())
+        meta_path = index.index_dir / "index.json"
+        sig_path = index.index_dir / "index.npz"
+        if not meta_path.exists() or not sig_path.exists():
+            return index
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            signatures = np.load(sig_path)["signatures"]
+        except (json.JSONDecodeError, OSError, KeyError, ValueError):
+            return index
+        params = meta.get("params", {})
+        if meta.get("version") != INDEX_VERSION or params != _params():
+            return index
+        for row in meta.get("videos", []):
+            start = int(row.pop("window_start"))
+            count = int(row.pop("window_count"))
+            index._add(row, signatures[start:start + count])
+        return index
+
+    def save(self) -> None:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        rows: List[Dict[str, Any]] = []
+        chunks: List[np.ndarray] = []
+        offset = 0
+        for video_id in sorted(self.videos):
+            sigs = self._signatures[video_id]
+            row = dict(self.videos[video_id])
+            row["window_start"] = offset
+            row["window_count"] = int(sigs.shape[0])
+            rows.append(row)
+            chunks.append(sigs)
+            offset += int(sigs.shape[0])
+        signatures = np.concatenate(chunks) if chunks else np.zeros((0, NUM_PERM), dtype=np.uint32)
+        meta = {
+            "version": INDEX_VERSION,
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "params": _params(),
+            "video_count": len(rows),
+            "window_count": offset,
+            "videos": rows,
+        }
+        # Signatures first: a crash between the two writes leaves a stale index.json whose
+        # offsets still fit, instead of rows pointing past the end of the array.
+        _atomic_write(self.index_dir / "index.npz", lambda fh: np.savez_compressed(fh, signatures=signatures))
+        payload = (json.dumps(meta, indent=2) + "\n").encode("utf-8")
+        _atomic_write(self.index_dir / "index.json", lambda fh: fh.write(payload))
+
+    def _add(self, row: Dict[str, Any], signatures: np.ndarray) -> None:
+        video_id = row["video_id"]
+        if video_id in self.videos:
+            self.remove(video_id)
+        self.videos[video_id] = row
+        self._signatures[video_id] = signatures
+        for sig in signatures:
+            for key in _band_keys(sig):
+                self._buckets.setdefault(key, set()).add(video_id)
+
+    def remove(self, video_id: str) -> None:
+        sigs = self._signatures.pop(video_id, None)
+        self.videos.pop(video_id, None)
+        if sigs is None:
+            return
+        for sig in sigs:
+            for key in _band_keys(sig):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(video_id)
+                    if not bucket:
+                        del self._buckets[key]
+
+    def is_current(self, video_id: str, transcript: Path) -> bool:
+        row = self.videos.get(video_id)
+        if row is None or row.get("transcript") != str(transcript):
+            return False
+        try:
+            return int(row.get("mtime_ns", -1)) == transcript.stat().st_mtime_ns
+        except OSError:
+            return False
+
+    def add_video(self, video_id: str, source: str, folder: str, transcript: Path) -> bool:
+        """(Re)index one transcript. Returns False when it has too few words to index."""
+        signatures = window_signatures(load_segment_words(transcript))
+        if signatures.shape[0] == 0:
+            self.remove(video_id)
+            return False
+        row = {
+            "video_id": video_id,
+            "source": source,
+            "folder": folder,
+            "transcript": str(transcript),
+            "mtime_ns": transcript.stat().st_mtime_ns,
+        }
+        self._add(row, signatures)
+        return True
+
+    def candidates(self, signatures: np.ndarray, exclude: Iterable[str] = ()) -> Dict[str, float]:
+        """Candidate video -> fraction of query windows sharing at least one LSH band."""
+        excluded = set(exclude)
+        hits: Dict[str, int] = {}
+        for sig in signatures:
+            window_hits: Set[str] = set()
+            for key in _band_keys(sig):
+                window_hits.update(self._buckets.get(key, ()))
+            for video_id in window_hits - excluded:
+                hits[video_id] = hits.get(video_id, 0) + 1
+        total = max(1, int(signatures.shape[0]))
+        return {video_id: n / total for video_id, n in hits.items()}
+
+    def query(
+        self,
+        segment_words: List[List[str]],
+        exclude: Iterable[str] = (),
+        min_overlap: float = FLAG_OVERLAP,
+    ) -> List[Dict[str, Any]]:
+        """Verified near-duplicates of a transcript, best first.
+
+        Each match: {video_id, source, folder, window_hit_ratio, overlap, reverse_overlap}, where
+        overlap is the share of the query covered by the candidate and reverse_overlap the
+        share of the candidate covered by the query.
+        """
+        signatures = window_signatures(segment_words)
+        if signatures.shape[0] == 0:
+            return []
+        matches: List[Dict[str, Any]] = []
+        for video_id, ratio in sorted(self.candidates(signatures, exclude).items(), key=lambda kv: -kv[1]):
+            row = self.videos[video_id]
+            candidate_words = load_segment_words(Path(row["transcript"]))
+            overlap = segment_overlap(segment_words, candidate_words)
+            if overlap < min_overlap:
+                continue
+            matches.append({
+                "video_id": video_id,
+                "source": row["source"],
+                "folder": row["folder"],
+                "window_hit_ratio": round(ratio, 3),
+                "overlap": round(overlap, 3),
+                "reverse_overlap": round(segment_overlap(candidate_words, segment_words), 3),
+            })
+        matches.sort(key=lambda m: (-m["overlap"], -m["reverse_overlap"], m["video_id"]))
+        return matches
+
+
+def _params() -> Dict[str, Any]:
+    return {
+        "num_perm": NUM_PERM,
+        "bands": LSH_BANDS,
+        "shingle_words": SHINGLE_WORDS,
+        "window_shingles": WINDOW_SHINGLES,
+        "window_stride": WINDOW_STRIDE,
+    }
+
+
+def build_index(index: NearDupIndex, data_root: Path) -> Dict[str, int]:
+    """Index every video with a transcript; unchanged transcripts are not re-hashed."""
+    counts = {"indexed": 0, "unchanged": 0, "too_short": 0, "removed": 0}
+    seen: Set[str] = set()
+    for stage in TRANSCRIPT_STAGES:
+        stage_root = data_root / stage
+        if not stage_root.exists():
+            continue
+        for source_dir in sorted(p for p in stage_root.iterdir() if p.is_dir()):
+            for video_dir in sorted(p for p in source_dir.iterdir() if p.is_dir()):
+                video_id = extract_video_id(video_dir.name)
+                if not video_id or video_id in seen:
+                    continue
+                transcript = find_transcript(data_root, source_dir.name, video_dir.name)
+                if transcript is None:
+                    continue
+                seen.add(video_id)
+                if index.is_current(video_id, transcript):
+                    counts["unchanged"] += 1
+                elif index.add_video(video_id, source_dir.name, video_dir.name, transcript):
+                    counts["indexed"] += 1
+                else:
+                    counts["too_short"] += 1
+    for video_id in sorted(set(index.videos) - seen):
+        index.remove(video_id)
+        counts["removed"] += 1
+    return counts
+
+
+# ── Manifest checks (batch-create / sub-batch-create) ──────────────────────
+
+def check_videos(
+    videos: List[Tuple[str, str, str]],
+    data_root: Path,
+    index: NearDupIndex,
+    min_overlap: float = FLAG_OVERLAP,
+) -> Dict[str, Dict[str, Any]]:
+    """Near-duplicate report for (source, folder, video_id) rows.
+
+    Earlier rows act as canonical for later ones within the same list, so two copies of
+    a reupload inside one batch are caught as well. Rows without a transcript are not
+    checked. Rows missing from `index` are hashed into this in-memory copy only; callers
+    do not save it. Returns {video_id: best match (+ "reupload")}.
+    """
+    report: Dict[str, Dict[str, Any]] = {}
+    batch_ids = [vid for _, _, vid in videos]
+    position = {vid: i for i, vid in enumerate(batch_ids)}
+    for i, (source, folder, video_id) in enumerate(videos):
+        transcript = find_transcript(data_root, source, folder)
+        if transcript is None:
+            continue
+        if not index.is_current(video_id, transcript):
+            index.add_video(video_id, source, folder, transcript)
+        # Never match against itself or later batch rows (they defer to this one).
+        exclude = {video_id} | {vid for vid in batch_ids[i + 1:]}
+        matches = index.query(load_segment_words(transcript), exclude=exclude, min_overlap=min_overlap)
+        matches = [m for m in matches if m["video_id"] not in report]
+        if not matches:
+            continue
+        best = dict(matches[0])
+        best["in_batch"] = best["video_id"] in position
+        best["reupload"] = best["overlap"] >= REUPLOAD_OVERLAP and best["reverse_overlap"] >= REUPLOAD_OVERLAP
+        report[video_id] = best
+    return report
+
+
+@contextlib.contextmanager
+def _index_lock(index_dir: Path) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    index_dir.mkdir(parents=True, exist_ok=True)
+    with (index_dir / ".lock").open("a+", encoding="utf-8") as lock_fh:
+        fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+
+def load_index(index_dir: Optional[Path] = None) -> NearDupIndex:
+    """Read the persisted index under the lock, so a concurrent save is never seen half-written."""
+    index_dir = Path(index_dir) if index_dir is not None else default_index_dir()
+    with _index_lock(index_dir):
+        return NearDupIndex.load(index_dir)
+
+
+def update_index(update: Callable[[NearDupIndex], Any], index_dir: Optional[Path] = None) -> Any:
+    """Load, apply `update`, and save while holding the index lock; returns update's result.
+
+    The index is saved only when `update` returns something truthy.
+    """
+    index_dir = Path(index_dir) if index_dir is not None else default_index_dir()
+    with _index_lock(index_dir):
+        index = NearDupIndex.load(index_dir)
+        result = update(index)
+        if result:
+            index.save()
+    return result
+
+
+def index_finished_transcript(transcript: Path, index_dir: Optional[Path] = None) -> bool:
+    """Fold a just-written data/<stage>/<source>/<folder>/<folder>.full.json into the index.
+
+    Returns True when the index changed. Runs through update_index so concurrent stage
+    runs and `build` don't drop each other's rows.
+    """
+    transcript = Path(transcript)
+    parts = transcript.parts
+    if len(parts) < 4 or parts[-4] not in TRANSCRIPT_STAGES:
+        return False
+    source, folder = parts[-3], parts[-2]
+    video_id = extract_video_id(folder)
+    if not video_id or not transcript.exists():
+        return False
+    data_root = transcript.parents[3]
+    # 02 output is shadowed by a diarized transcript once 04 has run.
+    if find_transcript(data_root, source, folder) != transcript:
+        return False
+    index_dir = Path(index_dir) if index_dir is not None else data_root / ".near-dup"
+
+    def add(index: NearDupIndex) -> bool:
+        if index.is_current(video_id, transcript):
+            return False
+        return index.add_video(video_id, source, folder, transcript)
+
+    return update_index(add, index_dir)
+
+
+def format_match(video_id: str, match: Dict[str, Any]) -> str:
+    action = "reupload" if match.get("reupload") else "overlap"
+    where = "earlier in batch" if match.get("in_batch") else match["source"]
+    return (
+        f"near-dup {video_id} ~ {match['video_id']} ({where}) "
+        f"overlap={match['overlap']:.2f} reverse={match['reverse_overlap']:.2f} [{action}]"
+    )
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────
+
+def _manifest_rows(manifest_path: Path) -> List[Tuple[str, str, str]]:
+    rows: List[Tuple[str, str, str]] = []
+    for line in manifest_path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "|" not in line:
+            continue
+        source, folder = [p.strip() for p in line.split("|", 1)]
+        video_id = extract_video_id(folder)
+        if video_id:
+            rows.append((source, folder, video_id))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cross-video near-duplicate transcript index.")
+    parser.add_argument("--index-dir", help="Index directory (default: data/.near-dup)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Index/refresh all transcripts under data/")
+    q = sub.add_parser("query", help="Report near-duplicates for a manifest or video IDs")
+    q.add_argument("--manifest", help="Manifest file (source | folder lines)")
+    q.add_argument("--video-id", action="append", default=[], help="Indexed video ID (repeatable)")
+    q.add_argument("--min-overlap", type=float, default=FLAG_OVERLAP)
+    q.add_argument("--json", action="store_true", help="Emit JSON")
+    args = parser.parse_args()
+
+    data_root = repo_root() / "data"
+    index_dir = Path(args.index_dir) if args.index_dir else default_index_dir()
+
+    if args.command == "build":
+        totals: Dict[str, int] = {}
+
+        def build(index: NearDupIndex) -> bool:
+            totals.update(build_index(index, data_root), total=len(index.videos))
+            return True
+
+        update_index(build, index_dir)
+        print(
+            f"[near-dup] indexed={totals['indexed']} unchanged={totals['unchanged']} "
+            f"too_short={totals['too_short']} removed={totals['removed']} total={totals['total']}"
+        )
+        return 0
+
+    index = load_index(index_dir)
+
+    rows: List[Tuple[str, str, str]] = []
+    if args.manifest:
+        rows.extend(_manifest_rows(Path(args.manifest)))
+    for video_id in args.video_id:
+        row = index.videos.get(video_id)
+        if row is None:
+            print(f"[near-dup] not indexed: {video_id}", file=sys.stderr)
+            continue
+        rows.append((row["source"], row["folder"], video_id))
+    if not rows:
+        parser.error("query needs --manifest or --video-id")
+    report = check_videos(rows, data_root, index, min_overlap=args.min_overlap)
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        for video_id, match in report.items():
+            print(f"[near-dup] {format_match(video_id, match)}")
+        print(f"[near-dup] checked={len(rows)} near_duplicates={len(report)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,368 @@
+"""
+Append-only quarantine ledger next to a quarantine JSON file.
+
+Writers append one JSON event per line to <name>.ledger.jsonl under an exclusive file lock
+instead of rewriting <name>.json, so parallel sub-batches and stage helpers never lose each
+other's updates. Readers fold the ledger over the JSON into an in-memory index once per
+process and then only tail new lines. Compaction writes the merged state back into the JSON
+in its existing shape and truncates the ledger, so tools that read the JSON directly keep
+working. Writers compact automatically once COMPACT_EVERY_EVENTS events are pending or the
+oldest pending event is COMPACT_MAX_AGE_SECONDS old; runners also compact once at the end of
+a run (pipeline-runner) or of a stage's validation (quarantine_updater.py --compact).
+
+Events:
+  {"op": "add", "video_id": "...", "row": {"video_id", "checks", "reasons", ...} | null, "ts": ...}
+  {"op": "replace", "videos": [row, ...], "video_ids": [...], "ts": ...}   # restart filtering
+
+Rows merge the same way merge_quarantine always has: checks are unioned, reasons are
+deduplicated by (check, message), and an existing row keeps its other fields.
+"""
+
+from __future__ import annotations
+
+import calendar
+import contextlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-posix fallback
+    fcntl = None
+
+VIDEO_ID_FULL_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+
+# Ledger lines folded into the JSON automatically once this many have accumulated, or once
+# the oldest of them is this old.
+COMPACT_EVERY_EVENTS = 200
+COMPACT_MAX_AGE_SECONDS = 600
+
+
+def ledger_path_for(quarantine_path: Path) -> Path:
+    """P001.1.json -> P001.1.ledger.jsonl"""
+    return quarantine_path.with_name(f"{quarantine_path.stem}.ledger.jsonl")
+
+
+def _lock_path_for(quarantine_path: Path) -> Path:
+    return quarantine_path.with_name(f"{quarantine_path.stem}.ledger.lock")
+
+
+def _valid_video_id(value: Any) -> Optional[str]:
+    if isinstance(value, str) and VIDEO_ID_FULL_RE.fullmatch(value.strip()):
+        return value.strip()
+    return None
+
+
+def _event_time(event: dict) -> Optional[float]:
+    try:
+        return float(calendar.timegm(time.strptime(str(event.get("ts", "")), "%Y-%m-%dT%H:%M:%SZ")))
+    except ValueError:
+        return None
+
+
+def merge_row(current: Optional[dict], new: dict) -> dict:
+    """Union checks, dedupe reasons by (check, message); keep current's other fields."""
+    if current is None:
+        merged = dict(new)
+        if isinstance(merged.get("checks"), list):
+            merged["checks"] = sorted({str(c) for c in merged["checks"] if str(c).strip()})
+        return merged
+    merged = dict(current)
+    for key, value in new.items():
+        if key not in ("checks", "reasons"):
+            merged.setdefault(key, value)
+    checks = set(merged.get("checks", [])) if isinstance(merged.get("checks"), list) else set()
+    if isinstance(new.get("checks"), list):
+        checks.update(new["checks"])
+    if checks:
+        merged["checks"] = sorted(str(c) for c in checks if str(c).strip())
+    reasons = list(merged.get("reasons", [])) if isinstance(merged.get("reasons"), list) else []
+    seen = {
+        (str(r.get("check", "")).strip(), str(r.get("message", "")).strip())
+        for r in reasons
+        if isinstance(r, dict)
+    }
+    for reason in new.get("reasons", []) if isinstance(new.get("reasons"), list) else []:
+        if not isinstance(reason, dict):
+            continue
+        key = (str(reason.get("check", "")).strip(), str(reason.get("message", "")).strip())
+        if key not in seen:
+            reasons.append(reason)
+            seen.add(key)
+    if reasons:
+        merged["reasons"] = reasons
+    return merged
+
+
+class QuarantineLedger:
+    """In-memory index of one quarantine file (JSON + ledger) with locked appends."""
+
+    def __init__(
+        self,
+        quarantine_path: Path,
+        compact_every: int = COMPACT_EVERY_EVENTS,
+        compact_max_age: float = COMPACT_MAX_AGE_SECONDS,
+    ):
+        self.path = Path(quarantine_path)
+        self.ledger_path = ledger_path_for(self.path)
+        self.lock_path = _lock_path_for(self.path)
+        self.compact_every = int(compact_every)
+        self.compact_max_age = float(compact_max_age)
+        self.load_error: Optional[str] = None
+        self._header: Dict[str, Any] = {}
+        self._ids: Set[str] = set()
+        self._rows: Dict[str, dict] = {}
+        self._json_identity: Optional[tuple] = None
+        self._offset = 0
+        self._pending_events = 0
+        self._oldest_pending: Optional[float] = None
+        self._loaded = False
+
+    # ── Locking ──
+
+    @contextlib.contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a+", encoding="utf-8") as lock_fh:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+    # ── Reading ──
+
+    def _stat_identity(self, path: Path) -> Optional[tuple]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _load_json(self) -> None:
+        self._header = {}
+        self._ids = set()
+        self._rows = {}
+        self.load_error = None
+        self._json_identity = self._stat_identity(self.path)
+        if self._json_identity is None:
+            return
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError) as e:
+            self.load_error = str(e)
+            return
+        if isinstance(raw, list):
+            self._ids.update(vid for vid in (_valid_video_id(item) for item in raw) if vid)
+            return
+        if not isinstance(raw, dict):
+            return
+        for key, value in raw.items():
+            if key not in ("quarantined_video_ids", "video_ids", "videos", "quarantined_video_count", "generated_at"):
+                self._header[key] = value
+        for key in ("quarantined_video_ids", "video_ids"):
+            if isinstance(raw.get(key), list):
+                self._ids.update(vid for vid in (_valid_video_id(item) for item in raw[key]) if vid)
+        videos = raw.get("videos")
+        if isinstance(videos, list):
+            for item in videos:
+                if isinstance(item, dict):
+                    vid = _valid_video_id(item.get("video_id"))
+                    if vid:
+                        self._ids.add(vid)
+                        self._rows[vid] = merge_row(self._rows.get(vid), item)
+                else:
+                    vid = _valid_video_id(item)
+                    if vid:
+                        self._ids.add(vid)
+
+    def _apply(self, event: dict) -> None:
+        op = event.get("op")
+        if op == "add":
+            vid = _valid_video_id(event.get("video_id"))
+            if not vid:
+                return
+            self._ids.add(vid)
+            row = event.get("row")
+            if isinstance(row, dict):
+                self._rows[vid] = merge_row(self._rows.get(vid), dict(row, video_id=vid))
+        elif op == "replace":
+            self._ids = set()
+            self._rows = {}
+            for item in event.get("video_ids", []) if isinstance(event.get("video_ids"), list) else []:
+                vid = _valid_video_id(item)
+                if vid:
+                    self._ids.add(vid)
+            for row in event.get("videos", []) if isinstance(event.get("videos"), list) else []:
+                if isinstance(row, dict):
+                    vid = _valid_video_id(row.get("video_id"))
+                    if vid:
+                        self._ids.add(vid)
+                        self._rows[vid] = merge_row(self._rows.get(vid), row)
+
+    def _tail_ledger(self) -> None:
+        try:
+            with self.ledger_path.open("rb") as fh:
+                fh.seek(self._offset)
+                chunk = fh.read()
+        except FileNotFoundError:
+            return
+        # Only consume complete lines; a concurrent append may still be in flight.
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return
+        for line in chunk[: end + 1].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(event, dict):
+                self._apply(event)
+                self._pending_events += 1
+                if self._oldest_pending is None:
+                    self._oldest_pending = _event_time(event)
+        self._offset += end + 1
+
+    def _refresh_unlocked(self) -> None:
+        ledger_size = self.ledger_path.stat().st_size if self.ledger_path.exists() else 0
+        if (
+            not self._loaded
+            or self._stat_identity(self.path) != self._json_identity
+            or ledger_size < self._offset
+        ):
+            # First load, or another process compacted since: rebuild from scratch.
+            self._load_json()
+            self._offset = 0
+            self._pending_events = 0
+            self._oldest_pending = None
+            self._loaded = True
+        if ledger_size > self._offset:
+            self._tail_ledger()
+
+    def refresh(self) -> "QuarantineLedger":
+        """Pick up events appended (or compactions done) by other processes."""
+        if not self.path.exists() and not self.ledger_path.exists():
+            if not self._loaded or self._json_identity is not None or self._offset:
+                self._load_json()
+                self._offset = 0
+                self._pending_events = 0
+                self._oldest_pending = None
+                self._loaded = True
+            return self
+        with self._locked(exclusive=False):
+            self._refresh_unlocked()
+        return self
+
+    def __contains__(self, video_id: object) -> bool:
+        return video_id in self._ids
+
+    @property
+    def video_ids(self) -> Set[str]:
+        return self._ids
+
+    def rows(self) -> List[dict]:
+        return [self._rows[vid] for vid in sorted(self._rows)]
+
+    def snapshot(self) -> dict:
+        """Merged state in the quarantine JSON shape."""
+        ids = sorted(self._ids)
+        out: Dict[str, Any] = {
+            "version": self._header.get("version", 1),
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "quarantine_level": self._header.get("quarantine_level", "error"),
+        }
+        out.update((k, v) for k, v in self._header.items() if k not in out)
+        out["quarantined_video_count"] = len(ids)
+        out["quarantined_video_ids"] = ids
+        out["videos"] = [self._rows[vid] for vid in ids if vid in self._rows]
+        return out
+
+    # ── Writing ──
+
+    def _append(self, events: List[dict]) -> None:
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        lines = "".join(
+            json.dumps(dict(event, ts=now), ensure_ascii=False, separators=(",", ":")) + "\n"
+            for event in events
+        )
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked(exclusive=True):
+            self._refresh_unlocked()
+            with self.ledger_path.open("a", encoding="utf-8") as fh:
+                fh.write(lines)
+                fh.flush()
+                os.fsync(fh.fileno())
+            self._tail_ledger()
+            if self._compaction_due():
+                self._compact_unlocked()
+
+    def record(self, video_id: str, row: Optional[dict] = None) -> None:
+        self.record_many([(video_id, row)])
+
+    def record_many(self, entries: List[tuple]) -> None:
+        """Append (video_id, row-or-None) events in one locked write."""
+        events = [
+            {"op": "add", "video_id": video_id, "row": row}
+            for video_id, row in entries
+            if _valid_video_id(video_id)
+        ]
+        if events:
+            self._append(events)
+
+    def replace(self, videos: List[dict], video_ids: Optional[List[str]] = None) -> None:
+        """Reset the quarantine to exactly these rows (used when a restart drops entries)."""
+        self._append([{"op": "replace", "videos": list(videos), "video_ids": list(video_ids or [])}])
+
+    def _compaction_due(self) -> bool:
+        if self._pending_events == 0:
+            return False
+        if self.compact_every > 0 and self._pending_events >= self.compact_every:
+            return True
+        if self.compact_max_age > 0 and self._oldest_pending is not None:
+            return time.time() - self._oldest_pending >= self.compact_max_age
+        return False
+
+    def _compact_unlocked(self) -> None:
+        self._refresh_unlocked()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self.snapshot(), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        with self.ledger_path.open("w", encoding="utf-8"):
+            pass
+        self._json_identity = self._stat_identity(self.path)
+        self.load_error = None
+        self._offset = 0
+        self._pending_events = 0
+        self._oldest_pending = None
+
+    def compact(self, force: bool = False) -> bool:
+        """Fold the ledger into the JSON file. Returns False when there was nothing to fold."""
+        with self._locked(exclusive=True):
+            self._refresh_unlocked()
+            if not force and self._pending_events == 0:
+                return False
+            self._compact_unlocked()
+        return True
+
+
+_LEDGERS: Dict[Path, QuarantineLedger] = {}
+
+
+def quarantine_ledger_for(quarantine_path: Path) -> QuarantineLedger:
+    """Process-wide ledger for a quarantine file, refreshed (tail only) on every call."""
+    key = Path(quarantine_path).resolve()
+    ledger = _LEDGERS.get(key)
+    if ledger is None:
+        ledger = _LEDGERS[key] = QuarantineLedger(key)
+    return ledger.refresh()
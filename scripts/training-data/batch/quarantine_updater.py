@@ -3,7 +3,10 @@
 quarantine_updater.py — Merge validation failures into a quarantine file.
 
 Reads validator JSON output and extracts video IDs with error-severity issues.
-Merges them into the quarantine file (append-only, never removes).
+Merges them into the quarantine file (append-only, never removes) through the
+quarantine ledger (quarantine_ledger.py), so concurrent updaters never clobber each other.
+Updates only append to the ledger; --compact folds it into the JSON once a stage's
+validation is done, for readers that open the JSON directly.
 
 Usage:
   # Pipe cross-stage or chunk validation JSON into stdin:
@@ -15,6 +18,10 @@ Usage:
     --quarantine-file data/validation/quarantine/P001.1.json \
     --stage08-report data/08.DET.taxonomy-validation/P001.1.report.json
 
+  # Fold pending ledger events into the JSON:
+  python3 quarantine_updater.py \
+    --quarantine-file data/validation/quarantine/P001.1.json --compact
+
   # Parse stage 06b verdicts:
   python3 quarantine_updater.py \
     --quarantine-file data/validation/quarantine/P001.1.json \
@@ -29,6 +36,10 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+if str(Path(__file__).resolve().parents[1]) not in sys.path:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from batch.quarantine_ledger import QuarantineLedger  # noqa: E402
+
 VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
 
 
@@ -343,11 +354,18 @@ def main():
     parser.add_argument(
         "--manifest", help="Path to manifest (required with --stage06b-dir)"
     )
+    parser.add_argument(
+        "--compact", action="store_true", help="Fold pending ledger events into the JSON and exit"
+    )
     args = parser.parse_args()
 
     quarantine_path = Path(args.quarantine_file)
-    existing = load_quarantine(quarantine_path)
-    old_count = len(existing.get("quarantined_video_ids", []))
+    ledger = QuarantineLedger(quarantine_path).refresh()
+    if args.compact:
+        if ledger.compact():
+            print(f"[quarantine] Compacted ledger into {quarantine_path} (total: {len(ledger.video_ids)})")
+        sys.exit(0)
+    old_count = len(ledger.video_ids)
 
     new_ids: Set[str] = set()
     new_videos: List[dict] = []
@@ -375,20 +393,18 @@ def main():
         new_ids |= ids
         new_videos.extend(vids)
     else:
-        parser.error("Must specify --stage, --stage08-report, or --stage06b-dir")
+        parser.error("Must specify --stage, --stage08-report, --stage06b-dir, or --compact")
 
-    actually_new = new_ids - set(existing.get("quarantined_video_ids", []))
+    actually_new = new_ids - ledger.video_ids
     if not actually_new:
         print(f"[quarantine] No new videos to quarantine (total: {old_count})")
         sys.exit(0)
 
-    merged = merge_quarantine(existing, new_ids, new_videos)
-    quarantine_path.parent.mkdir(parents=True, exist_ok=True)
-    quarantine_path.write_text(
-        json.dumps(merged, indent=2) + "\n", encoding="utf-8"
-    )
+    # Append under the ledger lock; the JSON is rewritten only when compaction is due.
+    rows_by_id = {v.get("video_id", ""): v for v in new_videos if v.get("video_id", "")}
+    ledger.record_many([(vid, rows_by_id.get(vid)) for vid in sorted(new_ids)])
 
-    new_total = len(merged["quarantined_video_ids"])
+    new_total = len(ledger.video_ids)
     added = new_total - old_count
     print(
         f"[quarantine] Quarantined {added} new video(s): "
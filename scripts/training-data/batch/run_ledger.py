@@ -0,0 +1,318 @@
+"""
+SQLite run ledger: one row per pipeline-runner run and per (run, video, stage) execution.
+
+pipeline-runner records every stage it executes for a video: start/end, subprocess exit
+code, time spent queued for LLM capacity (stage caps, host budget, parked on a usage limit)
+or an EXT slot, how many times the stage was launched, the outcome, the gate that stopped
+the video (quarantine check or runtime failure class) and the artifacts the stage left.
+Status and throughput questions (batch-status, run-campaign plans) become indexed queries
+instead of artifact walks and stdout scraping.
+
+The ledger is an observer: artifacts on disk stay the source of truth, and a ledger that
+cannot be opened or written is switched off with one warning rather than failing a run.
+Concurrent runners share the file (WAL journal, busy timeout).
+
+Location: data/validation/run_ledger.sqlite, or $PIPELINE_RUN_LEDGER (off/0/none disables).
+
+Outcomes:
+  pass         stage exited 0 and every post-stage gate passed
+  quarantined  fail-closed quarantine at this stage (gate = check key)
+  failed       runtime failure, not quarantined (gate = claude_limit_exhausted,
+               llm_timeout_during_stage or llm_outage_during_stage)
+  error        the runner itself raised while the stage was in flight
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_LEDGER_PATH = REPO_ROOT / "data" / "validation" / "run_ledger.sqlite"
+LEDGER_ENV = "PIPELINE_RUN_LEDGER"
+LEDGER_SCHEMA_VERSION = 1
+OUTCOMES = ("pass", "quarantined", "failed", "error")
+_DISABLED_VALUES = {"off", "0", "none", "false"}
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id        TEXT PRIMARY KEY,
+    sub_batch_id  TEXT NOT NULL,
+    manifest      TEXT,
+    from_stage    TEXT,
+    to_stage      TEXT,
+    parallel      INTEGER,
+    video_count   INTEGER,
+    host          TEXT,
+    pid           INTEGER,
+    started_at    REAL NOT NULL,
+    finished_at   REAL,
+    exit_code     INTEGER,
+    passed        INTEGER,
+    failed        INTEGER,
+    quarantined   INTEGER
+);
+CREATE TABLE IF NOT EXISTS stage_runs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id        TEXT NOT NULL REFERENCES runs(run_id),
+    sub_batch_id  TEXT NOT NULL,
+    video_id      TEXT NOT NULL,
+    source        TEXT,
+    stage         TEXT NOT NULL,
+    llm           INTEGER NOT NULL DEFAULT 0,
+    started_at    REAL NOT NULL,
+    finished_at   REAL NOT NULL,
+    wait_seconds  REAL NOT NULL DEFAULT 0,
+    exec_seconds  REAL NOT NULL DEFAULT 0,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    exit_code     INTEGER,
+    outcome       TEXT NOT NULL,
+    gate          TEXT,
+    detail        TEXT,
+    artifacts     TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_by_sub_batch ON runs(sub_batch_id, started_at);
+CREATE INDEX IF NOT EXISTS stage_runs_by_video ON stage_runs(video_id, stage, id);
+CREATE INDEX IF NOT EXISTS stage_runs_by_sub_batch ON stage_runs(sub_batch_id, stage);
+CREATE INDEX IF NOT EXISTS stage_runs_by_run ON stage_runs(run_id);
+"""
+
+
+def resolve_ledger_path(value: Optional[str] = None) -> Optional[Path]:
+    """Ledger file from a flag value or $PIPELINE_RUN_LEDGER; None when disabled."""
+    raw = value if value is not None else os.environ.get(LEDGER_ENV)
+    if raw is None or not raw.strip():
+        return DEFAULT_LEDGER_PATH
+    if raw.strip().lower() in _DISABLED_VALUES:
+        return None
+    path = Path(raw.strip()).expanduser()
+    return path if path.is_absolute() else REPO_ROOT / path
+
+
+def _chunks(values: Sequence[str]) -> Iterable[Sequence[str]]:
+    for i in range(0, len(values), _QUERY_CHUNK):
+        yield values[i : i + _QUERY_CHUNK]
+
+
+class RunLedger:
+    def __init__(self, path: Path, *, readonly: bool = False):
+        self.path = Path(path)
+        self.readonly = readonly
+        self._conn: Optional[sqlite3.Connection] = None
+        self.disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self.disabled:
+            return None
+        if self._conn is not None:
+            return self._conn
+        try:
+            if self.readonly:
+                if not self.path.exists():
+                    return None
+                conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=30)
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                if conn.execute("PRAGMA user_version").fetchone()[0] < LEDGER_SCHEMA_VERSION:
+                    conn.executescript(_SCHEMA)
+                    conn.execute(f"PRAGMA user_version = {LEDGER_SCHEMA_VERSION}")
+            conn.row_factory = sqlite3.Row
+        except (sqlite3.Error, OSError) as exc:
+            self._disable(exc)
+            return None
+        self._conn = conn
+        return conn
+
+    def _disable(self, exc: BaseException) -> None:
+        if not self.disabled:
+            print(f"[run-ledger] WARNING: ledger disabled ({self.path}): {exc}", file=sys.stderr)
+        self.disabled = True
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+        self._conn = None
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Cursor]:
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            return conn.execute(sql, params)
+        except sqlite3.Error as exc:
+            if self.readonly:
+                # Older files or a missing table: answer "no data" instead of failing the caller.
+                return None
+            self._disable(exc)
+            return None
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ── Writes (pipeline-runner) ──────────────────────────────────────────
+
+    def start_run(
+        self,
+        sub_batch_id: str,
+        *,
+        manifest: Optional[str] = None,
+        from_stage: Optional[str] = None,
+        to_stage: Optional[str] = None,
+        parallel: Optional[int] = None,
+        video_count: Optional[int] = None,
+        started_at: Optional[float] = None,
+    ) -> str:
+        started_at = time.time() if started_at is None else started_at
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(started_at))
+        run_id = f"{sub_batch_id}-{stamp}-{os.getpid()}"
+        self._execute(
+            "INSERT OR REPLACE INTO runs (run_id, sub_batch_id, manifest, from_stage, to_stage, parallel, "
+            "video_count, host, pid, started_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id, sub_batch_id, manifest, from_stage, to_stage, parallel,
+                video_count, socket.gethostname(), os.getpid(), started_at,
+            ),
+        )
+        return run_id
+
+    def record_stage(
+        self,
+        run_id: str,
+        sub_batch_id: str,
+        *,
+        video_id: str,
+        source: Optional[str],
+        stage: str,
+        llm: bool,
+        started_at: float,
+        finished_at: float,
+        wait_seconds: float,
+        exec_seconds: float,
+        attempts: int,
+        exit_code: Optional[int],
+        outcome: str,
+        gate: Optional[str] = None,
+        detail: Optional[str] = None,
+        artifacts: Sequence[str] = (),
+    ) -> None:
+        if outcome not in OUTCOMES:
+            raise ValueError(f"unknown stage outcome {outcome!r}")
+        self._execute(
+            "INSERT INTO stage_runs (run_id, sub_batch_id, video_id, source, stage, llm, started_at, finished_at, "
+            "wait_seconds, exec_seconds, attempts, exit_code, outcome, gate, detail, artifacts) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id, sub_batch_id, video_id, source, stage, int(bool(llm)), started_at, finished_at,
+                round(max(0.0, wait_seconds), 3), round(max(0.0, exec_seconds), 3), attempts, exit_code,
+                outcome, gate, (detail or None) and detail[:500], json.dumps(list(artifacts)) if artifacts else None,
+            ),
+        )
+
+    def finish_run(
+        self,
+        run_id: str,
+        *,
+        exit_code: int,
+        passed: int,
+        failed: int,
+        quarantined: int,
+        finished_at: Optional[float] = None,
+    ) -> None:
+        self._execute(
+            "UPDATE runs SET finished_at = ?, exit_code = ?, passed = ?, failed = ?, quarantined = ? WHERE run_id = ?",
+            (time.time() if finished_at is None else finished_at, exit_code, passed, failed, quarantined, run_id),
+        )
+
+    # ── Reads (batch-status, run-campaign) ────────────────────────────────
+
+    def latest_stage_rows(self, video_ids: Iterable[str]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Most recent execution per (video_id, stage) for the given videos."""
+        ids = sorted({v for v in video_ids if v})
+        latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for chunk in _chunks(ids):
+            marks = ",".join("?" * len(chunk))
+            cur = self._execute(
+                "SELECT s.* FROM stage_runs s JOIN ("
+                f"  SELECT MAX(id) AS id FROM stage_runs WHERE video_id IN ({marks}) GROUP BY video_id, stage"
+                ") m ON s.id = m.id",
+                tuple(chunk),
+            )
+            if cur is None:
+                return {}
+            for row in cur.fetchall():
+                latest[(row["video_id"], row["stage"])] = dict(row)
+        return latest
+
+    def recorded_video_ids(self, video_ids: Iterable[str]) -> set:
+        """Which of the given videos have at least one recorded stage execution."""
+        ids = sorted({v for v in video_ids if v})
+        found: set = set()
+        for chunk in _chunks(ids):
+            marks = ",".join("?" * len(chunk))
+            cur = self._execute(f"SELECT DISTINCT video_id FROM stage_runs WHERE video_id IN ({marks})", tuple(chunk))
+            if cur is None:
+                return set()
+            found.update(row[0] for row in cur.fetchall())
+        return found
+
+    def sub_batch_ids(self, prefix: str = "") -> List[str]:
+        """Sub-batches with recorded runs; prefix "P001" matches P001 itself and P001.*."""
+        cur = self._execute("SELECT DISTINCT sub_batch_id FROM runs ORDER BY sub_batch_id")
+        ids = [row[0] for row in cur.fetchall()] if cur is not None else []
+        if not prefix:
+            return ids
+        return [sid for sid in ids if sid == prefix or sid.startswith(prefix + ".")]
+
+    def stage_throughput(
+        self, sub_batch_ids: Optional[Sequence[str]] = None, since: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Per-stage execution counts, outcomes, run time and queue wait."""
+        where: List[str] = []
+        params: List[Any] = []
+        if sub_batch_ids:
+            where.append(f"sub_batch_id IN ({','.join('?' * len(sub_batch_ids))})")
+            params.extend(sub_batch_ids)
+        if since is not None:
+            where.append("started_at >= ?")
+            params.append(since)
+        cur = self._execute(
+            "SELECT stage, MAX(llm) AS llm, COUNT(*) AS executions, "
+            "SUM(outcome = 'pass') AS passed, SUM(outcome = 'quarantined') AS quarantined, "
+            "SUM(outcome IN ('failed', 'error')) AS failed, SUM(attempts) AS attempts, "
+            "AVG(exec_seconds) AS exec_avg, MAX(exec_seconds) AS exec_max, SUM(exec_seconds) AS exec_total, "
+            "AVG(wait_seconds) AS wait_avg, MAX(wait_seconds) AS wait_max, SUM(wait_seconds) AS wait_total "
+            f"FROM stage_runs {'WHERE ' + ' AND '.join(where) if where else ''} GROUP BY stage ORDER BY stage",
+            tuple(params),
+        )
+        return [dict(row) for row in cur.fetchall()] if cur is not None else []
+
+    def run_totals(self, sub_batch_ids: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Finished runs, videos passed and wall time, for videos/hour estimates."""
+        where = "WHERE finished_at IS NOT NULL"
+        params: Tuple[Any, ...] = ()
+        if sub_batch_ids:
+            where += f" AND sub_batch_id IN ({','.join('?' * len(sub_batch_ids))})"
+            params = tuple(sub_batch_ids)
+        cur = self._execute(
+            "SELECT COUNT(*) AS runs, COALESCE(SUM(passed), 0) AS passed, COALESCE(SUM(quarantined), 0) AS quarantined, "
+            f"COALESCE(SUM(failed), 0) AS failed, COALESCE(SUM(finished_at - started_at), 0) AS wall_seconds FROM runs {where}",
+            params,
+        )
+        row = cur.fetchone() if cur is not None else None
+        totals = dict(row) if row is not None else {"runs": 0, "passed": 0, "quarantined": 0, "failed": 0, "wall_seconds": 0.0}
+        wall = float(totals.get("wall_seconds") or 0.0)
+        totals["videos_per_hour"] = round(totals["passed"] * 3600.0 / wall, 2) if wall > 0 else None
+        return totals
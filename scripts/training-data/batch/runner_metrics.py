@@ -0,0 +1,225 @@
+"""
+Prometheus text-format metrics for a live pipeline-runner run.
+
+pipeline-runner keeps one RunnerMetrics per run and exports it with --metrics-textfile
+(rewritten atomically every --metrics-interval seconds, for node_exporter's textfile
+collector) and/or --metrics-port (GET /metrics on 127.0.0.1). No client library needed.
+
+Counters and histograms are fed as stages finish; gauges (videos per state, videos per
+stage and phase, LLM park state) are read from the runner's live state at each render.
+
+  pipeline_runner_videos{state}                          gauge: pending/running/done/failed/quarantined
+  pipeline_runner_stage_videos{stage,phase}              gauge: queued / running / parked per stage
+  pipeline_runner_stage_executions_total{stage,outcome}  pass / quarantined / failed / error
+  pipeline_runner_quarantines_total{stage,check}
+  pipeline_runner_stage_duration_seconds{stage}          histogram: subprocess run time
+  pipeline_runner_stage_wait_seconds{stage}              histogram: queued for LLM capacity / EXT slot
+  pipeline_runner_llm_attempts_total{stage,outcome}      stage subprocess launches: ok / timeout / limit / error
+  pipeline_runner_llm_parse_failures_total{stage}        "JSON parse error"-style lines in LLM stage output
+  pipeline_runner_llm_parked, pipeline_runner_llm_parks_total
+
+LLM outcomes are per stage subprocess: individual Claude calls happen inside the stage
+scripts, so the runner only sees their exit code, limit/timeout markers and log lines.
+Every sample carries a sub_batch label so concurrent runners can share one collector.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+DURATION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0)
+WAIT_BUCKETS = (0.1, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 1800.0, 3600.0)
+PARSE_FAILURE_RE = re.compile(r"parse(?:/schema)? (?:error|failed|failure)|returned invalid json", re.IGNORECASE)
+
+METRICS: Dict[str, Tuple[str, str]] = {
+    "pipeline_runner_start_time_seconds": ("gauge", "Unix time the run started."),
+    "pipeline_runner_videos": ("gauge", "Videos in the run by state."),
+    "pipeline_runner_stage_videos": ("gauge", "Videos currently at a stage, by phase (queued, running, parked)."),
+    "pipeline_runner_stage_executions_total": ("counter", "Finished stage executions by outcome."),
+    "pipeline_runner_quarantines_total": ("counter", "Quarantines by stage and check."),
+    "pipeline_runner_stage_duration_seconds": ("histogram", "Stage subprocess run time per execution."),
+    "pipeline_runner_stage_wait_seconds": ("histogram", "Time an execution queued for LLM capacity or an EXT slot."),
+    "pipeline_runner_llm_attempts_total": ("counter", "LLM stage subprocess launches by outcome."),
+    "pipeline_runner_llm_parse_failures_total": ("counter", "Response parse failures reported by LLM stages."),
+    "pipeline_runner_llm_parked": ("gauge", "1 while LLM stages are parked on a Claude usage limit."),
+    "pipeline_runner_llm_parks_total": ("counter", "Times LLM stages were parked on a Claude usage limit."),
+}
+_BUCKETS = {
+    "pipeline_runner_stage_duration_seconds": DURATION_BUCKETS,
+    "pipeline_runner_stage_wait_seconds": WAIT_BUCKETS,
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class RunnerMetrics:
+    def __init__(self, sub_batch_id: str, collect: Optional[Callable[[], Iterable[Sample]]] = None):
+        self.sub_batch_id = sub_batch_id
+        self.started_at = time.time()
+        self._collect = collect
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], List[float]] = {}
+
+    def inc(self, name: str, labels: Dict[str, str], value: float = 1.0) -> None:
+        key = (name, tuple(labels.items()))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        """Histogram observation; the row is per-bucket counts followed by sum and count."""
+        buckets = _BUCKETS[name]
+        key = (name, tuple(labels.items()))
+        with self._lock:
+            row = self._histograms.setdefault(key, [0.0] * (len(buckets) + 2))
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def observe_stage(
+        self,
+        stage: str,
+        outcome: str,
+        check: Optional[str],
+        exec_seconds: float,
+        wait_seconds: Optional[float],
+        attempts: int,
+    ) -> None:
+        """One finished (video, stage) execution."""
+        self.inc("pipeline_runner_stage_executions_total", {"stage": stage, "outcome": outcome})
+        if outcome == "quarantined":
+            self.inc("pipeline_runner_quarantines_total", {"stage": stage, "check": check or "unknown"})
+        if attempts:
+            self.observe("pipeline_runner_stage_duration_seconds", {"stage": stage}, exec_seconds)
+        if wait_seconds is not None:
+            self.observe("pipeline_runner_stage_wait_seconds", {"stage": stage}, wait_seconds)
+
+    def observe_llm_attempt(self, stage: str, rc: int, runtime_marker: Optional[str]) -> None:
+        outcome = "ok" if rc == 0 else (runtime_marker or "error")
+        self.inc("pipeline_runner_llm_attempts_total", {"stage": stage, "outcome": outcome})
+
+    def llm_line_observer(self, stage: str) -> Callable[[str], None]:
+        """Per-line callback for an LLM stage's output that counts parse failures."""
+
+        def observe_line(text: str) -> None:
+            if PARSE_FAILURE_RE.search(text):
+                self.inc("pipeline_runner_llm_parse_failures_total", {"stage": stage})
+
+        return observe_line
+
+    def _samples(self) -> Dict[str, List[Tuple[str, Dict[str, str], float]]]:
+        """Samples grouped by metric family: (sample name, labels, value)."""
+        base = {"sub_batch": self.sub_batch_id}
+        families: Dict[str, List[Tuple[str, Dict[str, str], float]]] = {name: [] for name in METRICS}
+        families["pipeline_runner_start_time_seconds"].append(
+            ("pipeline_runner_start_time_seconds", base, self.started_at)
+        )
+        if self._collect is not None:
+            for name, labels, value in self._collect():
+                families[name].append((name, {**base, **labels}, value))
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                families[name].append((name, {**base, **dict(labels)}, value))
+            for (name, labels), row in sorted(self._histograms.items()):
+                labels_dict = {**base, **dict(labels)}
+                for bound, count in zip(_BUCKETS[name], row):
+                    families[name].append((f"{name}_bucket", {**labels_dict, "le": _format_value(bound)}, count))
+                families[name].append((f"{name}_bucket", {**labels_dict, "le": "+Inf"}, row[-1]))
+                families[name].append((f"{name}_sum", labels_dict, row[-2]))
+                families[name].append((f"{name}_count", labels_dict, row[-1]))
+        return families
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for name, samples in self._samples().items():
+            if not samples:
+                continue
+            kind, help_text = METRICS[name]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path) -> None:
+        """Atomic rewrite, so a collector never reads a half-written file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(self.render())
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
+def serve_metrics(metrics: RunnerMetrics, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve GET /metrics from a daemon thread; call .shutdown() when the run ends."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:  # noqa: A002 - keep scrapes out of the run log
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="runner-metrics", daemon=True).start()
+    return server
+
+
+def stage_phase_samples(progress_values: Iterable[str], stage_keys: Sequence[str]) -> List[Sample]:
+    """pipeline_runner_stage_videos from pipeline-runner's progress strings ("06b(wait)", "02(gpu)", "06c")."""
+    counts = {(key, phase): 0 for key in stage_keys for phase in ("queued", "running", "parked")}
+    for value in progress_values:
+        stage, _, suffix = value.partition("(")
+        if stage not in stage_keys:
+            continue
+        suffix = suffix.rstrip(")")
+        phase = "queued" if suffix == "wait" else "parked" if suffix == "parked" else "running"
+        counts[(stage, phase)] += 1
+    return [
+        ("pipeline_runner_stage_videos", {"stage": stage, "phase": phase}, count)
+        for (stage, phase), count in counts.items()
+    ]
+
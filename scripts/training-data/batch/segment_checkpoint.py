@@ -0,0 +1,358 @@
+"""
+Partial-result checkpoints for long EXT stage runs (02 transcription, 03 alignment).
+
+A checkpoint sits next to the stage output as <name>.full.partial.json and holds the
+segments committed so far, plus a fingerprint of the inputs/settings that produced them.
+A resumed run only trusts a checkpoint whose fingerprint matches exactly; anything else is
+discarded. The final output is always written by the stage itself, after which the
+checkpoint is cleared, so a stitched run produces the same .full.json shape as a single pass.
+
+Checkpoint format:
+  {
+    "version": 1,
+    "kind": "transcribe" | "align",
+    "fingerprint": {...},
+    "committed_until_sec": 4812.35,   # end of the last committed segment
+    "units_done": 12,                 # stage-defined progress unit (e.g. align batches)
+    "segments": [...],
+    "extra": {...},                   # stage-defined resume state
+    "updated_at": "2026-01-01T00:00:00Z"
+  }
+
+The same module holds the per-segment content cache used for incremental re-runs of 03/04:
+the stage output carries {"input_hashes": [...], "segment_sources": [...]} under a cache key,
+mapping every output segment back to the input segment it came from. A re-run re-processes
+only input segments whose content hash is new and splices the cached outputs for the rest.
+
+WindowCheckpoint covers Stage 07's multi-window videos: each window's raw Claude response is
+stored under a hash of the exact prompt that produced it, so a retry after a failed window
+only re-issues windows whose prompt has no stored response. It lives next to the output as
+<name>.enriched.windows.partial.json and is dropped once the video's output is written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CHECKPOINT_VERSION = 1
+SEGMENT_CACHE_VERSION = 1
+WINDOW_CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path_for(out_json: Path) -> Path:
+    """<name>.full.json -> <name>.full.partial.json (never matches the *.full.json globs)."""
+    name = out_json.name
+    stem = name[: -len(".json")] if name.endswith(".json") else name
+    return out_json.with_name(f"{stem}.partial.json")
+
+
+def file_fingerprint(path: Path) -> Dict[str, Any]:
+    """Cheap identity for an input file: name, size and mtime."""
+    try:
+        st = path.stat()
+    except OSError:
+        return {"name": path.name, "size": None, "mtime_ns": None}
+    return {"name": path.name, "size": int(st.st_size), "mtime_ns": int(st.st_mtime_ns)}
+
+
+class SegmentCheckpoint:
+    """Accumulates committed segments and periodically persists them atomically."""
+
+    def __init__(
+        self,
+        path: Path,
+        kind: str,
+        fingerprint: Dict[str, Any],
+        flush_interval_sec: float = 60.0,
+    ):
+        self.path = Path(path)
+        self.kind = kind
+        self.fingerprint = fingerprint
+        self.flush_interval_sec = float(flush_interval_sec)
+        self.segments: List[Dict[str, Any]] = []
+        self.committed_until_sec = 0.0
+        self.units_done = 0
+        self.extra: Dict[str, Any] = {}
+        self.resumed = False
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def load(self) -> bool:
+        """Adopt an on-disk checkpoint if it matches this run; discard it otherwise."""
+        if not self.path.exists():
+            return False
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            self.clear()
+            return False
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != CHECKPOINT_VERSION
+            or payload.get("kind") != self.kind
+            or payload.get("fingerprint") != self.fingerprint
+            or not isinstance(payload.get("segments"), list)
+        ):
+            self.clear()
+            return False
+        self.segments = list(payload["segments"])
+        self.committed_until_sec = float(payload.get("committed_until_sec", 0.0) or 0.0)
+        self.units_done = int(payload.get("units_done", 0) or 0)
+        extra = payload.get("extra")
+        self.extra = dict(extra) if isinstance(extra, dict) else {}
+        self.resumed = True
+        return True
+
+    def commit(
+        self,
+        segments: List[Dict[str, Any]],
+        committed_until_sec: Optional[float] = None,
+        units_done: Optional[int] = None,
+    ) -> None:
+        """Record finished segments. committed_until_sec defaults to the last segment end."""
+        if segments:
+            self.segments.extend(segments)
+            if committed_until_sec is None:
+                try:
+                    committed_until_sec = float(segments[-1].get("end", 0.0))
+                except (TypeError, ValueError):
+                    committed_until_sec = None
+        if committed_until_sec is not None:
+            self.committed_until_sec = max(self.committed_until_sec, float(committed_until_sec))
+        if units_done is not None:
+            self.units_done = int(units_done)
+        self._dirty = True
+
+    def maybe_flush(self) -> bool:
+        if self.flush_interval_sec <= 0 or not self._dirty:
+            return False
+        if time.monotonic() - self._last_flush < self.flush_interval_sec:
+            return False
+        self.flush()
+        return True
+
+    def flush(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "kind": self.kind,
+            "fingerprint": self.fingerprint,
+            "committed_until_sec": round(self.committed_until_sec, 3),
+            "units_done": self.units_done,
+            "segments": self.segments,
+            "extra": self.extra,
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def reset(self) -> None:
+        """Forget committed progress (e.g. after an aborted decode) and drop the file."""
+        self.segments = []
+        self.committed_until_sec = 0.0
+        self.units_done = 0
+        self.extra = {}
+        self.resumed = False
+        self._dirty = False
+        self.clear()
+
+    def clear(self) -> None:
+        for path in (self.path, self.path.with_name(self.path.name + ".tmp")):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                pass
+
+
+# --------------------------
+# Window response checkpoints
+# --------------------------
+
+def window_checkpoint_path_for(out_json: Path) -> Path:
+    """<name>.enriched.json -> <name>.enriched.windows.partial.json."""
+    name = out_json.name
+    stem = name[: -len(".json")] if name.endswith(".json") else name
+    return out_json.with_name(f"{stem}.windows.partial.json")
+
+
+def window_prompt_hash(prompt: str) -> str:
+    """Key for one window call: the prompt text covers window content, context and allowlists."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:24]
+
+
+class WindowCheckpoint:
+    """Completed window responses for one video, written after every successful window."""
+
+    def __init__(self, path: Path, fingerprint: Dict[str, Any]):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.windows: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> int:
+        """Adopt matching stored windows; returns how many are available for reuse."""
+        if not self.path.exists():
+            return 0
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            self.clear()
+            return 0
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != WINDOW_CHECKPOINT_VERSION
+            or payload.get("fingerprint") != self.fingerprint
+            or not isinstance(payload.get("windows"), dict)
+        ):
+            self.clear()
+            return 0
+        self.windows = {
+            key: row
+            for key, row in payload["windows"].items()
+            if isinstance(row, dict) and isinstance(row.get("response"), str) and row["response"]
+        }
+        return len(self.windows)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.windows.get(key)
+
+    def record(self, key: str, window_index: int, response: str, elapsed_seconds: float) -> None:
+        self.windows[key] = {
+            "window_index": int(window_index),
+            "response": response,
+            "elapsed_seconds": round(float(elapsed_seconds), 3),
+        }
+        self.flush()
+
+    def flush(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": WINDOW_CHECKPOINT_VERSION,
+            "fingerprint": self.fingerprint,
+            "windows": self.windows,
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        self.windows = {}
+        for path in (self.path, self.path.with_name(self.path.name + ".tmp")):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+# --------------------------
+# Segment content cache
+# --------------------------
+
+def segment_content_hash(seg: Dict[str, Any], include_words: bool = False) -> str:
+    """Hash of a segment's text + start/end (and word timings when include_words)."""
+    try:
+        start = round(float(seg.get("start", 0.0)), 3)
+        end = round(float(seg.get("end", 0.0)), 3)
+    except (TypeError, ValueError):
+        start, end = None, None
+    key: List[Any] = [str(seg.get("text", "") or "").strip(), start, end]
+    if include_words:
+        words = seg.get("words") if isinstance(seg.get("words"), list) else []
+        key.append([
+            [str(w.get("word", "")), w.get("start"), w.get("end")]
+            for w in words if isinstance(w, dict)
+        ])
+    else:
+        # Wordless segments are filtered before alignment, so presence still matters.
+        key.append(bool(seg.get("words")))
+    blob = json.dumps(key, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def assign_output_sources(
+    inputs: List[Dict[str, Any]],
+    outputs: List[Dict[str, Any]],
+) -> List[int]:
+    """Index into inputs for each output segment.
+
+    outputs must be in processing order (before any re-sort), where every input expands to
+    zero or more consecutive outputs starting at or after its own start. An output belongs to
+    the last input whose start it has reached.
+    """
+    starts: List[float] = []
+    for seg in inputs:
+        try:
+            starts.append(float(seg.get("start", 0.0)))
+        except (TypeError, ValueError):
+            starts.append(starts[-1] if starts else 0.0)
+    sources: List[int] = []
+    ptr = 0
+    for seg in outputs:
+        try:
+            out_start = float(seg.get("start", 0.0))
+        except (TypeError, ValueError):
+            out_start = starts[ptr] if starts else 0.0
+        while ptr + 1 < len(starts) and out_start >= starts[ptr + 1]:
+            ptr += 1
+        sources.append(ptr)
+    return sources
+
+
+def build_segment_cache(
+    input_hashes: List[str],
+    segment_sources: List[int],
+    meta: Dict[str, Any],
+) -> Dict[str, Any]:
+    cache: Dict[str, Any] = {"version": SEGMENT_CACHE_VERSION}
+    cache.update(meta)
+    cache["input_hashes"] = list(input_hashes)
+    cache["segment_sources"] = list(segment_sources)
+    return cache
+
+
+def load_segment_cache(
+    prev_payload: Any,
+    cache_key: str,
+    meta: Dict[str, Any],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Map input hash -> cached output segments from a previous stage output.
+
+    Returns {} when there is no cache or any meta field (audio, model settings) differs.
+    Hashes that occurred more than once in the previous input are left out, since their
+    outputs cannot be split between the duplicates.
+    """
+    if not isinstance(prev_payload, dict):
+        return {}
+    cache = prev_payload.get(cache_key)
+    segments = prev_payload.get("segments")
+    if not isinstance(cache, dict) or not isinstance(segments, list):
+        return {}
+    if cache.get("version") != SEGMENT_CACHE_VERSION:
+        return {}
+    if any(cache.get(k) != v for k, v in meta.items()):
+        return {}
+    hashes = cache.get("input_hashes")
+    sources = cache.get("segment_sources")
+    if not isinstance(hashes, list) or not isinstance(sources, list) or len(sources) != len(segments):
+        return {}
+    counts: Dict[str, int] = {}
+    for h in hashes:
+        counts[h] = counts.get(h, 0) + 1
+    reuse: Dict[str, List[Dict[str, Any]]] = {h: [] for h, n in counts.items() if n == 1}
+    for seg, src in zip(segments, sources):
+        if not isinstance(src, int) or not 0 <= src < len(hashes):
+            return {}
+        bucket = reuse.get(hashes[src])
+        if bucket is not None:
+            bucket.append(seg)
+    return reuse
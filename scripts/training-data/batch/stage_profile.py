@@ -0,0 +1,215 @@
+"""
+Opt-in cProfile / tracemalloc hooks shared by the stage scripts (02-08) and validators.
+
+Each script calls enable_stage_profiling("<stage>") first thing in its __main__ block. The
+call takes its own flags out of sys.argv before the script's argparse sees them:
+
+  --profile {cpu,mem,both}   cpu: cProfile .pstats; mem: tracemalloc top-N allocation sites
+  --profile-dir DIR          default: data/validation/profiles
+  --profile-top N            allocation sites kept per snapshot (default: 50)
+
+PIPELINE_PROFILE / PIPELINE_PROFILE_DIR set the same thing from the environment, so a whole
+shell session or campaign can be profiled without touching commands. pipeline-runner passes
+the flags per stage with --profile-stage STAGE=MODE.
+
+Profiles are written at interpreter exit (sys.exit included) to
+
+  DIR/<stage>/<label>.<UTC timestamp>.<pid>.profile.json   run metadata, mem snapshot
+  DIR/<stage>/<label>.<UTC timestamp>.<pid>.pstats         cpu mode only
+
+where <label> is the video id when the run covers exactly one video (pipeline-runner's
+per-video manifests), else the manifest name. validation/profile_summary.py aggregates them.
+Only the main thread is profiled; worker processes are not.
+"""
+
+from __future__ import annotations
+
+import atexit
+import cProfile
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_PROFILE_DIR = REPO_ROOT / "data" / "validation" / "profiles"
+PROFILE_MODES = ("cpu", "mem", "both")
+PROFILE_ENV = "PIPELINE_PROFILE"
+PROFILE_DIR_ENV = "PIPELINE_PROFILE_DIR"
+DEFAULT_TOP_N = 50
+
+_VIDEO_ID_RE = re.compile(r"\[([A-Za-z0-9_-]{11})\]")
+_LABEL_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _pop_profile_args(argv: List[str]) -> Dict[str, Optional[str]]:
+    """Remove --profile/--profile-dir/--profile-top (and their values) from argv in place."""
+    found: Dict[str, Optional[str]] = {"profile": None, "profile_dir": None, "profile_top": None}
+    flags = {"--profile": "profile", "--profile-dir": "profile_dir", "--profile-top": "profile_top"}
+    rest: List[str] = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--":
+            rest.extend(argv[i:])
+            break
+        name, sep, value = arg.partition("=")
+        if name in flags and sep:
+            found[flags[name]] = value
+        elif arg in flags and i + 1 < len(argv):
+            found[flags[arg]] = argv[i + 1]
+            i += 1
+        else:
+            rest.append(arg)
+        i += 1
+    argv[:] = rest
+    return found
+
+
+def profile_label(argv: List[str]) -> str:
+    """Video id when argv (or its --manifest) names exactly one video, else the manifest name."""
+    ids = {m.group(1) for arg in argv for m in _VIDEO_ID_RE.finditer(arg)}
+    manifest: Optional[Path] = None
+    for i, arg in enumerate(argv):
+        if arg == "--manifest" and i + 1 < len(argv):
+            manifest = Path(argv[i + 1])
+        elif arg.startswith("--manifest="):
+            manifest = Path(arg.split("=", 1)[1])
+    if not ids and manifest is not None:
+        try:
+            ids = set(_VIDEO_ID_RE.findall(manifest.read_text(encoding="utf-8")))
+        except OSError:
+            pass
+    if len(ids) == 1:
+        return next(iter(ids))
+    if manifest is not None:
+        return _LABEL_UNSAFE_RE.sub("_", manifest.stem) or "run"
+    return "run"
+
+
+class StageProfiler:
+    def __init__(
+        self,
+        stage: str,
+        mode: str,
+        out_dir: Path,
+        label: str,
+        top_n: int = DEFAULT_TOP_N,
+        argv: Optional[List[str]] = None,
+    ):
+        self.stage = stage
+        self.mode = mode
+        self.out_dir = out_dir
+        self.label = label
+        self.top_n = max(1, top_n)
+        self.argv = list(sys.argv if argv is None else argv)
+        self._cpu: Optional[cProfile.Profile] = None
+        self._started_wall = 0.0
+        self._started = 0.0
+        self._stopped = False
+
+    @property
+    def cpu(self) -> bool:
+        return self.mode in ("cpu", "both")
+
+    @property
+    def mem(self) -> bool:
+        return self.mode in ("mem", "both")
+
+    def start(self) -> None:
+        self._started_wall = time.time()
+        self._started = time.perf_counter()
+        if self.mem and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.cpu:
+            self._cpu = cProfile.Profile()
+            self._cpu.enable()
+
+    def _base_path(self) -> Path:
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(self._started_wall))
+        return self.out_dir / self.stage / f"{self.label}.{stamp}.{os.getpid()}"
+
+    def _memory_snapshot(self) -> Dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        )).statistics("lineno")
+        top = [
+            {
+                "file": stat.traceback[0].filename,
+                "line": stat.traceback[0].lineno,
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in stats[: self.top_n]
+        ]
+        return {"current_bytes": current, "peak_bytes": peak, "top": top}
+
+    def stop(self) -> Optional[Path]:
+        """Stop collecting and write the profile; returns the .profile.json path."""
+        if self._stopped:
+            return None
+        self._stopped = True
+        if self._cpu is not None:
+            self._cpu.disable()
+        base = self._base_path()
+        base.parent.mkdir(parents=True, exist_ok=True)
+        meta: Dict[str, Any] = {
+            "stage": self.stage,
+            "label": self.label,
+            "mode": self.mode,
+            "argv": self.argv,
+            "pid": os.getpid(),
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._started_wall)),
+            "wall_seconds": round(time.perf_counter() - self._started, 3),
+        }
+        # Snapshot before dumping the cpu profile so its own buffers are not reported.
+        if self.mem and tracemalloc.is_tracing():
+            meta["memory"] = self._memory_snapshot()
+            tracemalloc.stop()
+        if self._cpu is not None:
+            pstats_path = base.with_name(base.name + ".pstats")
+            self._cpu.dump_stats(str(pstats_path))
+            meta["pstats"] = pstats_path.name
+        out = base.with_name(base.name + ".profile.json")
+        out.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        return out
+
+    def _stop_at_exit(self) -> None:
+        try:
+            path = self.stop()
+        except Exception as exc:  # never turn a finished stage into a failed one
+            print(f"[profile] could not write {self.stage} profile: {exc}", file=sys.stderr)
+            return
+        if path is not None:
+            print(f"[profile] {self.stage} {self.mode} profile: {path}", file=sys.stderr)
+
+
+def enable_stage_profiling(stage: str, argv: Optional[List[str]] = None) -> Optional[StageProfiler]:
+    """Strip profile flags from argv (default sys.argv) and start profiling if requested."""
+    argv = sys.argv if argv is None else argv
+    args = argv[1:]
+    found = _pop_profile_args(args)
+    argv[1:] = args
+    mode = (found["profile"] or os.environ.get(PROFILE_ENV, "")).strip().lower()
+    if not mode:
+        return None
+    if mode not in PROFILE_MODES:
+        print(f"[profile] ignoring profile mode {mode!r} (expected one of {', '.join(PROFILE_MODES)})", file=sys.stderr)
+        return None
+    try:
+        top_n = int(found["profile_top"] or DEFAULT_TOP_N)
+    except ValueError:
+        top_n = DEFAULT_TOP_N
+    out_dir = Path(found["profile_dir"] or os.environ.get(PROFILE_DIR_ENV, "").strip() or DEFAULT_PROFILE_DIR)
+    profiler = StageProfiler(stage, mode, out_dir, profile_label(args), top_n, argv)
+    profiler.start()
+    atexit.register(profiler._stop_at_exit)
+    return profiler
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+scripts/training-data/batch/subbatch_status.py
+
+Per-sub-batch, per-stage contract completeness computed from manifests and one shared
+artifact scan.
+
+A video counts as done for a stage when some file under data/<stage dir>/ (symlinks
+followed) has the stage's pattern and a basename containing the video id. That is the
+same contract `sub-batch-pipeline --status` (show_sub_batch_status) checks with one
+`find` per video and stage. Here each stage directory is walked once per ArtifactIndex,
+so any number of sub-batches can be reported from the same scan.
+
+Consumers: sub-batch-pipeline show_sub_batch_status (via this CLI), batch-status,
+run-campaign read_sub_batch_status, validation/audit_subbatch_stage_reuse.py.
+
+Usage:
+  python3 subbatch_status.py P001.1            # same text as sub-batch-ops P001.1 --status
+  python3 subbatch_status.py P001.1 P001.2 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+def repo_root() -> Path:
+    return Path(__file__).resolve().parent.parent.parent.parent
+
+
+# Mirrors STAGE_DIRS / STAGE_PATTERNS / RUNNABLE_STAGES in sub-batch-pipeline.
+STAGE_DIRS: Dict[str, str] = {
+    "01": "01.download",
+    "02": "02.EXT.transcribe",
+    "03": "03.EXT.align",
+    "04": "04.EXT.diarize",
+    "05": "05.EXT.audio-features",
+    "06": "06.LLM.video-type",
+    "06b": "06b.LLM.verify",
+    "06c": "06c.DET.patched",
+    "06d": "06d.DET.sanitized",
+    "06e": "06e.LLM.quality-check",
+    "06f": "06f.DET.damage-map",
+    "06g": "06g.LLM.damage-adjudicator",
+    "06h": "06h.DET.confidence-propagation",
+    "07": "07.LLM.content",
+    "07b": "07b.LLM.enrichment-verify",
+    "08": "08.DET.taxonomy-validation",
+    "09": "09.EXT.chunks",
+}
+STAGE_PATTERNS: Dict[str, str] = {
+    "01": "*.wav",
+    "02": "*.full.json",
+    "03": "*.full.json",
+    "04": "*.full.json",
+    "05": "*.audio_features.json",
+    "06": "*.conversations.json",
+    "06b": "*.verification.json",
+    "06c": "*.conversations.json",
+    "06d": "*.conversations.json",
+    "06e": "*.quality-check.json",
+    "06f": "*.damage-map.json",
+    "06g": "*.damage-adjudication.json",
+    "06h": "*.confidence.report.json",
+    "07": "*.enriched.json",
+    "07b": "*.enrichment-verify.json",
+    "08": "*.report.json",
+    "09": "*.chunks.json",
+}
+RUNNABLE_STAGES: Tuple[str, ...] = ("06", "06b", "06c", "06d", "06e", "06f", "06g", "06h", "07", "07b", "08", "09")
+
+MANIFEST_VIDEO_ID_RE = re.compile(r"\[([a-zA-Z0-9_-]{11})\]")
+SUB_BATCH_RE = re.compile(r"^P(\d{3})\.(\d+)$")
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    source: str
+    folder: str
+    video_id: str
+
+
+def load_manifest_entries(manifest_path: Path) -> List[ManifestEntry]:
+    """Manifest rows in file order, parsed like show_sub_batch_status (duplicates kept)."""
+    entries: List[ManifestEntry] = []
+    for raw in manifest_path.read_text(encoding="utf-8").splitlines():
+        source, sep, folder = raw.partition("|")
+        if source.startswith("#") or not source:
+            continue
+        m = MANIFEST_VIDEO_ID_RE.search(folder.strip()) if sep else None
+        if m:
+            entries.append(ManifestEntry(source.strip(), folder.strip(), m.group(1)))
+    return entries
+
+
+class ArtifactIndex:
+    """Artifact basenames per stage, each stage directory walked at most once."""
+
+    def __init__(self, data_root: Optional[Path] = None):
+        self.data_root = data_root or (repo_root() / "data")
+        self._names: Dict[str, List[Tuple[str, str]]] = {}
+        self._hits: Dict[Tuple[str, int], Dict[str, List[Tuple[str, str]]]] = {}
+
+    def _scan(self, stage: str) -> List[Tuple[str, str]]:
+        """(source, relative path) for every pattern-matching file under the stage dir."""
+        names = self._names.get(stage)
+        if names is not None:
+            return names
+        names = []
+        stage_root = self.data_root / STAGE_DIRS[stage]
+        pattern = STAGE_PATTERNS[stage]
+        if stage_root.is_dir():
+            for dirpath, _, filenames in os.walk(stage_root, followlinks=True):
+                rel_dir = os.path.relpath(dirpath, stage_root)
+                source = "" if rel_dir == "." else rel_dir.split(os.sep, 1)[0]
+                for name in filenames:
+                    if fnmatch.fnmatchcase(name, pattern):
+                        names.append((source, name if rel_dir == "." else os.path.join(rel_dir, name)))
+        self._names[stage] = names
+        return names
+
+    def _hits_for_length(self, stage: str, id_len: int) -> Dict[str, List[Tuple[str, str]]]:
+        """Every id_len-long substring of each basename -> the files whose names contain it."""
+        key = (stage, id_len)
+        hits = self._hits.get(key)
+        if hits is not None:
+            return hits
+        hits = {}
+        for source, rel in self._scan(stage):
+            name = os.path.basename(rel)
+            seen: Set[str] = set()
+            for i in range(len(name) - id_len + 1):
+                token = name[i : i + id_len]
+                if token not in seen:
+                    seen.add(token)
+                    hits.setdefault(token, []).append((source, rel))
+        self._hits[key] = hits
+        return hits
+
+    def files_for(self, stage: str, video_id: str, source: Optional[str] = None) -> List[Path]:
+        """Stage artifacts whose basename contains video_id (optionally under data/<stage>/<source>/)."""
+        rows = self._hits_for_length(stage, len(video_id)).get(video_id, [])
+        stage_root = self.data_root / STAGE_DIRS[stage]
+        return [stage_root / rel for src, rel in rows if source is None or src == source]
+
+    def has(self, stage: str, video_id: str, source: Optional[str] = None) -> bool:
+        return bool(self.files_for(stage, video_id, source))
+
+
+@dataclass
+class StageCompletion:
+    stage: str
+    done: int
+    total: int
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return self.done == self.total
+
+    @property
+    def partial(self) -> bool:
+        return 0 < self.done < self.total
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "done": self.done,
+            "total": self.total,
+            "complete": self.complete,
+            "partial": self.partial,
+            "missing": list(self.missing),
+        }
+
+
+@dataclass
+class SubBatchStatus:
+    sub_batch_id: str
+    manifest_path: Path
+    total_videos: int
+    stages: Dict[str, StageCompletion]
+    status: str = "unknown"
+    current_stage: str = ""
+    note: str = ""
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "sub_batch_id": self.sub_batch_id,
+            "manifest_path": str(self.manifest_path),
+            "total_videos": self.total_videos,
+            "overall_status": self.status,
+            "current_stage": self.current_stage,
+            "note": self.note,
+            "stages": {code: s.to_dict() for code, s in self.stages.items()},
+        }
+
+
+def batches_dir() -> Path:
+    return repo_root() / "docs" / "pipeline" / "batches"
+
+
+def status_file_path(sub_batch_id: str, batches: Optional[Path] = None) -> Path:
+    """P001.3 -> docs/pipeline/batches/P001.status.json"""
+    return (batches or batches_dir()) / f"{sub_batch_id.rsplit('.', 1)[0]}.status.json"
+
+
+def read_status_row(sub_batch_id: str, batches: Optional[Path] = None) -> Dict[str, str]:
+    """status/current_stage/note recorded for the sub-batch in the batch status file."""
+    unknown = {"status": "unknown", "current_stage": "", "note": ""}
+    path = status_file_path(sub_batch_id, batches)
+    if not path.exists():
+        return unknown
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return unknown
+    sub_batches = payload.get("sub_batches") if isinstance(payload, dict) else None
+    if not isinstance(sub_batches, dict):
+        return unknown
+    row = sub_batches.get(sub_batch_id)
+    if not isinstance(row, dict):
+        return unknown
+    return {
+        "status": str(row.get("status", "unknown")),
+        "current_stage": str(row.get("current_stage", "")),
+        "note": str(row.get("note", "")),
+    }
+
+
+def running_sub_batches() -> Set[str]:
+    """Sub-batch ids with a live pipeline-runner process (one `ps` call for all of them)."""
+    try:
+        ps_out = subprocess.check_output(["ps", "-eo", "args"], text=True, stderr=subprocess.DEVNULL)
+    except Exception:
+        return set()
+    return set(re.findall(r"\bpipeline-runner\s+(P\d{3}\.\d+)\b", ps_out))
+
+
+def sub_batch_status(
+    sub_batch_id: str,
+    index: Optional[ArtifactIndex] = None,
+    *,
+    batches: Optional[Path] = None,
+    running: Optional[Set[str]] = None,
+    stages: Sequence[str] = RUNNABLE_STAGES,
+) -> SubBatchStatus:
+    """Completion of one sub-batch; pass a shared index when checking several."""
+    batches = batches or batches_dir()
+    index = index or ArtifactIndex()
+    manifest_path = batches / f"{sub_batch_id}.txt"
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Sub-batch manifest not found: {manifest_path}")
+    entries = load_manifest_entries(manifest_path)
+
+    completion: Dict[str, StageCompletion] = {}
+    for stage in stages:
+        done = 0
+        missing: List[str] = []
+        for entry in entries:
+            if index.has(stage, entry.video_id):
+                done += 1
+            else:
+                missing.append(entry.folder)
+        completion[stage] = StageCompletion(stage, done, len(entries), missing)
+
+    row = read_status_row(sub_batch_id, batches)
+    status = row["status"]
+    if status_file_path(sub_batch_id, batches).exists() and running is not None and sub_batch_id in running:
+        status = "in_progress"
+    return SubBatchStatus(
+        sub_batch_id=sub_batch_id,
+        manifest_path=manifest_path,
+        total_videos=len(entries),
+        stages=completion,
+        status=status,
+        current_stage=row["current_stage"],
+        note=row["note"],
+    )
+
+
+def sub_batches_status(
+    sub_batch_ids: Iterable[str],
+    *,
+    data_root: Optional[Path] = None,
+    batches: Optional[Path] = None,
+    detect_running: bool = True,
+    stages: Sequence[str] = RUNNABLE_STAGES,
+) -> Dict[str, SubBatchStatus]:
+    """Completion for many sub-batches from a single artifact scan."""
+    index = ArtifactIndex(data_root)
+    running = running_sub_batches() if detect_running else None
+    return {
+        sid: sub_batch_status(sid, index, batches=batches, running=running, stages=stages)
+        for sid in sub_batch_ids
+    }
+
+
+def format_status_text(status: SubBatchStatus) -> str:
+    """Text block printed by `sub-batch-ops <id> --status`."""
+    lines = ["", f"=== Sub-batch {status.sub_batch_id} Status ({status.total_videos} videos) ===", ""]
+    for stage, s in status.stages.items():
+        icon = "⬜"
+        if s.done == s.total:
+            icon = "✅"
+        elif s.done > 0:
+            icon = "🔶"
+        lines.append(f"  {icon} Stage {stage}: {s.done}/{s.total}")
+        if s.done > 0 and s.done < s.total and len(s.missing) <= 5:
+            lines.extend(f"      missing: {m}" for m in s.missing)
+        elif len(s.missing) > 5:
+            lines.append(f"      ({len(s.missing)} missing)")
+    lines.append("")
+    if status_file_path(status.sub_batch_id, status.manifest_path.parent).exists():
+        lines.append(f"Overall status: {status.status}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Sub-batch per-stage completion from one artifact scan")
+    parser.add_argument("sub_batch_ids", nargs="+", help="Sub-batch ids (e.g. P001.1)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON keyed by sub-batch id")
+    args = parser.parse_args(argv)
+
+    for sid in args.sub_batch_ids:
+        if not SUB_BATCH_RE.fullmatch(sid):
+            print(f"[subbatch-status] ERROR: Invalid sub-batch ID: {sid}", file=sys.stderr)
+            return 2
+    try:
+        statuses = sub_batches_status(args.sub_batch_ids)
+    except FileNotFoundError as exc:
+        print(f"[subbatch-status] ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps({sid: s.to_dict() for sid, s in statuses.items()}, indent=2))
+    else:
+        for s in statuses.values():
+            print(format_status_text(s))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,7 +3,7 @@
 Audit sub-batches for reusable stage outputs before rerunning LLM stages.
 
 This script combines:
-  1) strict contract completeness from `sub-batch-ops --status`
+  1) strict contract completeness (batch/subbatch_status.py, one artifact scan for the range)
   2) stage file metadata (pipeline version / prompt version / model)
 
 Primary use case: map which sub-batches can reuse later stages vs need reruns.
@@ -15,7 +15,6 @@ import argparse
 import json
 import os
 import re
-import subprocess
 import sys
 from collections import Counter
 from dataclasses import dataclass
@@ -34,8 +33,9 @@ try:
 except Exception:  # pragma: no cover
     load_manifest = None  # type: ignore
 
+from batch.subbatch_status import SubBatchStatus, sub_batches_status  # noqa: E402
+
 
-STATUS_STAGE_RE = re.compile(r"Stage\s+([0-9]{2}[a-z]?):\s+(\d+)/(\d+)")
 SUBBATCH_RE = re.compile(r"^P(\d+)\.(\d+)$")
 VIDEO_ID_BRACKET_RE = re.compile(r"\[([A-Za-z0-9_-]{11})\]")
 CHUNKS_ID_RE = re.compile(r"([A-Za-z0-9_-]{11})\.chunks\.json$")
@@ -80,7 +80,7 @@ def parse_args() -> argparse.Namespace:
         "--status-timeout-seconds",
         type=int,
         default=60,
-        help="Timeout for each sub-batch status call",
+        help="Ignored; kept for compatibility (status is computed in-process)",
     )
     return ap.parse_args()
 
@@ -120,50 +120,17 @@ def read_manifest_video_ids(manifest_path: Path) -> List[str]:
     return sorted(set(ids))
 
 
-def parse_status_output(text: str) -> Dict[str, Any]:
-    stages: Dict[str, Dict[str, Any]] = {}
-    total_videos: Optional[int] = None
-    for line in text.splitlines():
-        if "Status (" in line and "videos" in line:
-            m = re.search(r"\((\d+)\s+videos\)", line)
-            if m:
-                total_videos = int(m.group(1))
-        m = STATUS_STAGE_RE.search(line)
-        if not m:
-            continue
-        code = m.group(1)
-        done = int(m.group(2))
-        total = int(m.group(3))
-        stages[code] = {
-            "done": done,
-            "total": total,
-            "complete": (done == total),
-            "partial": (0 < done < total),
-        }
-    overall = None
-    m_overall = re.search(r"Overall status:\s+(\S+)", text)
-    if m_overall:
-        overall = m_overall.group(1)
-    return {"total_videos": total_videos, "overall_status": overall, "stages": stages, "raw_text": text}
-
-
-def run_subbatch_status(sid: str, timeout_seconds: int) -> Dict[str, Any]:
-    cmd = [str(REPO_ROOT / "scripts" / "training-data" / "batch" / "sub-batch-ops"), sid, "--status"]
-    proc = subprocess.run(
-        cmd,
-        cwd=str(REPO_ROOT),
-        capture_output=True,
-        text=True,
-        timeout=timeout_seconds,
-    )
-    out = proc.stdout or ""
-    err = proc.stderr or ""
-    parsed = parse_status_output(out)
-    parsed["command"] = cmd
-    parsed["returncode"] = proc.returncode
-    if err.strip():
-        parsed["stderr"] = err
-    return parsed
+def subbatch_status_dict(status: SubBatchStatus) -> Dict[str, Any]:
+    """Shape one SubBatchStatus like the old parsed `sub-batch-ops --status` output."""
+    return {
+        "total_videos": status.total_videos,
+        "overall_status": status.status,
+        "stages": {
+            code: {"done": s.done, "total": s.total, "complete": s.complete, "partial": s.partial}
+            for code, s in status.stages.items()
+        },
+        "returncode": 0,
+    }
 
 
 def extract_video_id_from_path(path: Path) -> Optional[str]:
@@ -471,11 +438,13 @@ def main() -> int:
     for stage_def in STAGE_DEFS:
         stage_indexes[stage_def.code] = build_stage_index(stage_def)
 
+    statuses = sub_batches_status(subbatch_ids, batches=manifest_dir)
+
     results: List[Dict[str, Any]] = []
     for sid in subbatch_ids:
         manifest_path = manifest_dir / f"{sid}.txt"
         ids = read_manifest_video_ids(manifest_path)
-        status = run_subbatch_status(sid, args.status_timeout_seconds)
+        status = subbatch_status_dict(statuses[sid])
         total_videos = int(status.get("total_videos") or len(ids))
 
         stage_meta = {
@@ -14,8 +14,9 @@ Use:
   B) Report for all sources:
      python batch_report.py --all --batch-id R1
 
-  C) Compare against prior batches:
+  C) Compare against prior batches (all, or a rolling window of the last K):
      python batch_report.py --all --batch-id P001 --compare
+     python batch_report.py --all --batch-id P001 --compare --compare-window 5
 
   D) JSON output:
      python batch_report.py --all --batch-id R1 --json
@@ -27,16 +28,26 @@ Use:
 from __future__ import annotations
 
 import argparse
+import contextlib
 import hashlib
 import json
 import math
+import os
 import re
 import sys
 import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from statistics import median
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-posix fallback
+    fcntl = None
 
 LOG_PREFIX = "[batch-report]"
 
@@ -162,70 +173,78 @@ def _infer_source_from_stage07_path(p: str) -> Optional[str]:
     return None
 
 
+def _stage07_semantic_requests_for_file(
+    ef: Dict[str, Any],
+    preferred_source_by_vid: Optional[Dict[str, str]] = None,
+) -> Iterator[Tuple[Tuple[str, int], Dict[str, Any]]]:
+    """Yield ((video_id, conversation_id), request) for one Stage 07 file's approach conversations."""
+    vid = ef.get("video_id")
+    if not isinstance(vid, str) or not vid:
+        return
+
+    source = ef.get("source")
+    if isinstance(source, str):
+        src_clean = source.strip()
+        # Guard against malformed source metadata (observed in some legacy/root-flat
+        # artifacts where this field is accidentally set to a filename/path-ish value).
+        if (
+            not src_clean
+            or "/" in src_clean
+            or "\\" in src_clean
+            or ".audio.asr." in src_clean
+            or src_clean.endswith(".json")
+            or "[" in src_clean
+        ):
+            source = None
+        else:
+            source = src_clean
+    if not isinstance(source, str) or not source:
+        p = ef.get("_source_file")
+        if isinstance(p, str):
+            inferred = _infer_source_from_stage07_path(p)
+            if inferred:
+                source = inferred
+    if (not isinstance(source, str) or not source) and preferred_source_by_vid:
+        preferred = preferred_source_by_vid.get(vid)
+        if isinstance(preferred, str) and preferred.strip():
+            source = preferred.strip()
+    if not isinstance(source, str):
+        source = ""
+
+    segments = ef.get("segments", []) or []
+    conv_seg_ids: Dict[int, List[int]] = {}
+    for s in segments:
+        if not isinstance(s, dict):
+            continue
+        cid = s.get("conversation_id")
+        sid = s.get("id")
+        if isinstance(cid, int) and cid > 0 and isinstance(sid, int):
+            conv_seg_ids.setdefault(cid, []).append(sid)
+
+    for e in ef.get("enrichments", []) or []:
+        if not isinstance(e, dict) or e.get("type") != "approach":
+            continue
+        cid = e.get("conversation_id")
+        if not isinstance(cid, int) or cid <= 0:
+            continue
+        seg_ids = sorted(conv_seg_ids.get(cid, []))
+        yield (vid, cid), {
+            "video_id": vid,
+            "source": source,
+            "conversation_id": cid,
+            "enrichment": e,
+            "transcript_segments": seg_ids,
+        }
+
+
 def _build_stage07_semantic_request_index(
-    enriched_files: List[Dict[str, Any]],
+    enriched_files: Iterable[Dict[str, Any]],
     preferred_source_by_vid: Optional[Dict[str, str]] = None,
 ) -> Dict[Tuple[str, int], Dict[str, Any]]:
     """Build an index of the current Stage 07 "approach" conversations for fingerprint checks."""
     out: Dict[Tuple[str, int], Dict[str, Any]] = {}
     for ef in enriched_files:
-        vid = ef.get("video_id")
-        if not isinstance(vid, str) or not vid:
-            continue
-
-        source = ef.get("source")
-        if isinstance(source, str):
-            src_clean = source.strip()
-            # Guard against malformed source metadata (observed in some legacy/root-flat
-            # artifacts where this field is accidentally set to a filename/path-ish value).
-            if (
-                not src_clean
-                or "/" in src_clean
-                or "\\" in src_clean
-                or ".audio.asr." in src_clean
-                or src_clean.endswith(".json")
-                or "[" in src_clean
-            ):
-                source = None
-            else:
-                source = src_clean
-        if not isinstance(source, str) or not source:
-            p = ef.get("_source_file")
-            if isinstance(p, str):
-                inferred = _infer_source_from_stage07_path(p)
-                if inferred:
-                    source = inferred
-        if (not isinstance(source, str) or not source) and preferred_source_by_vid:
-            preferred = preferred_source_by_vid.get(vid)
-            if isinstance(preferred, str) and preferred.strip():
-                source = preferred.strip()
-        if not isinstance(source, str):
-            source = ""
-
-        segments = ef.get("segments", []) or []
-        conv_seg_ids: Dict[int, List[int]] = {}
-        for s in segments:
-            if not isinstance(s, dict):
-                continue
-            cid = s.get("conversation_id")
-            sid = s.get("id")
-            if isinstance(cid, int) and cid > 0 and isinstance(sid, int):
-                conv_seg_ids.setdefault(cid, []).append(sid)
-
-        for e in ef.get("enrichments", []) or []:
-            if not isinstance(e, dict) or e.get("type") != "approach":
-                continue
-            cid = e.get("conversation_id")
-            if not isinstance(cid, int) or cid <= 0:
-                continue
-            seg_ids = sorted(conv_seg_ids.get(cid, []))
-            out[(vid, cid)] = {
-                "video_id": vid,
-                "source": source,
-                "conversation_id": cid,
-                "enrichment": e,
-                "transcript_segments": seg_ids,
-            }
+        out.update(_stage07_semantic_requests_for_file(ef, preferred_source_by_vid))
     return out
 
 
@@ -262,7 +281,7 @@ def _pick_best_candidate(candidates: List[Path], preferred_source: Optional[str]
     return sorted(candidates, key=rank, reverse=True)[0]
 
 
-def _load_json_files(
+def _select_json_paths(
     stage_root: Path,
     glob_pattern: str,
     *,
@@ -270,22 +289,61 @@ def _load_json_files(
     source_filter: Optional[str],
     only_ids: Optional[Set[str]],
     preferred_source_by_vid: Optional[Dict[str, str]] = None,
-) -> List[Dict]:
+) -> List[Tuple[Path, str]]:
     root = stage_root / source_filter if source_filter else stage_root
     idx = _index_paths_by_video_id(root, glob_pattern, only_ids=only_ids)
-    files: List[Dict] = []
+    paths: List[Tuple[Path, str]] = []
     for vid in sorted(idx.keys()):
         candidates = idx[vid]
         preferred_source = preferred_source_by_vid.get(vid) if preferred_source_by_vid else source_filter
-        best = _pick_best_candidate(candidates, preferred_source)
-        try:
-            data = json.loads(best.read_text())
-            data["_source_file"] = str(best)
-            data["_stage"] = stage_name
-            files.append(data)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"{LOG_PREFIX} WARNING: Could not read {best}: {e}")
-    return files
+        paths.append((_pick_best_candidate(candidates, preferred_source), stage_name))
+    return paths
+
+
+def _read_artifact(path: Path, stage_name: str) -> Optional[Dict]:
+    try:
+        data = json.loads(path.read_text())
+        data["_source_file"] = str(path)
+        data["_stage"] = stage_name
+        return data
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"{LOG_PREFIX} WARNING: Could not read {path}: {e}")
+        return None
+
+
+def iter_artifacts(
+    paths: Iterable[Tuple[Path, str]],
+    manifest_ids: Optional[Set[str]] = None,
+) -> Iterator[Dict]:
+    """Read artifacts one at a time (optionally manifest-filtered, like _filter_by_manifest)."""
+    for path, stage_name in paths:
+        data = _read_artifact(path, stage_name)
+        if data is None:
+            continue
+        if manifest_ids:
+            vid = _extract_video_id(data)
+            if not vid or vid not in manifest_ids:
+                continue
+        yield data
+
+
+def _load_json_files(
+    stage_root: Path,
+    glob_pattern: str,
+    *,
+    stage_name: str,
+    source_filter: Optional[str],
+    only_ids: Optional[Set[str]],
+    preferred_source_by_vid: Optional[Dict[str, str]] = None,
+) -> List[Dict]:
+    return list(iter_artifacts(_select_json_paths(
+        stage_root,
+        glob_pattern,
+        stage_name=stage_name,
+        source_filter=source_filter,
+        only_ids=only_ids,
+        preferred_source_by_vid=preferred_source_by_vid,
+    )))
 
 
 def batch_reports_dir() -> Path:
@@ -294,10 +352,10 @@ def batch_reports_dir() -> Path:
     return d
 
 
-def load_enriched_files(source: Optional[str] = None) -> List[Dict]:
-    """Load enriched.json files from data/07.LLM.content/, de-duped by video_id."""
+def enriched_paths(source: Optional[str] = None) -> List[Tuple[Path, str]]:
+    """enriched.json files under data/07.LLM.content/, de-duped by video_id."""
     content_root = repo_root() / "data" / "07.LLM.content"
-    return _load_json_files(
+    return _select_json_paths(
         content_root,
         "*.enriched.json",
         stage_name="07.LLM.content",
@@ -306,8 +364,8 @@ def load_enriched_files(source: Optional[str] = None) -> List[Dict]:
     )
 
 
-def load_conversations_files(source: Optional[str] = None) -> List[Dict]:
-    """Load conversations.json files, preferring 06c.DET.patched when present."""
+def conversations_paths(source: Optional[str] = None) -> List[Tuple[Path, str]]:
+    """conversations.json files, preferring 06c.DET.patched when present."""
     patched_root = repo_root() / "data" / "06c.DET.patched"
     vtype_root = repo_root() / "data" / "06.LLM.video-type"
 
@@ -322,36 +380,44 @@ def load_conversations_files(source: Optional[str] = None) -> List[Dict]:
         only_ids=None,
     )
 
-    files: List[Dict] = []
+    paths: List[Tuple[Path, str]] = []
     for vid in sorted(set(idx_06c.keys()) | set(idx_06.keys())):
         candidates = idx_06c.get(vid) or idx_06.get(vid) or []
         if not candidates:
             continue
         stage_name = "06c.DET.patched" if vid in idx_06c else "06.LLM.video-type"
-        best = _pick_best_candidate(candidates, preferred_source=source)
-        try:
-            data = json.loads(best.read_text())
-            data["_source_file"] = str(best)
-            data["_stage"] = stage_name
-            files.append(data)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"{LOG_PREFIX} WARNING: Could not read {best}: {e}")
-    return files
+        paths.append((_pick_best_candidate(candidates, preferred_source=source), stage_name))
+    return paths
 
 
-def load_validation_files(source: Optional[str] = None) -> List[Dict]:
-    """Load .validation.json files (de-duped by video_id)."""
-    validations: List[Dict] = []
+def validation_paths(source: Optional[str] = None) -> List[Tuple[Path, str]]:
+    """.validation.json files (de-duped by video_id)."""
+    paths: List[Tuple[Path, str]] = []
     for stage_dir in ["06.LLM.video-type", "07.LLM.content"]:
         root = repo_root() / "data" / stage_dir
-        validations.extend(_load_json_files(
+        paths.extend(_select_json_paths(
             root,
             "*.validation.json",
             stage_name=stage_dir,
             source_filter=source,
             only_ids=None,
         ))
-    return validations
+    return paths
+
+
+def load_enriched_files(source: Optional[str] = None) -> List[Dict]:
+    """Load enriched.json files from data/07.LLM.content/, de-duped by video_id."""
+    return list(iter_artifacts(enriched_paths(source)))
+
+
+def load_conversations_files(source: Optional[str] = None) -> List[Dict]:
+    """Load conversations.json files, preferring 06c.DET.patched when present."""
+    return list(iter_artifacts(conversations_paths(source)))
+
+
+def load_validation_files(source: Optional[str] = None) -> List[Dict]:
+    """Load .validation.json files (de-duped by video_id)."""
+    return list(iter_artifacts(validation_paths(source)))
 
 
 def load_semantic_judgements(batch_id: str, manifest_ids: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
@@ -373,98 +439,105 @@ def load_semantic_judgements(batch_id: str, manifest_ids: Optional[Set[str]] = N
     return out
 
 
-def compute_batch_stats(
-    conversations_files: List[Dict],
-    enriched_files: List[Dict],
-    validation_files: List[Dict],
-    semantic_judgements: Optional[List[Dict[str, Any]]] = None,
-    manifest_source_by_vid: Optional[Dict[str, str]] = None,
-) -> Dict[str, Any]:
-    """Compute aggregate statistics for a batch."""
+_SEMANTIC_DIMENSIONS = ["technique_accuracy", "topic_accuracy", "phase_accuracy", "summary_quality", "overall_usefulness"]
 
-    stats: Dict[str, Any] = {}
 
-    # --- Stage 06 statistics ---
-    video_type_counts: Counter = Counter()
-    conversations_per_infield: List[int] = []
-    unknown_speaker_count = 0
-    student_speaker_count = 0
-    videos_with_students = 0
-    total_speaker_count = 0
+def _mean_or_zero(values: List[Any]) -> float:
+    return sum(values) / max(len(values), 1) if values else 0
 
-    for conv_file in conversations_files:
+
+class BatchStatsAccumulator:
+    """Streaming reducer behind compute_batch_stats.
+
+    Artifacts are folded in one at a time; only counters and per-approach values are kept.
+    Partial accumulators over consecutive slices of the artifact stream merge() in stream
+    order into exactly the state a single pass would have reached (float sums are taken
+    at finalize() over the merged value lists, so summation order is unchanged too).
+    """
+
+    def __init__(
+        self,
+        semantic_keys: Optional[Set[Tuple[str, int]]] = None,
+        preferred_source_by_vid: Optional[Dict[str, str]] = None,
+    ):
+        # Stage 06
+        self.videos_processed = 0
+        self.video_type_counts: Counter = Counter()
+        self.conversations_per_infield: List[int] = []
+        self.unknown_speaker_count = 0
+        self.student_speaker_count = 0
+        self.videos_with_students = 0
+        self.total_speaker_count = 0
+        # Stage 07
+        self.videos_enriched = 0
+        self.technique_counts: Counter = Counter()
+        self.topic_counts: Counter = Counter()
+        self.phase_counts: Counter = Counter()
+        self.hook_count = 0
+        self.approach_count = 0
+        self.investment_counts: Counter = Counter()
+        self.evidence_length_total = 0
+        self.evidence_length_count = 0
+        self.unlisted_techniques: Counter = Counter()
+        self.unlisted_topics: Counter = Counter()
+        self.topics_per_approach: List[int] = []
+        self.techniques_per_approach: List[int] = []
+        self.turn_phase_coverage: List[float] = []
+        self.phase_confidence_means: List[float] = []
+        self.total_low_quality_segments = 0
+        self.total_lq_repaired = 0
+        self.total_transcript_artifacts = 0
+        self.normalization_repairs_total = 0
+        self.videos_with_repairs = 0
+        # Validation
+        self.total_validations = 0
+        self.total_errors = 0
+        self.total_warnings = 0
+        self.warning_types: Counter = Counter()
+        self.error_types: Counter = Counter()
+        self.canonical_gate_counts: Counter = Counter()
+        self.canonical_issue_severity_counts: Counter = Counter()
+        self.stage_validation: Dict[str, Dict[str, Any]] = {}
+        # Semantic judge: only requests that some judgement will look up are retained.
+        self.semantic_keys = semantic_keys
+        self.preferred_source_by_vid = preferred_source_by_vid
+        self.semantic_requests: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def add_conversations(self, conv_file: Dict[str, Any]) -> None:
+        self.videos_processed += 1
         vtype = conv_file.get("video_type", {})
         vtype_str = vtype.get("type", "") if isinstance(vtype, dict) else str(vtype)
-        video_type_counts[vtype_str] += 1
+        self.video_type_counts[vtype_str] += 1
 
         convs = conv_file.get("conversations", [])
         if vtype_str in ("infield", "compilation"):
-            conversations_per_infield.append(len(convs))
+            self.conversations_per_infield.append(len(convs))
 
         labels = conv_file.get("speaker_labels", {})
         has_student = False
         for label in labels.values():
-            total_speaker_count += 1
+            self.total_speaker_count += 1
             role = label.get("role")
             if role == "unknown":
-                unknown_speaker_count += 1
+                self.unknown_speaker_count += 1
             elif role == "student":
-                student_speaker_count += 1
+                self.student_speaker_count += 1
                 has_student = True
         if has_student:
-            videos_with_students += 1
-
-    stats["stage_06"] = {
-        "videos_processed": len(conversations_files),
-        "video_type_distribution": dict(video_type_counts),
-        "mean_conversations_per_infield": (
-            sum(conversations_per_infield) / max(len(conversations_per_infield), 1)
-            if conversations_per_infield else 0
-        ),
-        "unknown_speaker_rate": (
-            unknown_speaker_count / max(total_speaker_count, 1)
-        ),
-        "student_speaker_rate": (
-            student_speaker_count / max(total_speaker_count, 1)
-        ),
-        "videos_with_students": videos_with_students,
-        "student_video_rate": (
-            videos_with_students / max(len(conversations_files), 1)
-        ),
-    }
-
-    # --- Stage 07 statistics ---
-    technique_counts: Counter = Counter()
-    topic_counts: Counter = Counter()
-    phase_counts: Counter = Counter()
-    hook_count = 0
-    approach_count = 0
-    investment_counts: Counter = Counter()
-    evidence_lengths: List[int] = []
-    unlisted_techniques: Counter = Counter()
-    unlisted_topics: Counter = Counter()
-    topics_per_approach: List[int] = []
-    techniques_per_approach: List[int] = []
-    turn_phase_coverage: List[float] = []
-    phase_confidence_means: List[float] = []
-
-    total_low_quality_segments = 0
-    total_lq_repaired = 0
-    total_transcript_artifacts = 0
-    normalization_repairs_total = 0
-    videos_with_repairs = 0
+            self.videos_with_students += 1
 
-    for enriched_file in enriched_files:
+    def add_enriched(self, enriched_file: Dict[str, Any]) -> None:
+        self.videos_enriched += 1
         meta = enriched_file.get("metadata", {})
         repairs = meta.get("normalization_repairs_count", 0)
         if isinstance(repairs, int) and repairs > 0:
-            videos_with_repairs += 1
-            normalization_repairs_total += repairs
+            self.videos_with_repairs += 1
+            self.normalization_repairs_total += repairs
 
         lq_list = enriched_file.get("low_quality_segments", []) or []
-        total_low_quality_segments += len(lq_list)
-        total_lq_repaired += sum(1 for lq in lq_list if isinstance(lq, dict) and lq.get("repaired"))
-        total_transcript_artifacts += len(enriched_file.get("transcript_artifacts", []) or [])
+        self.total_low_quality_segments += len(lq_list)
+        self.total_lq_repaired += sum(1 for lq in lq_list if isinstance(lq, dict) and lq.get("repaired"))
+        self.total_transcript_artifacts += len(enriched_file.get("transcript_artifacts", []) or [])
 
         # Build conversation segment counts for phase coverage (uses Stage 06/06c conversation_id in segments).
         conv_seg_counts: Counter = Counter()
@@ -477,124 +550,74 @@ def compute_batch_stats(
 
         for e in enrichments:
             if e.get("type") == "approach":
-                approach_count += 1
+                self.approach_count += 1
                 if e.get("hook_point"):
-                    hook_count += 1
+                    self.hook_count += 1
                 inv = e.get("investment_level")
                 if inv:
-                    investment_counts[inv] += 1
+                    self.investment_counts[inv] += 1
 
-                topics_per_approach.append(len(e.get("topics_discussed", []) or []))
-                techniques_per_approach.append(len(e.get("techniques_used", []) or []))
+                self.topics_per_approach.append(len(e.get("topics_discussed", []) or []))
+                self.techniques_per_approach.append(len(e.get("techniques_used", []) or []))
 
                 # Phase coverage: how many conversation segments got a phase label.
                 conv_id = e.get("conversation_id")
                 if isinstance(conv_id, int) and conv_id > 0:
                     seg_total = conv_seg_counts.get(conv_id, 0)
                     if seg_total > 0:
-                        turn_phase_coverage.append(len(e.get("turn_phases", []) or []) / seg_total)
+                        self.turn_phase_coverage.append(len(e.get("turn_phases", []) or []) / seg_total)
 
                 pc = e.get("phase_confidence", {})
                 if isinstance(pc, dict) and pc:
                     vals = [v for v in pc.values() if isinstance(v, (int, float))]
                     if vals:
-                        phase_confidence_means.append(sum(vals) / len(vals))
+                        self.phase_confidence_means.append(sum(vals) / len(vals))
 
             # Techniques
             for tech in e.get("techniques_used", []):
-                technique_counts[tech.get("technique", "")] += 1
+                self.technique_counts[tech.get("technique", "")] += 1
                 example = tech.get("example", "")
                 if example:
-                    evidence_lengths.append(len(example))
+                    self.evidence_length_total += len(example)
+                    self.evidence_length_count += 1
             for tech in e.get("techniques_discussed", []):
-                technique_counts[tech.get("technique", "")] += 1
+                self.technique_counts[tech.get("technique", "")] += 1
 
             # Topics
             for topic in e.get("topics_discussed", []):
                 if isinstance(topic, str):
-                    topic_counts[topic] += 1
+                    self.topic_counts[topic] += 1
 
             # Phases
             for tp in e.get("turn_phases", []):
                 phase = tp.get("phase", "")
                 if phase:
-                    phase_counts[phase] += 1
+                    self.phase_counts[phase] += 1
 
             # Unlisted concepts
             unlisted = e.get("unlisted_concepts", {})
             if isinstance(unlisted, dict):
                 for t in unlisted.get("techniques", []):
-                    unlisted_techniques[str(t)] += 1
+                    self.unlisted_techniques[str(t)] += 1
                 for t in unlisted.get("topics", []):
-                    unlisted_topics[str(t)] += 1
-
-    stats["stage_07"] = {
-        "videos_enriched": len(enriched_files),
-        "total_approaches": approach_count,
-        "technique_frequency": dict(technique_counts.most_common()),
-        "topic_frequency": dict(topic_counts.most_common()),
-        "phase_distribution": dict(phase_counts),
-        "hook_rate": hook_count / max(approach_count, 1),
-        "investment_distribution": dict(investment_counts),
-        "mean_topics_per_approach": (
-            sum(topics_per_approach) / max(len(topics_per_approach), 1)
-            if topics_per_approach else 0
-        ),
-        "median_topics_per_approach": median(topics_per_approach) if topics_per_approach else 0,
-        "mean_techniques_per_approach": (
-            sum(techniques_per_approach) / max(len(techniques_per_approach), 1)
-            if techniques_per_approach else 0
-        ),
-        "median_techniques_per_approach": median(techniques_per_approach) if techniques_per_approach else 0,
-        "mean_turn_phase_coverage": (
-            sum(turn_phase_coverage) / max(len(turn_phase_coverage), 1)
-            if turn_phase_coverage else 0
-        ),
-        "median_turn_phase_coverage": median(turn_phase_coverage) if turn_phase_coverage else 0,
-        "mean_phase_confidence": (
-            sum(phase_confidence_means) / max(len(phase_confidence_means), 1)
-            if phase_confidence_means else 0
-        ),
-        "mean_evidence_length": (
-            sum(evidence_lengths) / max(len(evidence_lengths), 1)
-            if evidence_lengths else 0
-        ),
-        "unlisted_techniques": dict(unlisted_techniques.most_common(20)),
-        "unlisted_topics": dict(unlisted_topics.most_common(20)),
-        "total_low_quality_segments": total_low_quality_segments,
-        "total_lq_repaired": total_lq_repaired,
-        "total_transcript_artifacts": total_transcript_artifacts,
-        "videos_with_normalization_repairs": videos_with_repairs,
-        "normalization_repairs_total": normalization_repairs_total,
-    }
+                    self.unlisted_topics[str(t)] += 1
 
-    # --- Validation statistics ---
-    total_errors = 0
-    total_warnings = 0
-    warning_types: Counter = Counter()
-    error_types: Counter = Counter()
-    canonical_gate_counts: Counter = Counter()
-    canonical_issue_severity_counts: Counter = Counter()
+        if self.semantic_keys:
+            for key, req in _stage07_semantic_requests_for_file(enriched_file, self.preferred_source_by_vid):
+                if key in self.semantic_keys:
+                    self.semantic_requests[key] = req
 
-    stage_validation: Dict[str, Dict[str, Any]] = {}
-
-    for vf in validation_files:
+    def add_validation(self, vf: Dict[str, Any]) -> None:
+        self.total_validations += 1
         summary = vf.get("summary", {})
-        total_errors += summary.get("errors", 0)
-        total_warnings += summary.get("warnings", 0)
+        self.total_errors += summary.get("errors", 0)
+        self.total_warnings += summary.get("warnings", 0)
 
         stage = vf.get("_stage", "unknown")
-        if stage not in stage_validation:
-            stage_validation[stage] = {
-                "total_validations": 0,
-                "total_errors": 0,
-                "total_warnings": 0,
-                "error_types": Counter(),
-                "warning_types": Counter(),
-            }
-        stage_validation[stage]["total_validations"] += 1
-        stage_validation[stage]["total_errors"] += summary.get("errors", 0)
-        stage_validation[stage]["total_warnings"] += summary.get("warnings", 0)
+        stage_stats = self._stage_validation(stage)
+        stage_stats["total_validations"] += 1
+        stage_stats["total_errors"] += summary.get("errors", 0)
+        stage_stats["total_warnings"] += summary.get("warnings", 0)
 
         for result in vf.get("results", []):
             if not isinstance(result, dict):
@@ -604,133 +627,320 @@ def compute_batch_stats(
             )
             if issue_severity == "info":
                 issue_severity = _canonical_issue_severity(result.get("severity"))
-            canonical_issue_severity_counts[issue_severity] += 1
-            canonical_gate_counts[
+            self.canonical_issue_severity_counts[issue_severity] += 1
+            self.canonical_gate_counts[
                 _canonical_gate_decision_from_result(result, issue_severity)
             ] += 1
 
             if result.get("severity") == "error":
-                error_types[result.get("check", "unknown")] += 1
-                stage_validation[stage]["error_types"][result.get("check", "unknown")] += 1
+                self.error_types[result.get("check", "unknown")] += 1
+                stage_stats["error_types"][result.get("check", "unknown")] += 1
             elif result.get("severity") == "warning":
-                warning_types[result.get("check", "unknown")] += 1
-                stage_validation[stage]["warning_types"][result.get("check", "unknown")] += 1
-
-    stats["validation"] = {
-        "total_validations": len(validation_files),
-        "total_errors": total_errors,
-        "total_warnings": total_warnings,
-        "error_types": dict(error_types.most_common()),
-        "warning_types": dict(warning_types.most_common()),
-        "canonical": {
-            "gate_decisions": dict(canonical_gate_counts),
-            "issue_severity": dict(canonical_issue_severity_counts),
-        },
-        "by_stage": {
-            stage: {
-                "total_validations": d["total_validations"],
-                "total_errors": d["total_errors"],
-                "total_warnings": d["total_warnings"],
-                "error_types": dict(d["error_types"].most_common()),
-                "warning_types": dict(d["warning_types"].most_common()),
-            }
-            for stage, d in stage_validation.items()
-        },
-    }
-
-    # --- Semantic judge statistics (optional) ---
-    if semantic_judgements:
-        # Detect "fresh" by comparing request_fingerprint against the current Stage 07
-        # enrichment + segment ids, not by file mtimes (Stage 07 revalidate rewrites files
-        # even when content is unchanged).
-        s07_req_by_vid_conv = _build_stage07_semantic_request_index(
-            enriched_files,
-            preferred_source_by_vid=manifest_source_by_vid,
-        )
-        fresh: List[Dict[str, Any]] = []
-        stale = 0
-        stale_missing_or_deleted = 0
-        stale_fingerprint_mismatch = 0
-        for j in semantic_judgements:
-            vid = j.get("video_id")
-            cid = j.get("conversation_id")
-            if not isinstance(vid, str) or not isinstance(cid, int):
-                stale += 1
-                stale_missing_or_deleted += 1
-                continue
+                self.warning_types[result.get("check", "unknown")] += 1
+                stage_stats["warning_types"][result.get("check", "unknown")] += 1
 
-            req = s07_req_by_vid_conv.get((vid, cid))
-            if not req:
-                stale += 1
-                stale_missing_or_deleted += 1
-                continue
+    def _stage_validation(self, stage: str) -> Dict[str, Any]:
+        if stage not in self.stage_validation:
+            self.stage_validation[stage] = {
+                "total_validations": 0,
+                "total_errors": 0,
+                "total_warnings": 0,
+                "error_types": Counter(),
+                "warning_types": Counter(),
+            }
+        return self.stage_validation[stage]
 
-            req_meta = j.get("request", {}) if isinstance(j.get("request"), dict) else {}
-            prompt_version = req_meta.get("prompt_version")
-            if not isinstance(prompt_version, str) or not prompt_version:
-                prompt_version = SEMANTIC_JUDGE_DEFAULT_PROMPT_VERSION
-            max_segments = req_meta.get("max_segments")
-            if not isinstance(max_segments, int) or max_segments <= 0:
-                max_segments = SEMANTIC_JUDGE_DEFAULT_MAX_SEGMENTS
-
-            expected_fingerprint = stable_hash({
-                "video_id": req["video_id"],
-                "source": req["source"],
-                "conversation_id": req["conversation_id"],
-                "enrichment": req["enrichment"],
-                "transcript_segments": req["transcript_segments"],
-                "prompt_version": prompt_version,
-                "max_segments": max_segments,
-            })
-            if j.get("request_fingerprint") != expected_fingerprint:
-                stale += 1
-                stale_fingerprint_mismatch += 1
+    def merge(self, other: "BatchStatsAccumulator") -> "BatchStatsAccumulator":
+        """Fold in the partial for the slice that directly follows this one."""
+        for name, value in vars(other).items():
+            if name in ("semantic_keys", "preferred_source_by_vid", "stage_validation", "semantic_requests"):
                 continue
+            mine = getattr(self, name)
+            if isinstance(mine, Counter):
+                mine.update(value)
+            elif isinstance(mine, list):
+                mine.extend(value)
+            else:
+                setattr(self, name, mine + value)
+        for stage, d in other.stage_validation.items():
+            stage_stats = self._stage_validation(stage)
+            for key in ("total_validations", "total_errors", "total_warnings"):
+                stage_stats[key] += d[key]
+            stage_stats["error_types"].update(d["error_types"])
+            stage_stats["warning_types"].update(d["warning_types"])
+        self.semantic_requests.update(other.semantic_requests)
+        return self
+
+    def finalize(self, semantic_judgements: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {}
+
+        stats["stage_06"] = {
+            "videos_processed": self.videos_processed,
+            "video_type_distribution": dict(self.video_type_counts),
+            "mean_conversations_per_infield": _mean_or_zero(self.conversations_per_infield),
+            "unknown_speaker_rate": (
+                self.unknown_speaker_count / max(self.total_speaker_count, 1)
+            ),
+            "student_speaker_rate": (
+                self.student_speaker_count / max(self.total_speaker_count, 1)
+            ),
+            "videos_with_students": self.videos_with_students,
+            "student_video_rate": (
+                self.videos_with_students / max(self.videos_processed, 1)
+            ),
+        }
 
-            fresh.append(j)
-
-        overall_scores: List[int] = []
-        major_errors = 0
-        hallucinations = 0
-        dim_totals: Counter = Counter()
-        dim_counts: Counter = Counter()
-
-        for j in fresh:
-            scores = j.get("scores", {}) if isinstance(j.get("scores"), dict) else {}
-            try:
-                overall_scores.append(int(scores.get("overall_score_0_100", 0)))
-            except Exception:
-                pass
-            flags = j.get("flags", {}) if isinstance(j.get("flags"), dict) else {}
-            if flags.get("major_errors") is True:
-                major_errors += 1
-            if flags.get("hallucination_suspected") is True:
-                hallucinations += 1
-
-            for dim in ["technique_accuracy", "topic_accuracy", "phase_accuracy", "summary_quality", "overall_usefulness"]:
-                v = scores.get(dim)
-                if isinstance(v, (int, float)):
-                    dim_totals[dim] += float(v)
-                    dim_counts[dim] += 1
-
-        stats["semantic_judge"] = {
-            "total_judgements": len(semantic_judgements),
-            "fresh_judgements": len(fresh),
-            "stale_judgements": stale,
-            "stale_missing_or_deleted": stale_missing_or_deleted,
-            "stale_fingerprint_mismatch": stale_fingerprint_mismatch,
-            "mean_overall_score_0_100": (
-                sum(overall_scores) / max(len(overall_scores), 1) if overall_scores else 0
+        stats["stage_07"] = {
+            "videos_enriched": self.videos_enriched,
+            "total_approaches": self.approach_count,
+            "technique_frequency": dict(self.technique_counts.most_common()),
+            "topic_frequency": dict(self.topic_counts.most_common()),
+            "phase_distribution": dict(self.phase_counts),
+            "hook_rate": self.hook_count / max(self.approach_count, 1),
+            "investment_distribution": dict(self.investment_counts),
+            "mean_topics_per_approach": _mean_or_zero(self.topics_per_approach),
+            "median_topics_per_approach": median(self.topics_per_approach) if self.topics_per_approach else 0,
+            "mean_techniques_per_approach": _mean_or_zero(self.techniques_per_approach),
+            "median_techniques_per_approach": (
+                median(self.techniques_per_approach) if self.techniques_per_approach else 0
             ),
-            "major_error_rate": major_errors / max(len(fresh), 1),
-            "hallucination_rate": hallucinations / max(len(fresh), 1),
-            "mean_dimension_scores_0_5": {
-                dim: (dim_totals[dim] / dim_counts[dim]) if dim_counts[dim] else 0
-                for dim in ["technique_accuracy", "topic_accuracy", "phase_accuracy", "summary_quality", "overall_usefulness"]
+            "mean_turn_phase_coverage": _mean_or_zero(self.turn_phase_coverage),
+            "median_turn_phase_coverage": median(self.turn_phase_coverage) if self.turn_phase_coverage else 0,
+            "mean_phase_confidence": _mean_or_zero(self.phase_confidence_means),
+            "mean_evidence_length": (
+                self.evidence_length_total / self.evidence_length_count
+                if self.evidence_length_count else 0
+            ),
+            "unlisted_techniques": dict(self.unlisted_techniques.most_common(20)),
+            "unlisted_topics": dict(self.unlisted_topics.most_common(20)),
+            "total_low_quality_segments": self.total_low_quality_segments,
+            "total_lq_repaired": self.total_lq_repaired,
+            "total_transcript_artifacts": self.total_transcript_artifacts,
+            "videos_with_normalization_repairs": self.videos_with_repairs,
+            "normalization_repairs_total": self.normalization_repairs_total,
+        }
+
+        stats["validation"] = {
+            "total_validations": self.total_validations,
+            "total_errors": self.total_errors,
+            "total_warnings": self.total_warnings,
+            "error_types": dict(self.error_types.most_common()),
+            "warning_types": dict(self.warning_types.most_common()),
+            "canonical": {
+                "gate_decisions": dict(self.canonical_gate_counts),
+                "issue_severity": dict(self.canonical_issue_severity_counts),
+            },
+            "by_stage": {
+                stage: {
+                    "total_validations": d["total_validations"],
+                    "total_errors": d["total_errors"],
+                    "total_warnings": d["total_warnings"],
+                    "error_types": dict(d["error_types"].most_common()),
+                    "warning_types": dict(d["warning_types"].most_common()),
+                }
+                for stage, d in self.stage_validation.items()
             },
         }
 
-    return stats
+        if semantic_judgements:
+            stats["semantic_judge"] = _semantic_judge_stats(semantic_judgements, self.semantic_requests)
+
+        return stats
+
+
+def _semantic_keys(semantic_judgements: Optional[List[Dict[str, Any]]]) -> Optional[Set[Tuple[str, int]]]:
+    if not semantic_judgements:
+        return None
+    return {
+        (j.get("video_id"), j.get("conversation_id"))
+        for j in semantic_judgements
+        if isinstance(j.get("video_id"), str) and isinstance(j.get("conversation_id"), int)
+    }
+
+
+def _semantic_judge_stats(
+    semantic_judgements: List[Dict[str, Any]],
+    s07_req_by_vid_conv: Dict[Tuple[str, int], Dict[str, Any]],
+) -> Dict[str, Any]:
+    # Detect "fresh" by comparing request_fingerprint against the current Stage 07
+    # enrichment + segment ids, not by file mtimes (Stage 07 revalidate rewrites files
+    # even when content is unchanged).
+    fresh: List[Dict[str, Any]] = []
+    stale = 0
+    stale_missing_or_deleted = 0
+    stale_fingerprint_mismatch = 0
+    for j in semantic_judgements:
+        vid = j.get("video_id")
+        cid = j.get("conversation_id")
+        if not isinstance(vid, str) or not isinstance(cid, int):
+            stale += 1
+            stale_missing_or_deleted += 1
+            continue
+
+        req = s07_req_by_vid_conv.get((vid, cid))
+        if not req:
+            stale += 1
+            stale_missing_or_deleted += 1
+            continue
+
+        req_meta = j.get("request", {}) if isinstance(j.get("request"), dict) else {}
+        prompt_version = req_meta.get("prompt_version")
+        if not isinstance(prompt_version, str) or not prompt_version:
+            prompt_version = SEMANTIC_JUDGE_DEFAULT_PROMPT_VERSION
+        max_segments = req_meta.get("max_segments")
+        if not isinstance(max_segments, int) or max_segments <= 0:
+            max_segments = SEMANTIC_JUDGE_DEFAULT_MAX_SEGMENTS
+
+        expected_fingerprint = stable_hash({
+            "video_id": req["video_id"],
+            "source": req["source"],
+            "conversation_id": req["conversation_id"],
+            "enrichment": req["enrichment"],
+            "transcript_segments": req["transcript_segments"],
+            "prompt_version": prompt_version,
+            "max_segments": max_segments,
+        })
+        if j.get("request_fingerprint") != expected_fingerprint:
+            stale += 1
+            stale_fingerprint_mismatch += 1
+            continue
+
+        fresh.append(j)
+
+    overall_scores: List[int] = []
+    major_errors = 0
+    hallucinations = 0
+    dim_totals: Counter = Counter()
+    dim_counts: Counter = Counter()
+
+    for j in fresh:
+        scores = j.get("scores", {}) if isinstance(j.get("scores"), dict) else {}
+        try:
+            overall_scores.append(int(scores.get("overall_score_0_100", 0)))
+        except Exception:
+            pass
+        flags = j.get("flags", {}) if isinstance(j.get("flags"), dict) else {}
+        if flags.get("major_errors") is True:
+            major_errors += 1
+        if flags.get("hallucination_suspected") is True:
+            hallucinations += 1
+
+        for dim in _SEMANTIC_DIMENSIONS:
+            v = scores.get(dim)
+            if isinstance(v, (int, float)):
+                dim_totals[dim] += float(v)
+                dim_counts[dim] += 1
+
+    return {
+        "total_judgements": len(semantic_judgements),
+        "fresh_judgements": len(fresh),
+        "stale_judgements": stale,
+        "stale_missing_or_deleted": stale_missing_or_deleted,
+        "stale_fingerprint_mismatch": stale_fingerprint_mismatch,
+        "mean_overall_score_0_100": (
+            sum(overall_scores) / max(len(overall_scores), 1) if overall_scores else 0
+        ),
+        "major_error_rate": major_errors / max(len(fresh), 1),
+        "hallucination_rate": hallucinations / max(len(fresh), 1),
+        "mean_dimension_scores_0_5": {
+            dim: (dim_totals[dim] / dim_counts[dim]) if dim_counts[dim] else 0
+            for dim in _SEMANTIC_DIMENSIONS
+        },
+    }
+
+
+def compute_batch_stats(
+    conversations_files: Iterable[Dict],
+    enriched_files: Iterable[Dict],
+    validation_files: Iterable[Dict],
+    semantic_judgements: Optional[List[Dict[str, Any]]] = None,
+    manifest_source_by_vid: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Compute aggregate statistics for a batch.
+
+    Inputs may be lists or generators (e.g. iter_artifacts); each is consumed once.
+    """
+    acc = BatchStatsAccumulator(
+        semantic_keys=_semantic_keys(semantic_judgements),
+        preferred_source_by_vid=manifest_source_by_vid,
+    )
+    for conv_file in conversations_files:
+        acc.add_conversations(conv_file)
+    for enriched_file in enriched_files:
+        acc.add_enriched(enriched_file)
+    for vf in validation_files:
+        acc.add_validation(vf)
+    return acc.finalize(semantic_judgements)
+
+
+def _reduce_artifact_slice(
+    kind: str,
+    paths: List[Tuple[Path, str]],
+    manifest_ids: Optional[Set[str]],
+    semantic_keys: Optional[Set[Tuple[str, int]]],
+    manifest_source_by_vid: Optional[Dict[str, str]],
+) -> BatchStatsAccumulator:
+    acc = BatchStatsAccumulator(semantic_keys=semantic_keys, preferred_source_by_vid=manifest_source_by_vid)
+    add = {
+        "conversations": acc.add_conversations,
+        "enriched": acc.add_enriched,
+        "validation": acc.add_validation,
+    }[kind]
+    for data in iter_artifacts(paths, manifest_ids):
+        add(data)
+    return acc
+
+
+def compute_batch_stats_from_paths(
+    conversations: List[Tuple[Path, str]],
+    enriched: List[Tuple[Path, str]],
+    validation: List[Tuple[Path, str]],
+    manifest_ids: Optional[Set[str]] = None,
+    semantic_judgements: Optional[List[Dict[str, Any]]] = None,
+    manifest_source_by_vid: Optional[Dict[str, str]] = None,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """compute_batch_stats over artifact paths, reading one file at a time.
+
+    With workers > 1 each artifact list is cut into contiguous slices reduced in worker
+    processes; the partials merge in slice order, so the result matches a serial run.
+    """
+    semantic_keys = _semantic_keys(semantic_judgements)
+    jobs: List[Tuple[str, List[Tuple[Path, str]]]] = []
+    for kind, paths in (("conversations", conversations), ("enriched", enriched), ("validation", validation)):
+        n_slices = max(1, min(workers, len(paths)))
+        size = -(-len(paths) // n_slices) if paths else 0
+        for i in range(n_slices):
+            jobs.append((kind, paths[i * size:(i + 1) * size]))
+
+    if workers <= 1:
+        partials = [
+            _reduce_artifact_slice(kind, paths, manifest_ids, semantic_keys, manifest_source_by_vid)
+            for kind, paths in jobs
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_reduce_artifact_slice, kind, paths, manifest_ids, semantic_keys, manifest_source_by_vid)
+                for kind, paths in jobs
+            ]
+            partials = [f.result() for f in futures]
+
+    acc = BatchStatsAccumulator(semantic_keys=semantic_keys, preferred_source_by_vid=manifest_source_by_vid)
+    for partial in partials:
+        acc.merge(partial)
+    return acc.finalize(semantic_judgements)
+
+
+def _chi_squared_arrays(observed: np.ndarray, expected: np.ndarray) -> float:
+    """chi_squared_test over count vectors aligned to the same category order."""
+    total_obs = max(float(observed.sum()), 1.0)
+    total_exp = max(float(expected.sum()), 1.0)
+    # Scale to total_obs for comparison
+    obs_val = observed / total_obs * total_obs
+    exp_val = expected / total_exp * total_obs
+    mask = exp_val > 0
+    return float(np.sum((obs_val[mask] - exp_val[mask]) ** 2 / exp_val[mask]))
 
 
 def chi_squared_test(observed: Dict[str, int], expected: Dict[str, int]) -> float:
@@ -739,21 +949,11 @@ def chi_squared_test(observed: Dict[str, int], expected: Dict[str, int]) -> floa
     Returns the chi-squared value (higher = more different).
     Not a proper p-value calculation — just a rough comparison metric.
     """
-    all_keys = set(list(observed.keys()) + list(expected.keys()))
-    total_obs = max(sum(observed.values()), 1)
-    total_exp = max(sum(expected.values()), 1)
-
-    chi_sq = 0.0
-    for key in all_keys:
-        obs_frac = observed.get(key, 0) / total_obs
-        exp_frac = expected.get(key, 0) / total_exp
-        # Scale to total_obs for comparison
-        obs_val = obs_frac * total_obs
-        exp_val = exp_frac * total_obs
-        if exp_val > 0:
-            chi_sq += (obs_val - exp_val) ** 2 / exp_val
-
-    return chi_sq
+    all_keys = list(dict.fromkeys(list(observed.keys()) + list(expected.keys())))
+    return _chi_squared_arrays(
+        np.array([observed.get(k, 0) for k in all_keys], dtype=np.float64),
+        np.array([expected.get(k, 0) for k in all_keys], dtype=np.float64),
+    )
 
 
 def z_score(value: float, mean: float, std: float) -> float:
@@ -763,22 +963,220 @@ def z_score(value: float, mean: float, std: float) -> float:
     return (value - mean) / std
 
 
-def compare_with_prior_batches(
-    current_stats: Dict, batch_id: str
-) -> List[Dict[str, Any]]:
-    """Compare current batch statistics against prior batch reports."""
-    reports_dir = batch_reports_dir()
-    prior_reports: List[Dict] = []
+# --- Per-batch statistic snapshots ---
+#
+# data/batch_reports/snapshots/
+#   index.json        {"version", "batches": [{batch_id, generated_at, file, report_mtime_ns}]}
+#                     ordered oldest -> newest by report generated_at
+#   batch_<id>.npz    "scalar_names"/"scalars" plus "<hist>.keys"/"<hist>.counts" per histogram
+#   .lock             flock held around every index.json load -> update -> replace
+#
+# Reports written by older versions are backfilled from batch_<id>.json on the next sync,
+# keyed on the report mtime.
+
+SNAPSHOT_VERSION = 1
+
+SNAPSHOT_HISTOGRAMS: Dict[str, Tuple[str, str]] = {
+    "technique_frequency": ("stage_07", "technique_frequency"),
+    "topic_frequency": ("stage_07", "topic_frequency"),
+    "phase_distribution": ("stage_07", "phase_distribution"),
+    "investment_distribution": ("stage_07", "investment_distribution"),
+    "video_type_distribution": ("stage_06", "video_type_distribution"),
+}
+
+SNAPSHOT_SCALARS: Dict[str, Tuple[str, str]] = {
+    "hook_rate": ("stage_07", "hook_rate"),
+    "mean_conversations_per_infield": ("stage_06", "mean_conversations_per_infield"),
+    "mean_topics_per_approach": ("stage_07", "mean_topics_per_approach"),
+    "mean_techniques_per_approach": ("stage_07", "mean_techniques_per_approach"),
+    "mean_turn_phase_coverage": ("stage_07", "mean_turn_phase_coverage"),
+    "mean_phase_confidence": ("stage_07", "mean_phase_confidence"),
+    "unknown_speaker_rate": ("stage_06", "unknown_speaker_rate"),
+    "student_speaker_rate": ("stage_06", "student_speaker_rate"),
+}
+
+
+def batch_snapshots_dir(reports_dir: Optional[Path] = None) -> Path:
+    return (reports_dir or batch_reports_dir()) / "snapshots"
+
+
+def _stats_section(stats: Dict[str, Any], path: Tuple[str, str]) -> Any:
+    section = stats.get(path[0], {})
+    return section.get(path[1]) if isinstance(section, dict) else None
+
+
+@contextlib.contextmanager
+def _snapshot_index_lock(snap_dir: Path) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    snap_dir.mkdir(parents=True, exist_ok=True)
+    with (snap_dir / ".lock").open("a+", encoding="utf-8") as lock_fh:
+        fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+
+def _load_snapshot_index(snap_dir: Path) -> List[Dict[str, Any]]:
+    try:
+        data = json.loads((snap_dir / "index.json").read_text())
+    except (json.JSONDecodeError, IOError):
+        return []
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return []
+    return [r for r in data.get("batches", []) if isinstance(r, dict) and isinstance(r.get("batch_id"), str)]
+
+
+def _save_snapshot_index(snap_dir: Path, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    ordered = sorted(rows, key=lambda r: (str(r.get("generated_at") or ""), r["batch_id"]))
+    tmp = snap_dir / f"index.json.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps({"version": SNAPSHOT_VERSION, "batches": ordered}, indent=2) + "\n")
+    tmp.replace(snap_dir / "index.json")
+    return ordered
+
+
+def _write_snapshot_file(snap_dir: Path, batch_id: str, stats: Dict[str, Any]) -> str:
+    arrays: Dict[str, np.ndarray] = {
+        "scalar_names": np.array(list(SNAPSHOT_SCALARS), dtype=str),
+        "scalars": np.array(
+            [_to_float(_stats_section(stats, path), 0.0) for path in SNAPSHOT_SCALARS.values()],
+            dtype=np.float64,
+        ),
+    }
+    for name, path in SNAPSHOT_HISTOGRAMS.items():
+        hist = _stats_section(stats, path)
+        hist = hist if isinstance(hist, dict) else {}
+        arrays[f"{name}.keys"] = np.array([str(k) for k in hist], dtype=str)
+        arrays[f"{name}.counts"] = np.array([_to_float(v, 0.0) for v in hist.values()], dtype=np.float64)
+
+    snap_dir.mkdir(parents=True, exist_ok=True)
+    file_name = f"batch_{batch_id}.npz"
+    tmp = snap_dir / f"batch_{batch_id}.{os.getpid()}.tmp.npz"
+    np.savez(tmp, **arrays)
+    tmp.replace(snap_dir / file_name)
+    return file_name
+
+
+def record_batch_snapshot(report: Dict[str, Any], report_path: Path) -> None:
+    """Persist the numeric snapshot for a freshly written batch report."""
+    snap_dir = batch_snapshots_dir(report_path.parent)
+    batch_id = str(report["batch_id"])
+    row = {
+        "batch_id": batch_id,
+        "generated_at": report.get("generated_at"),
+        "file": _write_snapshot_file(snap_dir, batch_id, report.get("stats", {})),
+        "report_mtime_ns": report_path.stat().st_mtime_ns,
+    }
+    with _snapshot_index_lock(snap_dir):
+        rows = [r for r in _load_snapshot_index(snap_dir) if r["batch_id"] != batch_id]
+        _save_snapshot_index(snap_dir, rows + [row])
+
+
+def sync_batch_snapshots(reports_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Bring the snapshot index in line with batch_*.json reports; return rows oldest first.
+
+    Only reports without an up-to-date snapshot are read.
+    """
+    reports_dir = reports_dir or batch_reports_dir()
+    snap_dir = batch_snapshots_dir(reports_dir)
+    with _snapshot_index_lock(snap_dir):
+        return _sync_snapshot_index(reports_dir, snap_dir)
 
+
+def _sync_snapshot_index(reports_dir: Path, snap_dir: Path) -> List[Dict[str, Any]]:
+    indexed = {r["batch_id"]: r for r in _load_snapshot_index(snap_dir)}
+    rows: List[Dict[str, Any]] = []
+    changed = False
     for f in sorted(reports_dir.glob("batch_*.json")):
-        if f.stem == f"batch_{batch_id}":
+        batch_id = f.stem[len("batch_"):]
+        mtime_ns = f.stat().st_mtime_ns
+        row = indexed.pop(batch_id, None)
+        if row and row.get("report_mtime_ns") == mtime_ns and (snap_dir / str(row.get("file"))).exists():
+            rows.append(row)
             continue
         try:
-            prior_reports.append(json.loads(f.read_text()))
+            report = json.loads(f.read_text())
         except (json.JSONDecodeError, IOError):
-            pass
+            continue
+        rows.append({
+            "batch_id": batch_id,
+            "generated_at": report.get("generated_at"),
+            "file": _write_snapshot_file(snap_dir, batch_id, report.get("stats", {})),
+            "report_mtime_ns": mtime_ns,
+        })
+        changed = True
+    if indexed:
+        # Reports deleted since the last sync drop out of the baseline.
+        for row in indexed.values():
+            (snap_dir / str(row.get("file"))).unlink(missing_ok=True)
+        changed = True
+    if changed:
+        return _save_snapshot_index(snap_dir, rows)
+    return sorted(rows, key=lambda r: (str(r.get("generated_at") or ""), r["batch_id"]))
+
+
+class PriorBatchSnapshots:
+    """Prior batch snapshots stacked into matrices (one row per batch)."""
+
+    def __init__(self, snap_dir: Path, rows: List[Dict[str, Any]]):
+        self.batch_ids = [r["batch_id"] for r in rows]
+        loaded = []
+        for r in rows:
+            with np.load(snap_dir / r["file"]) as npz:
+                loaded.append({k: npz[k] for k in npz.files})
+
+        scalar_index = {name: i for i, name in enumerate(SNAPSHOT_SCALARS)}
+        self.scalars = np.zeros((len(loaded), len(scalar_index)), dtype=np.float64)
+        for row, snap in enumerate(loaded):
+            for name, value in zip(snap["scalar_names"].tolist(), snap["scalars"]):
+                if name in scalar_index:
+                    self.scalars[row, scalar_index[name]] = value
+
+        self.histograms: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        for name in SNAPSHOT_HISTOGRAMS:
+            vocab: Dict[str, int] = {}
+            for snap in loaded:
+                for key in snap.get(f"{name}.keys", np.array([], dtype=str)).tolist():
+                    vocab.setdefault(key, len(vocab))
+            matrix = np.zeros((len(loaded), len(vocab)), dtype=np.float64)
+            for row, snap in enumerate(loaded):
+                keys = snap.get(f"{name}.keys", np.array([], dtype=str)).tolist()
+                if keys:
+                    matrix[row, [vocab[k] for k in keys]] = snap[f"{name}.counts"]
+            self.histograms[name] = (list(vocab), matrix)
+
+    def __len__(self) -> int:
+        return len(self.batch_ids)
+
+    def scalar(self, name: str) -> np.ndarray:
+        return self.scalars[:, list(SNAPSHOT_SCALARS).index(name)]
+
+
+def load_prior_snapshots(
+    batch_id: str,
+    window: Optional[int] = None,
+    reports_dir: Optional[Path] = None,
+) -> PriorBatchSnapshots:
+    """Snapshots of every other batch (or the last `window` of them, by generation time)."""
+    reports_dir = reports_dir or batch_reports_dir()
+    rows = [r for r in sync_batch_snapshots(reports_dir) if r["batch_id"] != batch_id]
+    if window is not None:
+        rows = rows[-window:] if window > 0 else []
+    return PriorBatchSnapshots(batch_snapshots_dir(reports_dir), rows)
+
+
+def compare_with_prior_batches(
+    current_stats: Dict, batch_id: str, window: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Compare current batch statistics against prior batch snapshots.
+
+    window: only use the last K prior batches as the baseline (default: all).
+    """
+    prior = load_prior_snapshots(batch_id, window=window)
 
-    if not prior_reports:
+    if not len(prior):
         return [{"check": "no_prior_batches", "message": "No prior batches to compare against"}]
 
     drift_flags: List[Dict[str, Any]] = []
@@ -787,15 +1185,15 @@ def compare_with_prior_batches(
     current_techniques = current_stats.get("stage_07", {}).get("technique_frequency", {})
     if current_techniques:
         # Aggregate prior technique distributions
-        prior_technique_totals: Counter = Counter()
-        for report in prior_reports:
-            for tech, count in report.get("stats", {}).get("stage_07", {}).get("technique_frequency", {}).items():
-                prior_technique_totals[tech] += count
-
-        if prior_technique_totals:
-            chi_sq = chi_squared_test(current_techniques, dict(prior_technique_totals))
+        prior_vocab, prior_matrix = prior.histograms["technique_frequency"]
+        if prior_vocab:
+            keys = list(dict.fromkeys(list(current_techniques.keys()) + prior_vocab))
+            prior_totals = np.zeros(len(keys), dtype=np.float64)
+            prior_totals[[keys.index(k) for k in prior_vocab]] = prior_matrix.sum(axis=0)
+            observed = np.array([current_techniques.get(k, 0) for k in keys], dtype=np.float64)
+            chi_sq = _chi_squared_arrays(observed, prior_totals)
             # Rough threshold: chi-sq > 2*k (where k = number of categories) suggests drift
-            k = len(set(list(current_techniques.keys()) + list(prior_technique_totals.keys())))
+            k = len(keys)
             if k > 0 and chi_sq > 2 * k:
                 drift_flags.append({
                     "check": "technique_distribution_drift",
@@ -806,13 +1204,10 @@ def compare_with_prior_batches(
 
     # Compare hook rate
     current_hook_rate = current_stats.get("stage_07", {}).get("hook_rate", 0)
-    prior_hook_rates = [
-        r.get("stats", {}).get("stage_07", {}).get("hook_rate", 0)
-        for r in prior_reports
-    ]
-    if prior_hook_rates and len(prior_hook_rates) >= 2:
-        mean_hr = sum(prior_hook_rates) / len(prior_hook_rates)
-        std_hr = (sum((x - mean_hr) ** 2 for x in prior_hook_rates) / len(prior_hook_rates)) ** 0.5
+    prior_hook_rates = prior.scalar("hook_rate")
+    if len(prior_hook_rates) >= 2:
+        mean_hr = float(prior_hook_rates.mean())
+        std_hr = float(prior_hook_rates.std())
         if std_hr > 0:
             z = z_score(current_hook_rate, mean_hr, std_hr)
             if abs(z) > 2:
@@ -826,13 +1221,10 @@ def compare_with_prior_batches(
 
     # Compare conversations per infield
     current_conv_mean = current_stats.get("stage_06", {}).get("mean_conversations_per_infield", 0)
-    prior_conv_means = [
-        r.get("stats", {}).get("stage_06", {}).get("mean_conversations_per_infield", 0)
-        for r in prior_reports
-    ]
-    if prior_conv_means and len(prior_conv_means) >= 2:
-        mean_cm = sum(prior_conv_means) / len(prior_conv_means)
-        std_cm = (sum((x - mean_cm) ** 2 for x in prior_conv_means) / len(prior_conv_means)) ** 0.5
+    prior_conv_means = prior.scalar("mean_conversations_per_infield")
+    if len(prior_conv_means) >= 2:
+        mean_cm = float(prior_conv_means.mean())
+        std_cm = float(prior_conv_means.std())
         if std_cm > 0:
             z = z_score(current_conv_mean, mean_cm, std_cm)
             if abs(z) > 2:
@@ -847,7 +1239,7 @@ def compare_with_prior_batches(
     if not drift_flags:
         drift_flags.append({
             "check": "no_drift_detected",
-            "message": f"No significant drift detected compared to {len(prior_reports)} prior batch(es)"
+            "message": f"No significant drift detected compared to {len(prior)} prior batch(es)"
         })
 
     return drift_flags
@@ -983,6 +1375,11 @@ def main() -> None:
     parser.add_argument("--manifest", help="Only include videos listed in a batch/sub-batch manifest file")
     parser.add_argument("--batch-id", required=True, help="Batch identifier (e.g., R1, R2, P001)")
     parser.add_argument("--compare", action="store_true", help="Compare against prior batches")
+    parser.add_argument(
+        "--compare-window",
+        type=int,
+        help="With --compare: use only the last K prior batches (by report generation time) as the baseline",
+    )
     parser.add_argument("--json", action="store_true", help="Output JSON report")
     parser.add_argument(
         "--no-write",
@@ -1014,6 +1411,12 @@ def main() -> None:
         action="store_true",
         help="Optional semantic gate: fail when stale semantic judgements are present",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Reduce artifacts in N worker processes and merge the partial aggregates (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -1030,6 +1433,14 @@ def main() -> None:
         print(f"{LOG_PREFIX} ERROR: --semantic-max-hallucination-rate must be in [0, 1]", file=sys.stderr)
         sys.exit(2)
 
+    if args.compare_window is not None and args.compare_window < 1:
+        print(f"{LOG_PREFIX} ERROR: --compare-window must be >= 1", file=sys.stderr)
+        sys.exit(2)
+
+    if args.workers < 1:
+        print(f"{LOG_PREFIX} ERROR: --workers must be >= 1", file=sys.stderr)
+        sys.exit(2)
+
     if not args.source and not args.all:
         parser.print_help()
         sys.exit(1)
@@ -1053,17 +1464,19 @@ def main() -> None:
         for src_name, vid in _load_manifest_entries(manifest_path, source=source):
             manifest_source_by_vid.setdefault(vid, src_name)
 
-    # Load data
-    conversations_files = load_conversations_files(source)
-    enriched_files = load_enriched_files(source)
-    validation_files = load_validation_files(source)
-
-    if manifest_ids:
-        conversations_files = _filter_by_manifest(conversations_files, manifest_ids)
-        enriched_files = _filter_by_manifest(enriched_files, manifest_ids)
-        validation_files = _filter_by_manifest(validation_files, manifest_ids)
+    # Stream artifacts one file at a time; only the aggregate state stays resident.
+    semantic_judgements = load_semantic_judgements(args.batch_id, manifest_ids if manifest_ids else None)
+    stats = compute_batch_stats_from_paths(
+        conversations_paths(source),
+        enriched_paths(source),
+        validation_paths(source),
+        manifest_ids=manifest_ids if manifest_ids else None,
+        semantic_judgements=semantic_judgements,
+        manifest_source_by_vid=manifest_source_by_vid if manifest_source_by_vid else None,
+        workers=args.workers,
+    )
 
-    if not conversations_files and not enriched_files:
+    if not stats["stage_06"]["videos_processed"] and not stats["stage_07"]["videos_enriched"]:
         semantic_gate_requested = args.semantic_fail_on_stale or any(
             v is not None
             for v in (
@@ -1086,21 +1499,10 @@ def main() -> None:
         print(f"{LOG_PREFIX} No data found to report on")
         sys.exit(0)
 
-    semantic_judgements = load_semantic_judgements(args.batch_id, manifest_ids if manifest_ids else None)
-
-    # Compute statistics
-    stats = compute_batch_stats(
-        conversations_files,
-        enriched_files,
-        validation_files,
-        semantic_judgements=semantic_judgements,
-        manifest_source_by_vid=manifest_source_by_vid if manifest_source_by_vid else None,
-    )
-
     # Compare with prior batches
     drift_flags = []
     if args.compare:
-        drift_flags = compare_with_prior_batches(stats, args.batch_id)
+        drift_flags = compare_with_prior_batches(stats, args.batch_id, window=args.compare_window)
 
     # Build report
     report = {
@@ -1127,6 +1529,7 @@ def main() -> None:
     if not args.no_write:
         report_path = batch_reports_dir() / f"batch_{args.batch_id}.json"
         report_path.write_text(json.dumps(report, indent=2))
+        record_batch_snapshot(report, report_path)
         print(f"{LOG_PREFIX} Report saved to: {report_path}")
 
     # Output
@@ -8,6 +8,20 @@ This tool is intentionally conservative:
 - only `READY` videos can move to `REVIEW` when damage metrics exceed candidate thresholds
 
 Use this to compare candidate review thresholds before changing pipeline policy.
+
+Rows are loaded once into numpy columns and the whole candidate grid is evaluated in a
+single sorted-threshold sweep: each READY row is binned by the first candidate index on
+each axis that would still keep it READY, and a 3-D cumulative sum of that histogram
+gives the stay-READY count for every (vds, dcr, sdcr) cell. Cost is O(rows + grid), so
+dense grids and per-content-type sweeps (--by-content-type) are cheap.
+
+The Pareto frontier trades strictness (lower thresholds) against READY->REVIEW movement:
+a cell is on it unless another cell is at least as strict on every threshold and moves no
+more videos. On dense grids it can hold many cells per movement level, so the printed
+report is thinned to the first frontier cell (report order) of at most --frontier-shown
+evenly spaced movement levels, and moved video IDs are listed for those shown cells only.
+A metric that is NaN never satisfies a threshold, so a READY row with one always moves to
+REVIEW.
 """
 
 from __future__ import annotations
@@ -20,6 +34,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class VideoRow:
@@ -31,6 +47,7 @@ class VideoRow:
     damaged_chunk_ratio: float
     severe_damage_chunk_ratio: float
     video_damage_score: float
+    content_type: str = "unknown"
 
 
 @dataclass(frozen=True)
@@ -41,11 +58,19 @@ class Candidate:
 
 
 def _parse_float_list(text: str) -> List[float]:
+    """Comma-separated floats; an item of the form `start:stop:step` expands to an inclusive range."""
     values: List[float] = []
     for raw in text.split(","):
         item = raw.strip()
         if not item:
             continue
+        if ":" in item:
+            start, stop, step = (float(part) for part in item.split(":"))
+            if step <= 0:
+                raise ValueError(f"range step must be > 0: {item!r}")
+            count = int(np.floor((stop - start) / step + 1e-9)) + 1
+            values.extend(round(start + n * step, 9) for n in range(max(0, count)))
+            continue
         values.append(float(item))
     return values
 
@@ -94,38 +119,10 @@ def _iter_rows(
                 damaged_chunk_ratio=float(dcr),
                 severe_damage_chunk_ratio=float(sdcr),
                 video_damage_score=float(vds),
+                content_type=str(row.get("content_type") or "unknown"),
             )
 
 
-def _simulate(rows: Sequence[VideoRow], candidate: Candidate) -> Tuple[int, int, int, List[VideoRow]]:
-    ready = 0
-    review = 0
-    blocked = 0
-    moved: List[VideoRow] = []
-
-    for row in rows:
-        if row.status == "BLOCKED":
-            blocked += 1
-            continue
-        if row.status == "REVIEW":
-            review += 1
-            continue
-
-        assert row.status == "READY"
-        needs_review = (
-            row.video_damage_score > candidate.review_video_damage_score
-            or row.damaged_chunk_ratio > candidate.review_damaged_chunk_ratio
-            or row.severe_damage_chunk_ratio > candidate.review_severe_damage_chunk_ratio
-        )
-        if needs_review:
-            review += 1
-            moved.append(row)
-        else:
-            ready += 1
-
-    return ready, review, blocked, moved
-
-
 def _dedupe_latest(rows: Iterable[VideoRow]) -> List[VideoRow]:
     latest: Dict[str, VideoRow] = {}
     for row in rows:
@@ -135,6 +132,199 @@ def _dedupe_latest(rows: Iterable[VideoRow]) -> List[VideoRow]:
     return sorted(latest.values(), key=lambda r: r.video_id)
 
 
+@dataclass(frozen=True)
+class ReadinessColumns:
+    """Deduped readiness rows as parallel numpy columns (row order = video_id order)."""
+
+    video_ids: np.ndarray
+    content_types: np.ndarray
+    status: np.ndarray
+    video_damage_score: np.ndarray
+    damaged_chunk_ratio: np.ndarray
+    severe_damage_chunk_ratio: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[VideoRow]) -> "ReadinessColumns":
+        return cls(
+            video_ids=np.array([r.video_id for r in rows], dtype=object),
+            content_types=np.array([r.content_type for r in rows], dtype=object),
+            status=np.array([r.status for r in rows], dtype=object),
+            video_damage_score=np.array([r.video_damage_score for r in rows], dtype=np.float64),
+            damaged_chunk_ratio=np.array([r.damaged_chunk_ratio for r in rows], dtype=np.float64),
+            severe_damage_chunk_ratio=np.array([r.severe_damage_chunk_ratio for r in rows], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return int(self.video_ids.shape[0])
+
+    def subset(self, mask: np.ndarray) -> "ReadinessColumns":
+        return ReadinessColumns(
+            video_ids=self.video_ids[mask],
+            content_types=self.content_types[mask],
+            status=self.status[mask],
+            video_damage_score=self.video_damage_score[mask],
+            damaged_chunk_ratio=self.damaged_chunk_ratio[mask],
+            severe_damage_chunk_ratio=self.severe_damage_chunk_ratio[mask],
+        )
+
+    def count(self, status: str) -> int:
+        return int(np.count_nonzero(self.status == status))
+
+    def moved_mask(self, candidate: Candidate) -> np.ndarray:
+        """READY rows that `candidate` would move to REVIEW (a NaN metric always does)."""
+        stays = (
+            (self.video_damage_score <= candidate.review_video_damage_score)
+            & (self.damaged_chunk_ratio <= candidate.review_damaged_chunk_ratio)
+            & (self.severe_damage_chunk_ratio <= candidate.review_severe_damage_chunk_ratio)
+        )
+        return (self.status == "READY") & ~stays
+
+
+@dataclass(frozen=True)
+class SweepGrid:
+    """READY->REVIEW counts for every cell of a sorted (vds x dcr x sdcr) candidate grid."""
+
+    vds: np.ndarray
+    dcr: np.ndarray
+    sdcr: np.ndarray
+    moved: np.ndarray
+    ready: int
+    review: int
+    blocked: int
+
+    def candidate(self, i: int, j: int, k: int) -> Candidate:
+        return Candidate(
+            review_video_damage_score=float(self.vds[i]),
+            review_damaged_chunk_ratio=float(self.dcr[j]),
+            review_severe_damage_chunk_ratio=float(self.sdcr[k]),
+        )
+
+    def pareto_mask(self) -> np.ndarray:
+        """
+        Cells no other cell dominates (at least as strict on every threshold, no more moved).
+
+        Movement never decreases as a threshold tightens, so a cell is dominated exactly when
+        some stricter cell moves the same number of videos, and then so does its neighbour
+        one step stricter on some axis. Checking the three neighbours is enough.
+        """
+        keep = np.ones(self.moved.shape, dtype=bool)
+        for axis in range(3):
+            stricter = np.swapaxes(self.moved, 0, axis)[:-1]
+            looser = np.swapaxes(self.moved, 0, axis)[1:]
+            np.swapaxes(keep, 0, axis)[1:] &= stricter > looser
+        return keep
+
+    def thin_mask(self, mask: np.ndarray, limit: int) -> np.ndarray:
+        """
+        Displayed subset of `mask`: the first cell in report order for each of at most
+        `limit` moved counts, spread evenly from the least to the most movement.
+        """
+        first: Dict[int, Tuple[int, int, int]] = {}
+        for cell in self.ordered_cells(mask):
+            first.setdefault(int(self.moved[cell]), cell)
+        levels = sorted(first)
+        if limit > 0 and len(levels) > limit:
+            picks = np.unique(np.linspace(0, len(levels) - 1, num=limit).round().astype(int))
+            levels = [levels[n] for n in picks]
+        keep = np.zeros(self.moved.shape, dtype=bool)
+        for moved in levels:
+            keep[first[moved]] = True
+        return keep
+
+    def ordered_cells(self, mask: Optional[np.ndarray] = None) -> List[Tuple[int, int, int]]:
+        """Cells sorted by (moved, dcr, vds, sdcr), the report order used by main()."""
+        i, j, k = np.indices(self.moved.shape).reshape(3, -1)
+        moved = self.moved.reshape(-1)
+        if mask is not None:
+            flat = mask.reshape(-1)
+            i, j, k, moved = i[flat], j[flat], k[flat], moved[flat]
+        order = np.lexsort((self.sdcr[k], self.vds[i], self.dcr[j], moved))
+        return list(zip(i[order].tolist(), j[order].tolist(), k[order].tolist()))
+
+
+def sweep_grid(
+    columns: ReadinessColumns,
+    vds_candidates: Sequence[float],
+    dcr_candidates: Sequence[float],
+    sdcr_candidates: Sequence[float],
+) -> SweepGrid:
+    """Evaluate every candidate combination in one pass over the rows."""
+    vds = np.unique(np.asarray(vds_candidates, dtype=np.float64))
+    dcr = np.unique(np.asarray(dcr_candidates, dtype=np.float64))
+    sdcr = np.unique(np.asarray(sdcr_candidates, dtype=np.float64))
+
+    ready_mask = columns.status == "READY"
+    # A READY row stays READY at cell (i, j, k) iff every threshold is >= its metric, i.e.
+    # i >= first index whose threshold admits the row (same for j, k). Index len(axis)
+    # means no candidate admits it (NaN sorts last, so NaN metrics land there too); those
+    # rows fall outside the histogram on purpose.
+    first_i = np.searchsorted(vds, columns.video_damage_score[ready_mask], side="left")
+    first_j = np.searchsorted(dcr, columns.damaged_chunk_ratio[ready_mask], side="left")
+    first_k = np.searchsorted(sdcr, columns.severe_damage_chunk_ratio[ready_mask], side="left")
+
+    hist = np.zeros((len(vds) + 1, len(dcr) + 1, len(sdcr) + 1), dtype=np.int64)
+    np.add.at(hist, (first_i, first_j, first_k), 1)
+    stays = hist.cumsum(axis=0).cumsum(axis=1).cumsum(axis=2)[: len(vds), : len(dcr), : len(sdcr)]
+
+    ready = int(np.count_nonzero(ready_mask))
+    return SweepGrid(
+        vds=vds,
+        dcr=dcr,
+        sdcr=sdcr,
+        moved=ready - stays,
+        ready=ready,
+        review=columns.count("REVIEW"),
+        blocked=columns.count("BLOCKED"),
+    )
+
+
+def _grid_results(
+    grid: SweepGrid,
+    columns: ReadinessColumns,
+    mask: Optional[np.ndarray] = None,
+    ids_mask: Optional[np.ndarray] = None,
+) -> List[dict]:
+    """Report rows for the cells in `mask`; moved_video_ids only for cells in `ids_mask`."""
+    results: List[dict] = []
+    for i, j, k in grid.ordered_cells(mask):
+        candidate = grid.candidate(i, j, k)
+        moved = int(grid.moved[i, j, k])
+        row = {
+            "candidate": {
+                "review_video_damage_score": candidate.review_video_damage_score,
+                "review_damaged_chunk_ratio": candidate.review_damaged_chunk_ratio,
+                "review_severe_damage_chunk_ratio": candidate.review_severe_damage_chunk_ratio,
+            },
+            "summary": {
+                "ready": grid.ready - moved,
+                "review": grid.review + moved,
+                "blocked": grid.blocked,
+                "ready_to_review": moved,
+            },
+        }
+        if ids_mask is None or ids_mask[i, j, k]:
+            row["moved_video_ids"] = sorted(columns.video_ids[columns.moved_mask(candidate)].tolist())
+        results.append(row)
+    return results
+
+
+def _print_results(label: str, results: Sequence[dict], top_n: int) -> None:
+    print(f"[calibrate-readiness] {label}:")
+    for row in results:
+        c = row["candidate"]
+        s = row["summary"]
+        print(
+            "  "
+            f"vds={c['review_video_damage_score']:.3f} "
+            f"dcr={c['review_damaged_chunk_ratio']:.3f} "
+            f"sdcr={c['review_severe_damage_chunk_ratio']:.3f} "
+            f"-> READY={s['ready']} REVIEW={s['review']} BLOCKED={s['blocked']} moved={s['ready_to_review']}"
+        )
+        if s["ready_to_review"] > 0 and "moved_video_ids" in row:
+            preview = row["moved_video_ids"][: max(0, int(top_n))]
+            print(f"    moved_ids={','.join(preview)}")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Calibrate readiness review thresholds against historical summaries.")
     parser.add_argument(
@@ -150,28 +340,44 @@ def main() -> None:
     parser.add_argument(
         "--review-video-damage-score-candidates",
         default="0.18,0.16,0.14,0.12",
-        help="Comma-separated candidate values",
+        help="Comma-separated candidate values (start:stop:step ranges allowed)",
     )
     parser.add_argument(
         "--review-damaged-chunk-ratio-candidates",
         default="0.25,0.23,0.22,0.21,0.20",
-        help="Comma-separated candidate values",
+        help="Comma-separated candidate values (start:stop:step ranges allowed)",
     )
     parser.add_argument(
         "--review-severe-damage-chunk-ratio-candidates",
         default="0.40,0.35,0.30",
-        help="Comma-separated candidate values",
+        help="Comma-separated candidate values (start:stop:step ranges allowed)",
     )
     parser.add_argument(
         "--top-n",
         type=int,
         default=20,
-        help="Show top N moved READY->REVIEW videos per candidate",
+        help="Show top N moved READY->REVIEW videos per shown frontier candidate",
     )
     parser.add_argument(
         "--out",
         help="Optional JSON output path for machine-readable candidate results",
     )
+    parser.add_argument(
+        "--frontier-only",
+        action="store_true",
+        help="Print/write only the shown Pareto-frontier candidates (recommended for dense grids)",
+    )
+    parser.add_argument(
+        "--frontier-shown",
+        type=int,
+        default=40,
+        help="Show (and list moved IDs for) at most N frontier movement levels; 0 shows every level",
+    )
+    parser.add_argument(
+        "--by-content-type",
+        action="store_true",
+        help="Also sweep the grid separately per content_type (per-type threshold calibration)",
+    )
     args = parser.parse_args()
 
     rows = _dedupe_latest(
@@ -187,78 +393,64 @@ def main() -> None:
     dcr_candidates = _parse_float_list(args.review_damaged_chunk_ratio_candidates)
     sdcr_candidates = _parse_float_list(args.review_severe_damage_chunk_ratio_candidates)
 
-    baseline_ready = sum(1 for r in rows if r.status == "READY")
-    baseline_review = sum(1 for r in rows if r.status == "REVIEW")
-    baseline_blocked = sum(1 for r in rows if r.status == "BLOCKED")
+    columns = ReadinessColumns.from_rows(rows)
+    grid = sweep_grid(columns, vds_candidates, dcr_candidates, sdcr_candidates)
     print(
-        f"[calibrate-readiness] baseline READY={baseline_ready} REVIEW={baseline_review} BLOCKED={baseline_blocked} rows={len(rows)}"
+        f"[calibrate-readiness] baseline READY={grid.ready} REVIEW={grid.review} BLOCKED={grid.blocked} rows={len(columns)}"
     )
 
-    results: List[dict] = []
-    for vds in vds_candidates:
-        for dcr in dcr_candidates:
-            for sdcr in sdcr_candidates:
-                candidate = Candidate(
-                    review_video_damage_score=vds,
-                    review_damaged_chunk_ratio=dcr,
-                    review_severe_damage_chunk_ratio=sdcr,
-                )
-                ready, review, blocked, moved = _simulate(rows, candidate)
-                moved_ids = sorted({row.video_id for row in moved})
-                results.append(
-                    {
-                        "candidate": {
-                            "review_video_damage_score": vds,
-                            "review_damaged_chunk_ratio": dcr,
-                            "review_severe_damage_chunk_ratio": sdcr,
-                        },
-                        "summary": {
-                            "ready": ready,
-                            "review": review,
-                            "blocked": blocked,
-                            "ready_to_review": len(moved_ids),
-                        },
-                        "moved_video_ids": moved_ids,
-                    }
-                )
-
-    results.sort(
-        key=lambda row: (
-            row["summary"]["ready_to_review"],
-            row["summary"]["review"],
-            row["candidate"]["review_damaged_chunk_ratio"],
-            row["candidate"]["review_video_damage_score"],
-            row["candidate"]["review_severe_damage_chunk_ratio"],
-        )
+    frontier = grid.pareto_mask()
+    shown = grid.thin_mask(frontier, args.frontier_shown)
+    frontier_results = _grid_results(grid, columns, frontier, ids_mask=shown)
+    shown_results = _grid_results(grid, columns, shown)
+    results = shown_results if args.frontier_only else _grid_results(grid, columns, ids_mask=shown)
+    print(
+        f"[calibrate-readiness] grid cells={grid.moved.size} pareto_frontier={len(frontier_results)} "
+        f"shown={len(shown_results)}"
     )
+    if args.frontier_only:
+        _print_results("pareto frontier (first cell per shown READY->REVIEW movement level)", results, args.top_n)
+    else:
+        _print_results("candidate outcomes (sorted by READY->REVIEW movement)", results, args.top_n)
 
-    print("[calibrate-readiness] candidate outcomes (sorted by READY->REVIEW movement):")
-    for row in results:
-        c = row["candidate"]
-        s = row["summary"]
-        print(
-            "  "
-            f"vds={c['review_video_damage_score']:.3f} "
-            f"dcr={c['review_damaged_chunk_ratio']:.3f} "
-            f"sdcr={c['review_severe_damage_chunk_ratio']:.3f} "
-            f"-> READY={s['ready']} REVIEW={s['review']} BLOCKED={s['blocked']} moved={s['ready_to_review']}"
-        )
-        if s["ready_to_review"] > 0:
-            preview = row["moved_video_ids"][: max(0, int(args.top_n))]
-            print(f"    moved_ids={','.join(preview)}")
+    by_content_type: Dict[str, dict] = {}
+    if args.by_content_type:
+        for content_type in sorted(set(columns.content_types.tolist())):
+            sub = columns.subset(columns.content_types == content_type)
+            sub_grid = sweep_grid(sub, vds_candidates, dcr_candidates, sdcr_candidates)
+            sub_pareto = sub_grid.pareto_mask()
+            sub_shown = sub_grid.thin_mask(sub_pareto, args.frontier_shown)
+            sub_frontier = _grid_results(sub_grid, sub, sub_pareto, ids_mask=sub_shown)
+            by_content_type[content_type] = {
+                "baseline": {
+                    "ready": sub_grid.ready,
+                    "review": sub_grid.review,
+                    "blocked": sub_grid.blocked,
+                    "rows": len(sub),
+                },
+                "frontier": sub_frontier,
+            }
+            _print_results(
+                f"content_type={content_type} rows={len(sub)} READY={sub_grid.ready} pareto frontier (shown)",
+                [row for row in sub_frontier if "moved_video_ids" in row],
+                args.top_n,
+            )
 
     if args.out:
         out_path = Path(args.out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_payload = {
             "baseline": {
-                "ready": baseline_ready,
-                "review": baseline_review,
-                "blocked": baseline_blocked,
-                "rows": len(rows),
+                "ready": grid.ready,
+                "review": grid.review,
+                "blocked": grid.blocked,
+                "rows": len(columns),
             },
             "candidates": results,
+            "frontier": frontier_results,
         }
+        if args.by_content_type:
+            out_payload["by_content_type"] = by_content_type
         out_path.write_text(json.dumps(out_payload, indent=2) + "\n", encoding="utf-8")
         print(f"[calibrate-readiness] wrote: {out_path}")
 
@@ -16,11 +16,12 @@ from collections import Counter
 import json
 import re
 import statistics
-import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from validator_api import run_validators_json
 
 LOG_PREFIX = "[pipeline-scorecard]"
 
@@ -242,50 +243,6 @@ def _collect_stage_video_ids(stage_key: str) -> Set[str]:
     return ids
 
 
-def _extract_json_payload(raw: str) -> Optional[Dict[str, Any]]:
-    text = (raw or "").strip()
-    if not text:
-        return None
-    try:
-        obj = json.loads(text)
-        return obj if isinstance(obj, dict) else None
-    except Exception:
-        pass
-
-    # Fallback: first complete JSON object in stream.
-    start = text.find("{")
-    if start < 0:
-        return None
-    depth = 0
-    for i in range(start, len(text)):
-        ch = text[i]
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                snippet = text[start : i + 1]
-                try:
-                    obj = json.loads(snippet)
-                except Exception:
-                    return None
-                return obj if isinstance(obj, dict) else None
-    return None
-
-
-def _run_json_command(cmd: Sequence[str]) -> Tuple[Optional[Dict[str, Any]], int, str]:
-    proc = subprocess.run(
-        list(cmd),
-        capture_output=True,
-        text=True,
-    )
-    payload = _extract_json_payload(proc.stdout)
-    if payload is None:
-        payload = _extract_json_payload(proc.stderr)
-    stderr = (proc.stderr or "").strip()
-    return payload, int(proc.returncode), stderr
-
-
 def _load_json(path: Optional[Path]) -> Optional[Dict[str, Any]]:
     if path is None or not path.exists():
         return None
@@ -660,6 +617,7 @@ def build_scorecard(
     source_filter: Optional[str],
     run_id: Optional[str],
     explicit_quarantine_path: Optional[Path],
+    workers: int = 4,
 ) -> Dict[str, Any]:
     entries = load_manifest_entries(manifest_path, source_filter=source_filter)
     manifest_ids = {vid for _, _, vid in entries}
@@ -966,66 +924,38 @@ def build_scorecard(
             if readiness_by_vid[vid] != canonical_by_vid[vid]:
                 decision_mismatch_count += 1
 
-    # Validator-backed quality metrics
-    validation_dir = repo_root() / "scripts" / "training-data" / "validation"
+    # Validator-backed quality metrics (run in-process; independent, so fanned out)
     source_args = ["--source", source_filter] if source_filter else []
+    validator_calls: List[Tuple[str, List[str]]] = [
+        ("validate_cross_stage", ["--manifest", str(manifest_path), *source_args]),
+        ("validate_manifest", ["--manifest", str(manifest_path), *source_args]),
+        ("validate_chunks", ["--manifest", str(manifest_path), *source_args]),
+    ]
+    if stage_reports_dir and stage_reports_dir.exists():
+        validator_calls.append(
+            (
+                "validate_stage_report",
+                ["--dir", str(stage_reports_dir), "--manifest", str(manifest_path), *source_args],
+            )
+        )
+    validator_results = run_validators_json(validator_calls, workers=workers)
+    cross_data, manifest_data, chunks_data = (r[0] for r in validator_results[:3])
 
-    cross_data, _, _ = _run_json_command(
-        [
-            sys.executable,
-            str(validation_dir / "validate_cross_stage.py"),
-            "--manifest",
-            str(manifest_path),
-            *source_args,
-            "--json",
-        ]
-    )
     cross_summary = cross_data.get("summary", {}) if isinstance(cross_data, dict) else {}
     cross_total = int(cross_summary.get("total_checks", 0) or 0)
     cross_errors = int(cross_summary.get("errors", 0) or 0)
     cross_stage_error_rate = round((cross_errors / float(cross_total)) if cross_total > 0 else 0.0, 4)
 
-    manifest_data, _, _ = _run_json_command(
-        [
-            sys.executable,
-            str(validation_dir / "validate_manifest.py"),
-            "--manifest",
-            str(manifest_path),
-            *source_args,
-            "--json",
-        ]
-    )
     stage07_val = manifest_data.get("stage07_validation", {}) if isinstance(manifest_data, dict) else {}
     stage07_validation_error_count = int(stage07_val.get("errors", 0) or 0)
     stage07_validation_warning_count = int(stage07_val.get("warnings", 0) or 0)
 
-    chunks_data, _, _ = _run_json_command(
-        [
-            sys.executable,
-            str(validation_dir / "validate_chunks.py"),
-            "--manifest",
-            str(manifest_path),
-            *source_args,
-            "--json",
-        ]
-    )
     chunks_issues = chunks_data.get("issues_summary", {}) if isinstance(chunks_data, dict) else {}
     chunk_validation_error_count = int(chunks_issues.get("errors", 0) or 0)
 
     gate_contract_parse_failures = 0
-    if stage_reports_dir and stage_reports_dir.exists():
-        stage_report_data, _, _ = _run_json_command(
-            [
-                sys.executable,
-                str(validation_dir / "validate_stage_report.py"),
-                "--dir",
-                str(stage_reports_dir),
-                "--manifest",
-                str(manifest_path),
-                *source_args,
-                "--json",
-            ]
-        )
+    if len(validator_results) > 3:
+        stage_report_data = validator_results[3][0]
         if isinstance(stage_report_data, dict):
             issues_summary = stage_report_data.get("issues_summary", {})
             if isinstance(issues_summary, dict):
@@ -1204,6 +1134,12 @@ def parse_args() -> argparse.Namespace:
         type=float,
         help="Alert/fail threshold for readiness_damage.positive_damage_windowless_ratio (0..1).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Worker processes for the in-process validator runs (default: 4; 1 = run sequentially)",
+    )
     parser.add_argument(
         "--fail-on-alerts",
         action="store_true",
@@ -1272,6 +1208,7 @@ def main() -> None:
         source_filter=args.source,
         run_id=args.run_id,
         explicit_quarantine_path=quarantine_path,
+        workers=max(1, int(args.workers)),
     )
     alerts = _apply_alerts(
         scorecard,
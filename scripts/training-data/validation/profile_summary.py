@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Aggregate stage profiles written by --profile (batch/stage_profile.py) across a sub-batch.
+
+Merges every .pstats under the profile directory per stage and ranks functions by
+cumulative (or own) time, with the number of runs each function showed up in. Memory
+snapshots are combined per allocation site (total and worst single-run size) next to
+each stage's peak traced memory.
+
+Usage:
+  python scripts/training-data/validation/profile_summary.py data/validation/profiles/P001.1
+  python scripts/training-data/validation/profile_summary.py data/validation/profiles/P001.1 --stage 07 --top 30
+  python scripts/training-data/validation/profile_summary.py data/validation/profiles/P001.1 --out summary.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pstats
+import statistics
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SORT_KEYS = ("cumulative", "tottime")
+
+FuncKey = Tuple[str, int, str]
+
+
+def _func_label(func: FuncKey) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        return name
+    return f"{Path(filename).name}:{lineno}({name})"
+
+
+def load_runs(profile_dir: Path, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Every *.profile.json under profile_dir (optionally one stage), with its pstats path resolved."""
+    runs: List[Dict[str, Any]] = []
+    for meta_path in sorted(profile_dir.rglob("*.profile.json")):
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if not isinstance(meta, dict) or (stage is not None and meta.get("stage") != stage):
+            continue
+        pstats_name = meta.get("pstats")
+        meta["_pstats_path"] = meta_path.with_name(pstats_name) if pstats_name else None
+        runs.append(meta)
+    return runs
+
+
+def summarize_cpu(runs: List[Dict[str, Any]], top: int, sort: str) -> List[Dict[str, Any]]:
+    totals: Dict[FuncKey, List[float]] = {}
+    run_counts: Dict[FuncKey, int] = defaultdict(int)
+    for run in runs:
+        path = run.get("_pstats_path")
+        if path is None or not Path(path).is_file():
+            continue
+        for func, (_cc, ncalls, tottime, cumtime, _callers) in pstats.Stats(str(path)).stats.items():
+            row = totals.setdefault(func, [0, 0.0, 0.0])
+            row[0] += ncalls
+            row[1] += tottime
+            row[2] += cumtime
+            run_counts[func] += 1
+    index = 2 if sort == "cumulative" else 1
+    ranked = sorted(totals.items(), key=lambda item: item[1][index], reverse=True)[:top]
+    return [
+        {
+            "function": _func_label(func),
+            "ncalls": int(ncalls),
+            "tottime_seconds": round(tottime, 4),
+            "cumtime_seconds": round(cumtime, 4),
+            "runs": run_counts[func],
+        }
+        for func, (ncalls, tottime, cumtime) in ranked
+    ]
+
+
+def summarize_memory(runs: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    sites: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    peaks: List[int] = []
+    for run in runs:
+        memory = run.get("memory")
+        if not isinstance(memory, dict):
+            continue
+        peaks.append(int(memory.get("peak_bytes") or 0))
+        for entry in memory.get("top") or []:
+            key = (str(entry.get("file")), int(entry.get("line") or 0))
+            site = sites.setdefault(key, {"size_bytes": 0, "max_size_bytes": 0, "count": 0, "runs": 0})
+            size = int(entry.get("size_bytes") or 0)
+            site["size_bytes"] += size
+            site["max_size_bytes"] = max(site["max_size_bytes"], size)
+            site["count"] += int(entry.get("count") or 0)
+            site["runs"] += 1
+    ranked = sorted(sites.items(), key=lambda item: item[1]["size_bytes"], reverse=True)[:top]
+    return {
+        "runs": len(peaks),
+        "peak_bytes_max": max(peaks) if peaks else None,
+        "peak_bytes_median": int(statistics.median(peaks)) if peaks else None,
+        "sites": [{"site": f"{Path(file).name}:{line}", "file": file, "line": line, **info} for (file, line), info in ranked],
+    }
+
+
+def summarize(profile_dir: Path, stage: Optional[str], top: int, sort: str) -> Dict[str, Any]:
+    by_stage: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for run in load_runs(profile_dir, stage):
+        by_stage[str(run.get("stage"))].append(run)
+    stages: Dict[str, Any] = {}
+    for stage_key, runs in sorted(by_stage.items()):
+        walls = [float(r.get("wall_seconds") or 0.0) for r in runs]
+        stages[stage_key] = {
+            "runs": len(runs),
+            "videos": len({r.get("label") for r in runs}),
+            "wall_seconds_total": round(sum(walls), 3),
+            "wall_seconds_median": round(statistics.median(walls), 3) if walls else None,
+            "cpu_top": summarize_cpu(runs, top, sort),
+            "memory": summarize_memory(runs, top),
+        }
+    return {"profile_dir": str(profile_dir), "sort": sort, "stages": stages}
+
+
+def _size(value: Optional[int]) -> str:
+    if value is None:
+        return "-"
+    if value < 1024 * 1024:
+        return f"{value / 1024:.1f} KB"
+    return f"{value / (1024 * 1024):.1f} MB"
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    if not summary["stages"]:
+        print(f"No profiles found under {summary['profile_dir']}")
+        return
+    for stage_key, info in summary["stages"].items():
+        print(
+            f"=== Stage {stage_key}: {info['runs']} run(s), {info['videos']} label(s), "
+            f"wall {info['wall_seconds_total']:.1f}s total / {info['wall_seconds_median']:.2f}s median ==="
+        )
+        if info["cpu_top"]:
+            print(f"  {'cumtime':>10} {'tottime':>10} {'ncalls':>10} {'runs':>5}  function")
+            for row in info["cpu_top"]:
+                print(
+                    f"  {row['cumtime_seconds']:>10.3f} {row['tottime_seconds']:>10.3f} "
+                    f"{row['ncalls']:>10} {row['runs']:>5}  {row['function']}"
+                )
+        memory = info["memory"]
+        if memory["runs"]:
+            print(
+                f"  memory: peak {_size(memory['peak_bytes_max'])} max / {_size(memory['peak_bytes_median'])} median "
+                f"over {memory['runs']} run(s)"
+            )
+            for site in memory["sites"]:
+                print(f"  {_size(site['size_bytes']):>10} {_size(site['max_size_bytes']):>10} {site['runs']:>5}  {site['site']}")
+        print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate per-video stage profiles across a sub-batch.")
+    parser.add_argument("profile_dir", help="Profile directory (e.g. data/validation/profiles/P001.1)")
+    parser.add_argument("--stage", help="Only summarise one stage (e.g. 07, validate_manifest)")
+    parser.add_argument("--top", type=int, default=20, help="Functions / allocation sites to show per stage")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="cumulative", help="CPU ranking (default: cumulative)")
+    parser.add_argument("--out", help="Optional JSON output path")
+    args = parser.parse_args()
+
+    summary = summarize(Path(args.profile_dir), args.stage, max(1, args.top), args.sort)
+    print_summary(summary)
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        print(f"Wrote: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
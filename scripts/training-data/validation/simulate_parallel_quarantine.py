@@ -16,7 +16,6 @@ import argparse
 import json
 import os
 import re
-import subprocess
 import sys
 import tempfile
 import time
@@ -29,6 +28,7 @@ if str(BATCH_DIR) not in sys.path:
     sys.path.insert(0, str(BATCH_DIR))
 
 from quarantine_updater import extract_from_cross_stage_or_chunks, merge_quarantine
+from validator_api import run_validators_json
 
 VIDEO_ID_RE = re.compile(r"\[([A-Za-z0-9_-]{11})\]")
 
@@ -55,43 +55,6 @@ def _load_manifest_entries(manifest_path: Path) -> List[Tuple[str, str, str]]:
     return out
 
 
-def _extract_json_payload(raw: str) -> Optional[Dict[str, Any]]:
-    text = (raw or "").strip()
-    if not text:
-        return None
-    try:
-        data = json.loads(text)
-        return data if isinstance(data, dict) else None
-    except Exception:
-        pass
-    start = text.find("{")
-    if start < 0:
-        return None
-    depth = 0
-    for idx in range(start, len(text)):
-        ch = text[idx]
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                snippet = text[start : idx + 1]
-                try:
-                    data = json.loads(snippet)
-                except Exception:
-                    return None
-                return data if isinstance(data, dict) else None
-    return None
-
-
-def _run_validator(cmd: List[str]) -> Optional[Dict[str, Any]]:
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    payload = _extract_json_payload(proc.stdout)
-    if payload is None:
-        payload = _extract_json_payload(proc.stderr)
-    return payload
-
-
 def _check_06b_reject(video_id: str, source: str) -> bool:
     root = repo_root() / "data" / "06b.LLM.verify"
     verify_dir = root / source
@@ -149,11 +112,8 @@ def _index_videos(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     return out
 
 
-def simulate(manifest_path: Path, validator_scope: str) -> Dict[str, Any]:
+def simulate(manifest_path: Path, validator_scope: str, workers: int = 1) -> Dict[str, Any]:
     entries = _load_manifest_entries(manifest_path)
-    root = repo_root()
-    py = sys.executable
-    validation_dir = root / "scripts" / "training-data" / "validation"
 
     quarantine = _empty_quarantine()
     temp_files_used = 0
@@ -164,34 +124,48 @@ def simulate(manifest_path: Path, validator_scope: str) -> Dict[str, Any]:
     chunk_rows_full: Dict[str, Dict[str, Any]] = {}
 
     if validator_scope == "full":
-        cross_payload = _run_validator(
+        (cross_payload, _, _), (chunks_payload, _, _) = run_validators_json(
             [
-                py,
-                str(validation_dir / "validate_cross_stage.py"),
-                "--manifest",
-                str(manifest_path),
-                "--json",
-            ]
+                ("validate_cross_stage", ["--manifest", str(manifest_path)]),
+                ("validate_chunks", ["--manifest", str(manifest_path)]),
+            ],
+            workers=workers,
         )
         if isinstance(cross_payload, dict):
             ids, rows = extract_from_cross_stage_or_chunks(cross_payload, stage_label="07")
             cross_ids_full = ids
             cross_rows_full = _index_videos(rows)
 
-        chunks_payload = _run_validator(
-            [
-                py,
-                str(validation_dir / "validate_chunks.py"),
-                "--manifest",
-                str(manifest_path),
-                "--json",
-            ]
-        )
         if isinstance(chunks_payload, dict):
             ids, rows = extract_from_cross_stage_or_chunks(chunks_payload, stage_label="09")
             chunk_ids_full = ids
             chunk_rows_full = _index_videos(rows)
 
+    # Per-video scope: one temp manifest per video, validators run across the worker pool,
+    # results merged below in manifest order.
+    per_video_payloads: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = {}
+    tmp_manifests: List[str] = []
+    try:
+        if validator_scope != "full":
+            calls: List[Tuple[str, List[str]]] = []
+            for source, folder, video_id in entries:
+                fd, tmp_manifest = tempfile.mkstemp(prefix=f"sim_{video_id}_", suffix=".txt")
+                tmp_manifests.append(tmp_manifest)
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    handle.write(f"{source} | {folder}\n")
+                temp_files_used += 1
+                calls.append(("validate_cross_stage", ["--manifest", tmp_manifest]))
+                calls.append(("validate_chunks", ["--manifest", tmp_manifest]))
+            results = run_validators_json(calls, workers=workers)
+            for i, (_, _, video_id) in enumerate(entries):
+                per_video_payloads[video_id] = (results[2 * i][0], results[2 * i + 1][0])
+    finally:
+        for tmp_manifest in tmp_manifests:
+            try:
+                Path(tmp_manifest).unlink(missing_ok=True)
+            except Exception:
+                pass
+
     for source, folder, video_id in entries:
         if _check_06b_reject(video_id, source):
             quarantine = _add_manual_reason(
@@ -212,44 +186,16 @@ def simulate(manifest_path: Path, validator_scope: str) -> Dict[str, Any]:
                     quarantine = merge_quarantine(quarantine, {video_id}, [row])
             continue
 
-        fd, tmp_manifest = tempfile.mkstemp(prefix=f"sim_{video_id}_", suffix=".txt")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                handle.write(f"{source} | {folder}\n")
-            temp_files_used += 1
-
-            cross_payload = _run_validator(
-                [
-                    py,
-                    str(validation_dir / "validate_cross_stage.py"),
-                    "--manifest",
-                    tmp_manifest,
-                    "--json",
-                ]
-            )
-            if isinstance(cross_payload, dict):
-                ids, videos = extract_from_cross_stage_or_chunks(cross_payload, stage_label="07")
-                if ids:
-                    quarantine = merge_quarantine(quarantine, ids, videos)
-
-            chunks_payload = _run_validator(
-                [
-                    py,
-                    str(validation_dir / "validate_chunks.py"),
-                    "--manifest",
-                    tmp_manifest,
-                    "--json",
-                ]
-            )
-            if isinstance(chunks_payload, dict):
-                ids, videos = extract_from_cross_stage_or_chunks(chunks_payload, stage_label="09")
-                if ids:
-                    quarantine = merge_quarantine(quarantine, ids, videos)
-        finally:
-            try:
-                Path(tmp_manifest).unlink(missing_ok=True)
-            except Exception:
-                pass
+        cross_payload, chunks_payload = per_video_payloads.get(video_id, (None, None))
+        if isinstance(cross_payload, dict):
+            ids, videos = extract_from_cross_stage_or_chunks(cross_payload, stage_label="07")
+            if ids:
+                quarantine = merge_quarantine(quarantine, ids, videos)
+
+        if isinstance(chunks_payload, dict):
+            ids, videos = extract_from_cross_stage_or_chunks(chunks_payload, stage_label="09")
+            if ids:
+                quarantine = merge_quarantine(quarantine, ids, videos)
 
     quarantine["generated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     quarantine["meta"] = {
@@ -272,6 +218,12 @@ def parse_args() -> argparse.Namespace:
         default="full",
         help="Validation scope used by stage07/09 checks (default: full).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Worker processes for the in-process validator runs (default: 4; 1 = run sequentially).",
+    )
     return parser.parse_args()
 
 
@@ -288,7 +240,11 @@ def main() -> None:
         out_path = repo_root() / out_path
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    quarantine = simulate(manifest_path, validator_scope=args.validator_scope)
+    quarantine = simulate(
+        manifest_path,
+        validator_scope=args.validator_scope,
+        workers=max(1, int(args.workers)),
+    )
     out_path.write_text(json.dumps(quarantine, indent=2) + "\n", encoding="utf-8")
     print(
         json.dumps(
@@ -27,7 +27,7 @@ import sys
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 LOG_PREFIX = "[validate-chunks]"
 
@@ -331,7 +331,11 @@ def validate_chunks_file(path: Path) -> Tuple[Optional[str], Optional[str], List
     return src, vid, issues, stats
 
 
-def main() -> None:
+def main(
+    argv: Optional[Sequence[str]] = None,
+    *,
+    on_report: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
     parser = argparse.ArgumentParser(description="Validate Stage 09 chunk files (deterministic, read-only).")
     parser.add_argument("--source", help="Only validate one source (data/09.EXT.chunks/<source>/)")
     parser.add_argument("--manifest", help="Only validate videos in this manifest (docs/pipeline/batches/*.txt)")
@@ -340,7 +344,7 @@ def main() -> None:
     parser.add_argument("--json", action="store_true", help="Output JSON report (stdout)")
     parser.add_argument("--show", type=int, default=30, help="Max issue lines to print in text mode")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     chunks_root = repo_root() / "data" / "09.EXT.chunks"
     target_video_id: Optional[str] = None
@@ -464,7 +468,10 @@ def main() -> None:
     }
 
     if args.json:
-        print(json.dumps(report, indent=2))
+        if on_report is not None:
+            on_report(report)
+        else:
+            print(json.dumps(report, indent=2))
     else:
         print(f"{LOG_PREFIX} Files processed: {processed}")
         print(f"{LOG_PREFIX} Issues: errors={errors}, warnings={warnings}")
@@ -489,4 +496,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from batch.stage_profile import enable_stage_profiling
+
+    enable_stage_profiling("validate_chunks")
     main()
@@ -330,4 +330,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from batch.stage_profile import enable_stage_profiling
+
+    enable_stage_profiling("validate_confidence_trace")
     main()
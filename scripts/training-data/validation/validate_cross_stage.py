@@ -36,7 +36,7 @@ import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Iterable, Set
+from typing import Any, Dict, List, Optional, Tuple, Iterable, Set, Callable, Sequence
 
 LOG_PREFIX = "[cross-stage]"
 
@@ -500,7 +500,11 @@ def _find_video_artifacts(root: Path, video_id: str, suffix: str) -> List[Path]:
     return sorted(root.rglob(f"*{video_id}*{suffix}"))
 
 
-def main() -> None:
+def main(
+    argv: Optional[Sequence[str]] = None,
+    *,
+    on_report: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
     parser = argparse.ArgumentParser(description="Cross-stage validation between Stage 06c and 07")
     parser.add_argument("--s06", help="Stage 06c output file (conversations.json)")
     parser.add_argument("--s07", help="Stage 07 output file (enriched.json)")
@@ -509,7 +513,7 @@ def main() -> None:
     parser.add_argument("--all", action="store_true", help="Validate all sources")
     parser.add_argument("--json", action="store_true", help="Output JSON report")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     all_results: List[ValidationResult] = []
 
@@ -703,7 +707,10 @@ def main() -> None:
             },
             "results": [r.to_dict() for r in all_results if r.severity != "info"],
         }
-        print(json.dumps(report, indent=2))
+        if on_report is not None:
+            on_report(report)
+        else:
+            print(json.dumps(report, indent=2))
     else:
         for r in all_results:
             if r.severity == "error":
@@ -720,4 +727,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from batch.stage_profile import enable_stage_profiling
+
+    enable_stage_profiling("validate_cross_stage")
     main()
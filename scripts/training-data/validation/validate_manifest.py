@@ -27,7 +27,7 @@ from collections import Counter, defaultdict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import validate_cross_stage
 
@@ -1490,7 +1490,11 @@ def _default_gate_path(manifest_path: Path, source_filter: Optional[str]) -> Pat
     return repo_root() / "data" / "validation" / "gates" / f"{name}.gate.json"
 
 
-def main() -> None:
+def main(
+    argv: Optional[Sequence[str]] = None,
+    *,
+    on_report: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
     parser = argparse.ArgumentParser(description="Manifest validation harness (06b/06c/07 cross-stage)")
     parser.add_argument("--manifest", required=True, help="Batch/sub-batch manifest file (docs/pipeline/batches/*.txt)")
     parser.add_argument("--source", help="Only validate one source within the manifest")
@@ -1606,7 +1610,7 @@ def main() -> None:
     parser.add_argument("--json", action="store_true", help="Output JSON report (stdout)")
     parser.add_argument("--show", type=int, default=30, help="Max issue lines to print in text mode")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     emit_quarantine = bool(args.emit_quarantine or args.quarantine_out)
     emit_canonical_gate = bool(args.emit_canonical_gate or args.canonical_gate_out)
 
@@ -3413,7 +3417,10 @@ def main() -> None:
             sys.exit(2)
 
     if args.json:
-        print(json.dumps(report, indent=2))
+        if on_report is not None:
+            on_report(report)
+        else:
+            print(json.dumps(report, indent=2))
     else:
         print(f"{LOG_PREFIX} Manifest: {manifest_path}")
         print(f"{LOG_PREFIX} Videos: {len(manifest_ids)}")
@@ -3555,4 +3562,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from batch.stage_profile import enable_stage_profiling
+
+    enable_stage_profiling("validate_manifest")
     main()
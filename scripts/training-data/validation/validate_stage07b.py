@@ -18,7 +18,7 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 try:
     import jsonschema  # type: ignore
@@ -187,14 +187,18 @@ def _canonical_issue(
     return row
 
 
-def main() -> None:
+def main(
+    argv: Optional[Sequence[str]] = None,
+    *,
+    on_report: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
     parser = argparse.ArgumentParser(description="Validate Stage 07b enrichment-verify artifacts")
     parser.add_argument("--manifest", help="Manifest file path")
     parser.add_argument("--video-id", help="Validate one video ID directly (requires --source)")
     parser.add_argument("--source", help="Source filter within manifest")
     parser.add_argument("--quarantine-file", help="Quarantine JSON path to exclude pre-quarantined videos")
     parser.add_argument("--json", action="store_true", help="Emit JSON output")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     manifest_path: Optional[Path] = None
     entries: List[Tuple[str, str]] = []
@@ -368,7 +372,10 @@ def main() -> None:
     payload = {"summary": summary, "issues": issues}
 
     if args.json:
-        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        if on_report is not None:
+            on_report(payload)
+        else:
+            print(json.dumps(payload, indent=2, ensure_ascii=False))
     else:
         if manifest_path:
             print(f"{LOG_PREFIX} Manifest: {manifest_path}")
@@ -385,4 +392,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from batch.stage_profile import enable_stage_profiling
+
+    enable_stage_profiling("validate_stage07b")
     main()
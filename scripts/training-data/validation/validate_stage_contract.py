@@ -6,6 +6,10 @@ Deterministic preflight validator for stage dependency contracts.
 
 Given a manifest scope and a target stage, this script verifies that all
 required upstream artifacts exist for non-quarantined videos.
+
+StageContractPreflight answers the same question in-process for one video at
+a time (pipeline-runner asks before every stage) without re-scanning upstream
+artifact trees or re-reading the quarantine file on every call.
 """
 
 from __future__ import annotations
@@ -14,8 +18,10 @@ import argparse
 import json
 import re
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 LOG_PREFIX = "[validate-stage-contract]"
 
@@ -24,6 +30,10 @@ BRACKET_VIDEO_ID_RE = re.compile(r"\[([A-Za-z0-9_-]{11})\]")
 CHUNKS_BASENAME_VIDEO_ID_RE = re.compile(r"^([A-Za-z0-9_-]{11})\.chunks\.json$")
 
 STAGE_ARTIFACTS: Dict[str, Tuple[str, str, bool]] = {
+    "01": ("01.download", "*.wav", False),
+    "02": ("02.EXT.transcribe", "*.full.json", False),
+    "03": ("03.EXT.align", "*.full.json", False),
+    "04": ("04.EXT.diarize", "*.full.json", False),
     # Stage 06 only consumes canonical clean16k feature artifacts.
     "05": ("05.EXT.audio-features", "*.audio.asr.clean16k.audio_features.json", False),
     "06": ("06.LLM.video-type", "*.conversations.json", False),
@@ -41,6 +51,10 @@ STAGE_ARTIFACTS: Dict[str, Tuple[str, str, bool]] = {
 }
 
 STAGE_DEPENDENCIES: Dict[str, List[str]] = {
+    "02": ["01"],
+    "03": ["02"],
+    "04": ["03"],
+    "05": ["04"],
     "06": ["05"],
     "06b": ["06"],
     "06c": ["06", "06b"],
@@ -206,10 +220,146 @@ def _collect_stage_video_ids(stage: str) -> Set[str]:
     return out
 
 
+def build_contract_report(
+    stage_key: str,
+    *,
+    manifest_ids: Set[str],
+    quarantine_ids: Set[str],
+    quarantine_path: Optional[Path],
+    present_ids_for: Callable[[str, Set[str]], Set[str]],
+) -> Dict[str, Any]:
+    """Dependency rows + summary for `stage_key`; present_ids_for(dep, wanted) supplies artifact ids."""
+    effective_ids = manifest_ids - quarantine_ids
+    dependency_rows: List[Dict[str, Any]] = []
+    failing = False
+    for dep in STAGE_DEPENDENCIES[stage_key]:
+        present_ids = present_ids_for(dep, effective_ids)
+        missing_ids = sorted(effective_ids - present_ids)
+        dependency_rows.append({
+            "stage": dep,
+            "required_count": len(effective_ids),
+            "present_count": len(effective_ids & present_ids),
+            "missing_count": len(missing_ids),
+            "missing_video_ids": missing_ids,
+        })
+        if missing_ids:
+            failing = True
+
+    return {
+        "target_stage": stage_key,
+        "dependencies": dependency_rows,
+        "summary": {
+            "manifest_video_count": len(manifest_ids),
+            "quarantined_video_count": len(manifest_ids & quarantine_ids),
+            "effective_video_count": len(effective_ids),
+            "status": "fail" if failing else "pass",
+        },
+        "inputs": {
+            "quarantine_file": str(quarantine_path) if quarantine_path else None,
+        },
+    }
+
+
+class StageContractPreflight:
+    """
+    Per-run contract preflight shared by every video of a pipeline-runner run.
+
+    Each dependency stage is scanned once and its present-id set is kept in memory;
+    pipeline-runner adds each video as its stage passes (note_present), so later stages
+    normally hit the cache. A query that still finds one of its videos missing triggers
+    a rescan of that dependency unless a scan already started after the query did, so
+    concurrent misses share one rescan. Scans run outside the lock, which only guards
+    the cache, and a scan of one dependency never blocks queries on another. A miss
+    after a fresh scan fails exactly as the subprocess validator would. The quarantine
+    file is re-read only when its mtime or size changes. Thread-safe; callers may use
+    asyncio.to_thread.
+    """
+
+    def __init__(self, quarantine_path: Optional[Path] = None):
+        self.quarantine_path = quarantine_path
+        self._lock = threading.Lock()
+        self._scan_done = threading.Condition(self._lock)
+        self._scanning: Set[str] = set()
+        self._present: Dict[str, Set[str]] = {}
+        self._noted: Dict[str, Set[str]] = {}
+        self._scanned_at: Dict[str, float] = {}
+        self._quarantine_stamp: Optional[Tuple[int, int]] = None
+        self._quarantine_ids: Set[str] = set()
+        self.scans = 0
+
+    def _current_quarantine_ids(self) -> Set[str]:
+        if self.quarantine_path is None:
+            return set()
+        try:
+            st = self.quarantine_path.stat()
+        except OSError:
+            self._quarantine_stamp = None
+            self._quarantine_ids = set()
+            return self._quarantine_ids
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._quarantine_stamp:
+            self._quarantine_ids = _load_quarantine_ids(self.quarantine_path)
+            self._quarantine_stamp = stamp
+        return self._quarantine_ids
+
+    def note_present(self, stage_key: str, video_id: str) -> None:
+        """Record that `video_id` now has its `stage_key` artifact (written during this run)."""
+        with self._lock:
+            self._noted.setdefault(stage_key, set()).add(video_id)
+            present = self._present.get(stage_key)
+            if present is not None and video_id not in present:
+                # Replaced, not mutated: readers may be iterating the old set.
+                self._present[stage_key] = present | {video_id}
+
+    def _present_ids(self, dep: str, wanted: Set[str], requested_at: float) -> Set[str]:
+        with self._lock:
+            while True:
+                present = self._present.get(dep)
+                fresh = self._scanned_at.get(dep, float("-inf")) >= requested_at
+                if present is not None and (fresh or wanted <= present):
+                    return present
+                if dep not in self._scanning:
+                    break
+                self._scan_done.wait()
+            self._scanning.add(dep)
+            started_at = time.monotonic()
+        present = None
+        try:
+            present = _collect_stage_video_ids(dep)
+        finally:
+            with self._lock:
+                if present is not None:
+                    # Notes made while the scan ran may postdate what it saw.
+                    present |= self._noted.get(dep, set())
+                    self._present[dep] = present
+                    self._scanned_at[dep] = started_at
+                    self.scans += 1
+                self._scanning.discard(dep)
+                self._scan_done.notify_all()
+        return present
+
+    def check(self, stage_key: str, video_ids: Iterable[str]) -> Dict[str, Any]:
+        """Contract report for `video_ids` at `stage_key`; ValueError for an unknown stage."""
+        if stage_key not in STAGE_DEPENDENCIES:
+            raise ValueError(f"Unknown stage '{stage_key}'")
+        requested_at = time.monotonic()
+        manifest_ids = {vid for vid in video_ids if VIDEO_ID_RE.fullmatch(vid)}
+        with self._lock:
+            quarantine_ids = self._current_quarantine_ids()
+            quarantine_path = self.quarantine_path if self._quarantine_stamp else None
+        return build_contract_report(
+            stage_key,
+            manifest_ids=manifest_ids,
+            quarantine_ids=quarantine_ids,
+            quarantine_path=quarantine_path,
+            present_ids_for=lambda dep, wanted: self._present_ids(dep, wanted, requested_at),
+        )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Validate stage dependency contract for manifest scope.")
     parser.add_argument("--manifest", required=True, help="Batch/sub-batch manifest path.")
-    parser.add_argument("--stage", required=True, help="Target stage key (06, 06b, 06c, ..., 09).")
+    parser.add_argument("--stage", required=True, help="Target stage key (02, 03, ..., 06, 06b, 06c, ..., 09).")
     parser.add_argument("--source", help="Optional source filter within the manifest.")
     parser.add_argument("--quarantine-file", help="Optional quarantine JSON path.")
     parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON.")
@@ -245,38 +395,20 @@ def main() -> None:
     )
     effective_ids = manifest_ids - quarantine_ids
 
-    dependencies = STAGE_DEPENDENCIES[stage_key]
-    dependency_rows: List[Dict[str, Any]] = []
-    failing = False
-    for dep in dependencies:
-        present_ids = _collect_stage_video_ids(dep)
-        missing_ids = sorted(effective_ids - present_ids)
-        row = {
-            "stage": dep,
-            "required_count": len(effective_ids),
-            "present_count": len(effective_ids & present_ids),
-            "missing_count": len(missing_ids),
-            "missing_video_ids": missing_ids,
-        }
-        dependency_rows.append(row)
-        if missing_ids:
-            failing = True
-
     payload = {
         "manifest": str(manifest_path),
         "source_filter": args.source,
-        "target_stage": stage_key,
-        "dependencies": dependency_rows,
-        "summary": {
-            "manifest_video_count": len(manifest_ids),
-            "quarantined_video_count": len(manifest_ids & quarantine_ids),
-            "effective_video_count": len(effective_ids),
-            "status": "fail" if failing else "pass",
-        },
-        "inputs": {
-            "quarantine_file": str(quarantine_path) if quarantine_path else None,
-        },
+        **build_contract_report(
+            stage_key,
+            manifest_ids=manifest_ids,
+            quarantine_ids=quarantine_ids,
+            quarantine_path=quarantine_path,
+            present_ids_for=lambda dep, _wanted: _collect_stage_video_ids(dep),
+        ),
     }
+    dependencies = STAGE_DEPENDENCIES[stage_key]
+    dependency_rows = payload["dependencies"]
+    failing = payload["summary"]["status"] == "fail"
 
     if args.json:
         print(json.dumps(payload, indent=2))
@@ -309,4 +441,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from batch.stage_profile import enable_stage_profiling
+
+    enable_stage_profiling("validate_stage_contract")
     main()
@@ -21,7 +21,7 @@ import time
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 LOG_PREFIX = "[validate-stage-report]"
 VIDEO_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
@@ -1624,7 +1624,11 @@ def _compute_readiness(
     }
 
 
-def main() -> None:
+def main(
+    argv: Optional[Sequence[str]] = None,
+    *,
+    on_report: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
     parser = argparse.ArgumentParser(description="Validate stage report files (deterministic, no external deps).")
     parser.add_argument("--file", action="append", help="Path to a stage report JSON file (repeatable)")
     parser.add_argument("--dir", help="Directory to scan recursively for report files")
@@ -1812,7 +1816,7 @@ def main() -> None:
     )
     parser.add_argument("--json", action="store_true", help="Output JSON report")
     parser.add_argument("--show", type=int, default=40, help="Max issue lines in text mode")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     if args.canonical_gate_out and not args.emit_canonical_gate:
         args.emit_canonical_gate = True
 
@@ -2295,7 +2299,10 @@ def main() -> None:
     }
 
     if args.json:
-        print(json.dumps(report, indent=2))
+        if on_report is not None:
+            on_report(report)
+        else:
+            print(json.dumps(report, indent=2))
     else:
         print(f"{LOG_PREFIX} Files validated: {validated}")
         print(f"{LOG_PREFIX} Unreadable files: {unreadable}")
@@ -2377,4 +2384,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from batch.stage_profile import enable_stage_profiling
+
+    enable_stage_profiling("validate_stage_report")
     main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+scripts/training-data/validation/validator_api.py
+
+In-process invocation of the JSON-emitting validators.
+
+Audit tools used to spawn `python3 validate_*.py ... --json` and scrape the report
+out of stdout. Each validator's main() accepts argv and an on_report callback, so the
+same CLI contract can run inside the caller's interpreter:
+
+    report, exit_code, stderr = run_validator_json("validate_chunks", ["--manifest", m])
+
+run_validators_json() fans a list of such calls out over a process pool and returns
+results in call order, so callers can merge them deterministically.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+VALIDATION_DIR = Path(__file__).resolve().parent
+if str(VALIDATION_DIR) not in sys.path:
+    sys.path.insert(0, str(VALIDATION_DIR))
+
+VALIDATORS = (
+    "validate_chunks",
+    "validate_cross_stage",
+    "validate_manifest",
+    "validate_stage07b",
+    "validate_stage_report",
+)
+
+ValidatorResult = Tuple[Optional[Dict[str, Any]], int, str]
+
+
+def run_validator_json(name: str, argv: Sequence[str]) -> ValidatorResult:
+    """Run `<name>.py ARGV --json` in-process.
+
+    Returns (report, exit_code, stderr) like the old subprocess helpers: report is None
+    when the validator exits without emitting one (bad arguments, empty scope).
+    Text the validator prints is captured rather than mixed into the caller's stdout.
+    """
+    if name not in VALIDATORS:
+        raise ValueError(f"Unknown validator: {name}")
+    module = importlib.import_module(name)
+
+    reports: List[Dict[str, Any]] = []
+    out, err = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            module.main([*argv, "--json"], on_report=reports.append)
+        except SystemExit as exc:
+            if exc.code is None:
+                exit_code = 0
+            elif isinstance(exc.code, int):
+                exit_code = exc.code
+            else:
+                print(exc.code, file=sys.stderr)
+                exit_code = 1
+        except Exception as exc:
+            print(f"{name}: {type(exc).__name__}: {exc}", file=sys.stderr)
+            exit_code = 1
+    return (reports[0] if reports else None), exit_code, err.getvalue().strip()
+
+
+def run_validators_json(
+    calls: Sequence[Tuple[str, Sequence[str]]],
+    workers: int = 1,
+) -> List[ValidatorResult]:
+    """run_validator_json for each (name, argv), in worker processes when workers > 1."""
+    if workers <= 1 or len(calls) <= 1:
+        return [run_validator_json(name, argv) for name, argv in calls]
+    with ProcessPoolExecutor(max_workers=min(workers, len(calls))) as pool:
+        futures = [pool.submit(run_validator_json, name, list(argv)) for name, argv in calls]
+        return [f.result() for f in futures]
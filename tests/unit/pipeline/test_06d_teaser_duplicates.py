@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Tests for Stage 06d teaser duplicate detection (hash-indexed early/late matching)."""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import random
+import sys
+import types
+import unittest
+from pathlib import Path
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+_module_path = _SCRIPTS_DIR / "06d.DET.sanitize"
+_loader = importlib.machinery.SourceFileLoader("stage_06d", str(_module_path))
+stage_06d = types.ModuleType("stage_06d")
+stage_06d.__file__ = str(_module_path)
+stage_06d.__spec__ = importlib.util.spec_from_loader("stage_06d", loader=_loader)
+_loader.exec_module(stage_06d)
+
+_PHRASES = [
+    "hey how are you",
+    "what is your name",
+    "i like your style",
+    "so where are you from",
+    "ok",
+    "that's cool man",
+    "and then she said no",
+]
+
+
+def _segments(texts):
+    return [{"id": i * 2, "text": t} for i, t in enumerate(texts)]
+
+
+def _body(n: int, seed: int):
+    rng = random.Random(seed)
+    return [f"{rng.choice(_PHRASES)} line {i}" for i in range(n)]
+
+
+class TestTeaserDuplicates(unittest.TestCase):
+    def test_intro_teaser_with_merged_tail_is_extended(self) -> None:
+        body = _body(60, 1)
+        texts = body[30:34] + [f"{body[34]} {body[35]}"] + body
+        runs, early_ids, early_to_later = stage_06d._detect_teaser_duplicates(_segments(texts))
+
+        self.assertEqual(runs, [{
+            "early_start_segment_id": 0,
+            "early_end_segment_id": 8,
+            "later_start_segment_id": 70,
+            "later_end_segment_id": 80,
+        }])
+        self.assertEqual(early_ids, {0, 2, 4, 6, 8})
+        self.assertEqual(early_to_later, {0: 70, 2: 72, 4: 74, 6: 76, 8: 78})
+
+    def test_auto_scan_limit_finds_teaser_past_first_30_segments(self) -> None:
+        body = _body(120, 3)
+        texts = _body(40, 4) + body[80:86] + body
+        segments = _segments(texts)
+
+        fixed = stage_06d._detect_teaser_duplicates(segments)
+        auto = stage_06d._detect_teaser_duplicates(segments, teaser_scan_limit=None)
+
+        self.assertEqual(fixed, ([], set(), {}))
+        self.assertEqual(len(auto[0]), 1)
+        self.assertEqual(auto[0][0]["early_start_segment_id"], 80)
+        self.assertEqual(auto[0][0]["later_start_segment_id"], (46 + 80) * 2)
+        self.assertEqual(len(auto[1]), 6)
+
+    def test_scan_limit_cli_parsing(self) -> None:
+        self.assertIsNone(stage_06d._parse_scan_limit("auto"))
+        self.assertEqual(stage_06d._parse_scan_limit("45"), 45)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
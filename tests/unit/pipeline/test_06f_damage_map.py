@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for 06f damage-map window expansion and conversation summaries.
+
+Run: .venv/bin/python -m pytest tests/unit/pipeline/test_06f_damage_map.py -v
+"""
+
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+_LOADER = importlib.machinery.SourceFileLoader("stage_06f", str(_SCRIPTS_DIR / "06f.DET.damage-map"))
+_SPEC = importlib.util.spec_from_loader("stage_06f", _LOADER)
+assert _SPEC
+stage_06f = importlib.util.module_from_spec(_SPEC)
+_LOADER.exec_module(stage_06f)
+
+
+def _seg(sid, cid=1, text="one two three", **extra):
+    return {"id": sid, "conversation_id": cid, "text": text, "speaker_role": "coach", **extra}
+
+
+def _build(segments, stage06e=None):
+    return stage_06f.build_damage_map(
+        {"video_id": "abcdefghijk", "segments": segments},
+        stage06e,
+        source_file="in.conversations.json",
+        stage06e_file=None,
+    )
+
+
+class TestContaminationWindow(unittest.TestCase):
+    def test_window_uses_positions_not_id_arithmetic(self):
+        segments = [_seg(sid) for sid in (10, 3, 7, 20, 15, 30, 1)]
+        out = _build(segments, {"transcript_artifacts": [{"segment_index": 15, "artifact_type": "loop"}]})
+        (row,) = out["segments"]
+        # Ordered ids: 1 3 7 10 15 20 30; high severity spans 2 left / 3 right of position 4.
+        self.assertEqual(row["contamination_window"], {"start_segment_id": 7, "end_segment_id": 30})
+
+    def test_duplicate_ids_resolve_to_first_position(self):
+        ordered = [1, 2, 2, 3, 4, 5]
+        positions = stage_06f._segment_positions(ordered)
+        self.assertEqual(positions[2], 1)
+        self.assertEqual(
+            stage_06f._contamination_window(2, ordered, "medium", positions),
+            {"start_segment_id": 1, "end_segment_id": 3},
+        )
+        self.assertEqual(
+            stage_06f._contamination_window(99, ordered, "high", positions),
+            {"start_segment_id": 99, "end_segment_id": 99},
+        )
+
+
+class TestConversationSummaries(unittest.TestCase):
+    def test_damaged_tokens_are_scoped_to_conversation(self):
+        segments = [
+            _seg(1, cid=1, text="a b c d"),
+            _seg(2, cid=1, text="e f", segment_flags=["teaser_duplicate"]),
+            _seg(3, cid=2, text="g h i", segment_flags=["mixed_mode"]),
+            _seg(4, cid=0, text="j", segment_flags=["mixed_mode"]),
+        ]
+        out = _build(segments)
+        summaries = {s["conversation_id"]: s for s in out["conversation_summaries"]}
+        self.assertEqual(sorted(summaries), [1, 2])
+        self.assertEqual(
+            (summaries[1]["token_count"], summaries[1]["damaged_token_count"], summaries[1]["damaged_segment_ids"]),
+            (6, 2, [2]),
+        )
+        self.assertEqual(summaries[1]["damaged_token_ratio"], 0.3333)
+        self.assertEqual(summaries[2]["high_severity_seed_count"], 1)
+        self.assertEqual(out["summary"]["damaged_segments_total"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
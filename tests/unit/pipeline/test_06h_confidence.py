@@ -13,6 +13,9 @@ Run: .venv/bin/python -m pytest tests/unit/pipeline/test_06h_confidence.py -v
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
+import random
 import sys
 import unittest
 from pathlib import Path
@@ -42,6 +45,8 @@ from validation.confidence_model import (
     SPEAKER_AMBIGUITY_MULT_COMPILATION_NO_OVERRIDE,
     SPEAKER_AMBIGUITY_MULT_COMPILATION_WITH_OVERRIDE,
     SPEAKER_AMBIGUITY_MULT_INFIELD,
+    SPEAKER_AMBIGUITY_MULT_INFIELD_TRUSTED_REASSIGN,
+    SPEAKER_AMBIGUITY_MULT_INFIELD_WITH_OVERRIDE,
     SPEAKER_OVERRIDE_FLOOR,
     get_axis_weights,
 )
@@ -773,6 +778,219 @@ class TestDamageMultiplier(unittest.TestCase):
         self.assertAlmostEqual(p, 0.70 * 0.55)
 
 
+def _scalar_damage_multiplier(damage_types, *, video_type, has_speaker_role_override, trusted_reassignment):
+    """Frozen copy of the per-segment multiplier model the array code replaced."""
+    transcript = speaker = phase = 1.0
+    if "transcript_artifact" in damage_types:
+        transcript *= 0.30
+        phase *= 0.70
+    if "low_quality" in damage_types:
+        transcript *= 0.62
+    if "mixed_mode" in damage_types:
+        phase *= 0.55
+    if "speaker_ambiguity" in damage_types:
+        if video_type in ("compilation",):
+            if has_speaker_role_override:
+                speaker *= SPEAKER_AMBIGUITY_MULT_COMPILATION_WITH_OVERRIDE
+            else:
+                speaker *= SPEAKER_AMBIGUITY_MULT_COMPILATION_NO_OVERRIDE
+        elif has_speaker_role_override:
+            if trusted_reassignment:
+                speaker *= SPEAKER_AMBIGUITY_MULT_INFIELD_TRUSTED_REASSIGN
+            else:
+                speaker *= SPEAKER_AMBIGUITY_MULT_INFIELD_WITH_OVERRIDE
+        else:
+            speaker *= SPEAKER_AMBIGUITY_MULT_INFIELD
+    if "boundary_uncertain" in damage_types:
+        phase *= 0.65
+    return transcript, speaker, phase
+
+
+_DAMAGE_TYPES = ("transcript_artifact", "low_quality", "mixed_mode", "speaker_ambiguity", "boundary_uncertain")
+_REFERENCE_TRACES = Path(__file__).resolve().parent / "fixtures" / "06h_scalar_reference.json"
+
+
+def _random_case(seed: int):
+    """Randomized 06d/06f/06g/06e inputs covering overrides, duplicate ids, spans and repairs."""
+    rng = random.Random(seed)
+    n = rng.randint(8, 30)
+    ids = sorted(rng.sample(range(1, 3 * n), n))
+    if rng.random() < 0.3:
+        ids.append(rng.choice(ids))
+    speakers = ["SPEAKER_00", "SPEAKER_01", "SPEAKER_02"]
+    segments = []
+    for sid in ids:
+        seg = _make_segment(
+            sid,
+            speaker_id=rng.choice(speakers),
+            role=rng.choice(["coach", "target", "unknown", "coach"]),
+            segment_type=rng.choice(["approach", "commentary"]),
+            text=f"segment {sid} text",
+            conv_id=1 + sid % 2,
+        )
+        if rng.random() < 0.2:
+            seg["speaker_role_override"] = rng.choice(["coach", "target"])
+            if rng.random() < 0.5:
+                seg["speaker_role_override_confidence"] = round(rng.random(), 2)
+        segments.append(seg)
+    data = _make_06d(
+        segments,
+        video_type=rng.choice(["infield", "compilation", "talking_head"]),
+        speaker_labels={s: {"label": "coach", "confidence": round(rng.uniform(0.4, 1.0), 2)} for s in speakers},
+        transcript_score=rng.randint(40, 95),
+        speaker_collapse=(
+            {"detected": True, "reassignment_rate": round(rng.random(), 2), "unknown_count": rng.randint(0, 6)}
+            if rng.random() < 0.5 else None
+        ),
+    )
+    data["conversations"] = [
+        {"conversation_id": c, "segment_ids": [s["id"] for s in segments if s["conversation_id"] == c]}
+        for c in (1, 2)
+    ]
+    damage_rows = []
+    for sid in rng.sample(ids, rng.randint(0, len(ids))):
+        types = [t for t in _DAMAGE_TYPES if rng.random() < 0.35]
+        damage_rows.append((sid, types, types[:1]))
+    seeds = []
+    for sid in rng.sample(ids, rng.randint(0, max(1, len(ids) // 3))):
+        seed_row = {"seed_segment_id": sid}
+        if rng.random() < 0.2:
+            seed_row["llm_failed"] = True
+        else:
+            seed_row["adjudication"] = {
+                "transcript_confidence": round(rng.random(), 2),
+                "speaker_confidence": round(rng.random(), 2),
+                "phase_confidence": round(rng.random(), 2),
+                "contamination_start_segment_id": rng.choice(ids),
+                "contamination_end_segment_id": rng.choice(ids),
+                "repaired_text": f"repaired {sid}",
+            }
+            seed_row["repair_accepted"] = rng.random() < 0.4
+        seeds.append(seed_row)
+    quality = {
+        "transcript_artifacts": [
+            {"segment_index": sid, "action": rng.choice(["replace", "delete"]),
+             "repair_confidence": round(rng.random(), 2), "repair_text": f"fixed {sid}"}
+            for sid in rng.sample(ids, rng.randint(0, 3))
+        ],
+        "low_quality_segments": [
+            {"segment": sid, "reason": rng.choice(["garbled", "missing punctuation"]),
+             "repair_confidence": round(rng.random(), 2), "repair_text": f"lq {sid}"}
+            for sid in rng.sample(ids, rng.randint(0, 3))
+        ],
+    }
+    return data, _make_damage_map(damage_rows), _make_adjudication(seeds), quality
+
+
+def _trace_digest(result) -> str:
+    """sha256 of the full (output, report) pair with wall-clock stamps removed."""
+    def strip(value):
+        if isinstance(value, dict):
+            return {
+                str(k): strip(v) for k, v in value.items()
+                if k not in ("applied_at", "generated_at", "confidence_propagated_at")
+            }
+        if isinstance(value, (list, tuple)):
+            return [strip(v) for v in value]
+        if isinstance(value, set):
+            return sorted(value)
+        return value
+
+    blob = json.dumps(strip(result), sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class TestVectorizedPropagation(unittest.TestCase):
+    """Row-array propagation must agree with the per-segment scalar model."""
+
+    def test_array_multipliers_match_frozen_scalar_model(self):
+        import itertools
+
+        import numpy as np
+
+        combos = [
+            set(c)
+            for r in range(len(_DAMAGE_TYPES) + 1)
+            for c in itertools.combinations(_DAMAGE_TYPES, r)
+        ]
+        self.assertEqual(tuple(stage_06h.DAMAGE_TYPE_FLAGS), _DAMAGE_TYPES)
+        for video_type, override, trusted in itertools.product(
+            ("infield", "compilation"), (False, True), (False, True)
+        ):
+            arrays = stage_06h._damage_multipliers(
+                *(np.array([name in c for c in combos]) for name in _DAMAGE_TYPES),
+                np.array([override] * len(combos)),
+                video_type=video_type,
+                trusted_reassignment=trusted,
+            )
+            for i, combo in enumerate(combos):
+                expected = _scalar_damage_multiplier(
+                    combo, video_type=video_type,
+                    has_speaker_role_override=override, trusted_reassignment=trusted,
+                )
+                self.assertEqual((arrays[0][i], arrays[1][i], arrays[2][i]), expected, (combo, video_type))
+
+    def test_multiplier_literals(self):
+        cases = [
+            (set(), "infield", False, False, (1.0, 1.0, 1.0)),
+            ({"transcript_artifact", "low_quality"}, "infield", False, False, (0.30 * 0.62, 1.0, 0.70)),
+            ({"mixed_mode", "boundary_uncertain"}, "infield", False, False, (1.0, 1.0, 0.55 * 0.65)),
+            ({"speaker_ambiguity"}, "infield", False, False, (1.0, 0.48, 1.0)),
+            ({"speaker_ambiguity"}, "infield", True, False, (1.0, 0.80, 1.0)),
+            ({"speaker_ambiguity"}, "infield", True, True, (1.0, 0.95, 1.0)),
+            ({"speaker_ambiguity"}, "compilation", False, True, (1.0, 0.65, 1.0)),
+            ({"speaker_ambiguity", "transcript_artifact"}, "compilation", True, False, (0.30, 0.80, 0.70)),
+        ]
+        for damage_types, video_type, override, trusted, expected in cases:
+            got = stage_06h._damage_multiplier(
+                damage_types, video_type=video_type,
+                has_speaker_role_override=override, trusted_reassignment=trusted,
+            )
+            for value, want in zip(got, expected):
+                self.assertAlmostEqual(value, want, places=12, msg=(damage_types, video_type, override, trusted))
+
+    def test_randomized_traces_match_scalar_reference(self):
+        """Digests in fixtures/06h_scalar_reference.json were recorded from the scalar code."""
+        import contextlib
+        import io
+
+        reference = json.loads(_REFERENCE_TRACES.read_text(encoding="utf-8"))
+        for key, digest in sorted(reference.items()):
+            seed, mode = key.split(":")
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                data, damage_map, adjudication, quality = _random_case(int(seed))
+                result = _propagate(
+                    data_06d=data, damage_map=damage_map, adjudication=adjudication,
+                    quality_check=quality, apply_repairs=mode == "repairs",
+                )
+            self.assertEqual(_trace_digest(result), digest, key)
+
+    def test_span_covers_only_existing_ids_in_range(self):
+        segs = [_make_segment(sid) for sid in (1, 2, 5, 9)]
+        data = _make_06d(segs)
+        adj = _make_adjudication([{
+            "seed_segment_id": 2,
+            "adjudication": {
+                "transcript_confidence": 1.0,
+                "speaker_confidence": 0.95,
+                "phase_confidence": 1.0,
+                "contamination_start_segment_id": 6,
+                "contamination_end_segment_id": 0,
+            },
+        }])
+        out, _ = _propagate(data_06d=data, damage_map=None,
+                             adjudication=adj, quality_check=None)
+        trace = out["_penalty_trace_by_seg"]
+        propagated = sorted(
+            sid for sid, entries in trace.items()
+            if any(e["issue_code"] == "contamination_propagation" for e in entries)
+        )
+        self.assertEqual(propagated, [1, 2, 5])
+        by_id = {s["id"]: s for s in out["segments"]}
+        self.assertAlmostEqual(by_id[5]["segment_confidence"]["transcript"], PROPAGATION_PENALTY)
+        self.assertEqual(by_id[9]["segment_confidence"]["transcript"], 1.0)
+
+
 class TestPenaltyTrace(unittest.TestCase):
     """v2.1: Damaged segments should have non-empty penalties in confidence trace."""
 
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Per-batch numeric snapshots backing batch_report.py --compare."""
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "scripts"
+    / "training-data"
+    / "validation"
+    / "batch_report.py"
+)
+_SPEC = importlib.util.spec_from_file_location("batch_report", _MODULE_PATH)
+batch_report = importlib.util.module_from_spec(_SPEC)
+assert _SPEC and _SPEC.loader
+sys.modules["batch_report"] = batch_report
+_SPEC.loader.exec_module(batch_report)
+
+
+def _stats(hook_rate: float, conv_mean: float, techniques: dict) -> dict:
+    return {
+        "stage_06": {"mean_conversations_per_infield": conv_mean, "video_type_distribution": {"infield": 3}},
+        "stage_07": {"hook_rate": hook_rate, "technique_frequency": techniques},
+    }
+
+
+class TestBatchReportSnapshots(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.reports = Path(self._tmp.name)
+        patcher = patch.object(batch_report, "batch_reports_dir", return_value=self.reports)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write_report(self, batch_id: str, stats: dict, generated_at: str, *, snapshot: bool = True) -> Path:
+        report = {"batch_id": batch_id, "generated_at": generated_at, "stats": stats}
+        path = self.reports / f"batch_{batch_id}.json"
+        path.write_text(json.dumps(report))
+        if snapshot:
+            batch_report.record_batch_snapshot(report, path)
+        return path
+
+    def test_legacy_reports_are_backfilled_and_cached(self) -> None:
+        self._write_report("R1", _stats(0.5, 2.0, {"a": 10}), "2026-01-01T00:00:00Z", snapshot=False)
+        self._write_report("R2", _stats(0.6, 3.0, {"a": 5, "b": 5}), "2026-01-02T00:00:00Z", snapshot=False)
+
+        rows = batch_report.sync_batch_snapshots()
+        self.assertEqual([r["batch_id"] for r in rows], ["R1", "R2"])
+        self.assertTrue((self.reports / "snapshots" / "batch_R1.npz").exists())
+
+        with patch.object(batch_report, "_write_snapshot_file", side_effect=AssertionError("rebuilt")):
+            prior = batch_report.load_prior_snapshots("R3")
+        vocab, matrix = prior.histograms["technique_frequency"]
+        self.assertEqual(vocab, ["a", "b"])
+        self.assertEqual(matrix.tolist(), [[10.0, 0.0], [5.0, 5.0]])
+        self.assertEqual(prior.scalar("hook_rate").tolist(), [0.5, 0.6])
+
+    def test_drift_flags_match_report_based_computation(self) -> None:
+        priors = [
+            _stats(0.50, 2.0, {"open": 40, "tease": 10}),
+            _stats(0.52, 2.2, {"open": 38, "tease": 12, "cold_read": 1}),
+            _stats(0.48, 1.8, {"open": 42, "tease": 9}),
+        ]
+        for i, st in enumerate(priors):
+            self._write_report(f"P{i}", st, f"2026-01-0{i + 1}T00:00:00Z")
+        current = _stats(0.9, 6.0, {"cold_read": 50, "open": 2})
+
+        flags = {f["check"]: f for f in batch_report.compare_with_prior_batches(current, "P9")}
+
+        totals: dict = {}
+        for st in priors:
+            for k, v in st["stage_07"]["technique_frequency"].items():
+                totals[k] = totals.get(k, 0) + v
+        expected_chi = batch_report.chi_squared_test(current["stage_07"]["technique_frequency"], totals)
+        self.assertEqual(flags["technique_distribution_drift"]["chi_squared"], round(expected_chi, 2))
+        self.assertEqual(flags["technique_distribution_drift"]["threshold"], 6)
+        self.assertIn("hook_rate_drift", flags)
+        self.assertIn("conversations_per_infield_drift", flags)
+
+    def test_rolling_window_uses_latest_batches_and_skips_current(self) -> None:
+        self._write_report("OLD", _stats(0.1, 1.0, {}), "2026-01-01T00:00:00Z")
+        self._write_report("MID", _stats(0.5, 2.0, {}), "2026-01-02T00:00:00Z")
+        self._write_report("NEW", _stats(0.6, 2.0, {}), "2026-01-03T00:00:00Z")
+        self._write_report("CUR", _stats(0.7, 2.0, {}), "2026-01-04T00:00:00Z")
+
+        prior = batch_report.load_prior_snapshots("CUR", window=2)
+        self.assertEqual(prior.batch_ids, ["MID", "NEW"])
+        self.assertEqual(len(batch_report.load_prior_snapshots("CUR")), 3)
+
+    def test_concurrent_reports_keep_each_others_index_rows(self) -> None:
+        load = batch_report._load_snapshot_index
+
+        def slow_load(snap_dir):
+            rows = load(snap_dir)
+            time.sleep(0.02)  # widen the load -> replace window
+            return rows
+
+        with patch.object(batch_report, "_load_snapshot_index", side_effect=slow_load):
+            threads = [
+                threading.Thread(
+                    target=self._write_report, args=(f"C{i}", _stats(0.5, 2.0, {}), f"2026-01-0{i + 1}T00:00:00Z")
+                )
+                for i in range(6)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        index = json.loads((self.reports / "snapshots" / "index.json").read_text())
+        self.assertEqual([r["batch_id"] for r in index["batches"]], [f"C{i}" for i in range(6)])
+
+    def test_rewritten_and_deleted_reports_refresh_the_index(self) -> None:
+        path = self._write_report("R1", _stats(0.5, 2.0, {"a": 1}), "2026-01-01T00:00:00Z")
+        self._write_report("R2", _stats(0.5, 2.0, {"a": 1}), "2026-01-02T00:00:00Z")
+
+        path.write_text(json.dumps({"batch_id": "R1", "generated_at": "2026-01-01T00:00:00Z",
+                                    "stats": _stats(0.9, 2.0, {"a": 1})}))
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+        (self.reports / "batch_R2.json").unlink()
+
+        prior = batch_report.load_prior_snapshots("X")
+        self.assertEqual(prior.batch_ids, ["R1"])
+        self.assertEqual(prior.scalar("hook_rate").tolist(), [0.9])
+        self.assertFalse((self.reports / "snapshots" / "batch_R2.npz").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Streaming batch_report aggregation must match the in-memory compute_batch_stats."""
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "scripts"
+    / "training-data"
+    / "validation"
+    / "batch_report.py"
+)
+_SPEC = importlib.util.spec_from_file_location("batch_report", _MODULE_PATH)
+batch_report = importlib.util.module_from_spec(_SPEC)
+assert _SPEC and _SPEC.loader
+# Registered so worker processes can unpickle the slice reducer.
+sys.modules["batch_report"] = batch_report
+_SPEC.loader.exec_module(batch_report)
+
+
+def _write(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _vid(i: int) -> str:
+    return f"VID{i:08d}"
+
+
+def _build_tree(root: Path, n: int) -> None:
+    for i in range(n):
+        vid = _vid(i)
+        folder = f"Video {i} [{vid}]"
+        stem = f"{folder}.audio.asr.clean16k"
+        stage06 = "06c.DET.patched" if i % 3 else "06.LLM.video-type"
+        _write(root / "data" / stage06 / "src" / folder / f"{stem}.conversations.json", {
+            "video_id": vid,
+            "video_type": {"type": ["infield", "talking_head", "compilation"][i % 3]},
+            "conversations": [{"conversation_id": c} for c in range(i % 4)],
+            "speaker_labels": {
+                "SPEAKER_00": {"role": "coach"},
+                "SPEAKER_01": {"role": ["student", "unknown", "target"][i % 3]},
+            },
+        })
+        segments = [{"id": s, "conversation_id": 1 + s % 2} for s in range(6)]
+        _write(root / "data" / "07.LLM.content" / "src" / folder / f"{stem}.enriched.json", {
+            "video_id": vid,
+            "source": "src",
+            "metadata": {"normalization_repairs_count": i % 2},
+            "segments": segments,
+            "low_quality_segments": [{"repaired": bool(i % 2)}],
+            "transcript_artifacts": [{}] * (i % 3),
+            "enrichments": [
+                {
+                    "type": "approach",
+                    "conversation_id": cid,
+                    "hook_point": {"segment": 1} if (i + cid) % 2 else None,
+                    "investment_level": ["low", "medium", "high"][(i + cid) % 3],
+                    "techniques_used": [{"technique": f"t{(i * cid) % 5}", "example": "x" * (i + cid)}],
+                    "topics_discussed": [f"topic{(i + cid) % 4}"],
+                    "turn_phases": [{"phase": "open"}, {"phase": ["pre_hook", "post_hook"][cid % 2]}],
+                    "phase_confidence": {"open": 0.1 * (i % 10), "hook": 0.37},
+                    "unlisted_concepts": {"techniques": [f"u{i % 2}"], "topics": []},
+                }
+                for cid in (1, 2)
+            ],
+        })
+        for stage in ("06.LLM.video-type", "07.LLM.content"):
+            _write(root / "data" / stage / "src" / folder / f"{stem}.validation.json", {
+                "video_id": vid,
+                "summary": {"errors": i % 2, "warnings": i % 3},
+                "results": [
+                    {"check": "evidence_mismatch", "severity": "warning"},
+                    {"check": "phase_gap", "severity": "error" if i % 2 else "info"},
+                ],
+            })
+
+
+class TestBatchReportStreaming(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        _build_tree(self.root, 12)
+        self.manifest_ids = {_vid(i) for i in range(12) if i != 5}
+        self.judgements = [
+            {
+                "video_id": _vid(i),
+                "conversation_id": 1,
+                "request_fingerprint": "stale",
+                "scores": {"overall_score_0_100": 70 + i, "technique_accuracy": 4},
+                "flags": {"major_errors": i == 2},
+            }
+            for i in range(4)
+        ]
+        patcher = patch.object(batch_report, "repo_root", return_value=self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _in_memory_stats(self) -> dict:
+        filt = batch_report._filter_by_manifest
+        return batch_report.compute_batch_stats(
+            filt(batch_report.load_conversations_files("src"), self.manifest_ids),
+            filt(batch_report.load_enriched_files("src"), self.manifest_ids),
+            filt(batch_report.load_validation_files("src"), self.manifest_ids),
+            semantic_judgements=self.judgements,
+        )
+
+    def _streamed_stats(self, workers: int) -> dict:
+        return batch_report.compute_batch_stats_from_paths(
+            batch_report.conversations_paths("src"),
+            batch_report.enriched_paths("src"),
+            batch_report.validation_paths("src"),
+            manifest_ids=self.manifest_ids,
+            semantic_judgements=self.judgements,
+            workers=workers,
+        )
+
+    def test_streamed_serial_matches_in_memory(self) -> None:
+        expected = self._in_memory_stats()
+        self.assertEqual(expected["stage_06"]["videos_processed"], 11)
+        self.assertEqual(json.dumps(self._streamed_stats(1)), json.dumps(expected))
+
+    def test_parallel_partials_merge_to_serial_result(self) -> None:
+        self.assertEqual(json.dumps(self._streamed_stats(3)), json.dumps(self._streamed_stats(1)))
+
+    def test_semantic_requests_limited_to_judged_conversations(self) -> None:
+        acc = batch_report.BatchStatsAccumulator(semantic_keys={(_vid(0), 1)})
+        for data in batch_report.iter_artifacts(batch_report.enriched_paths("src")):
+            acc.add_enriched(data)
+        self.assertEqual(list(acc.semantic_requests), [(_vid(0), 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Sorted-threshold sweep in validation/calibrate_readiness_thresholds.py."""
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import io
+import itertools
+import json
+import math
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_VALIDATION_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "validation"
+if str(_VALIDATION_DIR) not in sys.path:
+    sys.path.insert(0, str(_VALIDATION_DIR))
+
+import calibrate_readiness_thresholds as calib  # noqa: E402
+
+
+def _simulate(rows, candidate):
+    """Row-by-row reference for one candidate: (ready, review, blocked, moved rows)."""
+    ready = review = blocked = 0
+    moved = []
+    for row in rows:
+        if row.status == "BLOCKED":
+            blocked += 1
+        elif row.status == "REVIEW":
+            review += 1
+        elif (
+            row.video_damage_score <= candidate.review_video_damage_score
+            and row.damaged_chunk_ratio <= candidate.review_damaged_chunk_ratio
+            and row.severe_damage_chunk_ratio <= candidate.review_severe_damage_chunk_ratio
+        ):
+            ready += 1
+        else:
+            # Also taken when a metric is NaN: unknown damage never passes a threshold.
+            review += 1
+            moved.append(row)
+    return ready, review, blocked, moved
+
+
+def _rows(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    rows = [
+        calib.VideoRow(
+            batch_id="P001.1",
+            generated_at="2026-01-01",
+            video_id=f"v{i:04d}",
+            status=rng.choice(["READY", "READY", "READY", "REVIEW", "BLOCKED"]),
+            reason_code="",
+            # Two-decimal metrics so rows land exactly on candidate thresholds too.
+            damaged_chunk_ratio=round(rng.random() * 0.4, 2),
+            severe_damage_chunk_ratio=round(rng.random() * 0.5, 2),
+            video_damage_score=round(rng.random() * 0.25, 2),
+            content_type=rng.choice(["infield", "talking_head"]),
+        )
+        for i in range(n)
+    ]
+    # A few READY rows with a missing (NaN) metric on each axis.
+    fields = ("damaged_chunk_ratio", "severe_damage_chunk_ratio", "video_damage_score")
+    for i, field in zip(range(0, n, n // 3 or 1), fields):
+        rows[i] = dataclasses.replace(rows[i], status="READY", **{field: math.nan})
+    return rows
+
+
+VDS = [0.18, 0.16, 0.14, 0.12, 0.05]
+DCR = [0.25, 0.22, 0.20, 0.10]
+SDCR = [0.40, 0.35, 0.30]
+
+
+class TestSweepGrid(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rows = _rows(600)
+        self.columns = calib.ReadinessColumns.from_rows(self.rows)
+        self.grid = calib.sweep_grid(self.columns, VDS, DCR, SDCR)
+
+    def test_grid_matches_per_candidate_simulation(self) -> None:
+        for i, j, k in itertools.product(range(len(VDS)), range(len(DCR)), range(len(SDCR))):
+            candidate = self.grid.candidate(i, j, k)
+            ready, review, blocked, moved = _simulate(self.rows, candidate)
+            self.assertEqual(int(self.grid.moved[i, j, k]), len(moved), candidate)
+            self.assertEqual(
+                (self.grid.ready - len(moved), self.grid.review + len(moved), self.grid.blocked),
+                (ready, review, blocked),
+            )
+            self.assertEqual(
+                sorted(self.columns.video_ids[self.columns.moved_mask(candidate)].tolist()),
+                sorted(r.video_id for r in moved),
+            )
+
+    def test_nan_metrics_move_in_sweep_and_reference(self) -> None:
+        nan_ids = {r.video_id for r in self.rows if any(math.isnan(v) for v in (
+            r.damaged_chunk_ratio, r.severe_damage_chunk_ratio, r.video_damage_score))}
+        self.assertEqual(len(nan_ids), 3)
+        loosest = self.grid.candidate(len(VDS) - 1, len(DCR) - 1, len(SDCR) - 1)
+        self.assertEqual({r.video_id for r in _simulate(self.rows, loosest)[3]} & nan_ids, nan_ids)
+        self.assertTrue(nan_ids <= set(self.columns.video_ids[self.columns.moved_mask(loosest)].tolist()))
+        self.assertGreaterEqual(int(self.grid.moved.min()), 3)
+
+    def test_pareto_mask_is_the_non_dominated_set(self) -> None:
+        cells = list(itertools.product(range(len(VDS)), range(len(DCR)), range(len(SDCR))))
+        expected = {
+            c
+            for c in cells
+            if not any(
+                d != c and all(a <= b for a, b in zip(d, c)) and self.grid.moved[d] <= self.grid.moved[c]
+                for d in cells
+            )
+        }
+        self.assertEqual(set(self.grid.ordered_cells(self.grid.pareto_mask())), expected)
+
+    def test_thinned_frontier_keeps_first_report_cell_per_moved_count(self) -> None:
+        pareto = self.grid.pareto_mask()
+        first = {}
+        for cell in self.grid.ordered_cells(pareto):
+            first.setdefault(int(self.grid.moved[cell]), cell)
+        levels = sorted(first)
+        self.assertEqual(self.grid.ordered_cells(self.grid.thin_mask(pareto, 0)), [first[m] for m in levels])
+        thinned = [int(self.grid.moved[c]) for c in self.grid.ordered_cells(self.grid.thin_mask(pareto, 5))]
+        self.assertEqual(len(thinned), 5)
+        self.assertEqual((thinned[0], thinned[-1]), (levels[0], levels[-1]))
+
+    def test_per_content_type_grids_sum_to_global(self) -> None:
+        total = None
+        for content_type in ("infield", "talking_head"):
+            sub = self.columns.subset(self.columns.content_types == content_type)
+            sub_moved = calib.sweep_grid(sub, VDS, DCR, SDCR).moved
+            total = sub_moved if total is None else total + sub_moved
+        self.assertTrue((total == self.grid.moved).all())
+
+    def test_main_on_dense_grid_lists_ids_for_shown_frontier_cells_only(self) -> None:
+        rng = random.Random(11)
+        videos = [
+            {
+                "video_id": f"v{i:04d}",
+                "status": rng.choice(["READY", "READY", "READY", "REVIEW", "BLOCKED"]),
+                "damage_profile": {
+                    "damaged_chunk_ratio": rng.random() * 0.4,
+                    "severe_damage_chunk_ratio": rng.random() * 0.5,
+                    "video_damage_score": rng.random() * 0.25,
+                },
+            }
+            for i in range(2000)
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = Path(tmp) / "P001.1" / "readiness-summary.json"
+            summary.parent.mkdir()
+            summary.write_text(
+                json.dumps(
+                    {"generated_at": "2026-01-01", "policy": {"review_damaged_chunk_ratio": 0.2}, "videos": videos}
+                ),
+                encoding="utf-8",
+            )
+            out = Path(tmp) / "out.json"
+            argv = [
+                "calibrate_readiness_thresholds.py",
+                "--readiness-glob", str(Path(tmp) / "*" / "readiness-summary.json"),
+                "--review-video-damage-score-candidates", "0.00:0.25:0.01",
+                "--review-damaged-chunk-ratio-candidates", "0.00:0.25:0.01",
+                "--review-severe-damage-chunk-ratio-candidates", "0.00:0.25:0.01",
+                "--out", str(out),
+            ]
+            with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(io.StringIO()) as stdout:
+                calib.main()
+            payload = json.loads(out.read_text(encoding="utf-8"))
+            size = out.stat().st_size
+
+        self.assertIn("grid cells=17576", stdout.getvalue())
+        self.assertEqual(len(payload["candidates"]), 26 ** 3)
+        frontier = payload["frontier"]
+        shown = [row for row in frontier if "moved_video_ids" in row]
+        self.assertGreater(len(frontier), len(shown))
+        self.assertLessEqual(len(shown), 40)
+        self.assertEqual(sum("moved_video_ids" in row for row in payload["candidates"]), len(shown))
+        self.assertIn(f"pareto_frontier={len(frontier)} shown={len(shown)}", stdout.getvalue())
+        self.assertLess(size, 10 * 1024 * 1024)
+
+        moved_counts = [row["summary"]["ready_to_review"] for row in shown]
+        levels = sorted(set(row["summary"]["ready_to_review"] for row in frontier))
+        self.assertEqual(moved_counts, sorted(set(moved_counts)))
+        self.assertEqual((moved_counts[0], moved_counts[-1]), (levels[0], levels[-1]))
+        for row in shown:
+            self.assertEqual(len(row["moved_video_ids"]), row["summary"]["ready_to_review"])
+
+    def test_range_candidates_expand_inclusively(self) -> None:
+        self.assertEqual(calib._parse_float_list("0.10:0.12:0.01, 0.3"), [0.1, 0.11, 0.12, 0.3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Tests for stage 04 chunked diarization (windowing, cross-window speaker stitching)."""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+_LOADER = importlib.machinery.SourceFileLoader("diarize04", str(_SCRIPTS_DIR / "04.EXT.diarize"))
+diarize04 = types.ModuleType("diarize04")
+diarize04.__spec__ = importlib.util.spec_from_loader("diarize04", loader=_LOADER)
+sys.modules["diarize04"] = diarize04
+_LOADER.exec_module(diarize04)
+
+_DURATION = 1500.0
+# Ground truth: coach (A) and target (B) alternate every 20s.
+_TRUTH = [
+    {"start": float(t), "end": float(t + 20), "speaker": "A" if (t // 20) % 2 == 0 else "B"}
+    for t in range(0, int(_DURATION), 20)
+]
+_VOICES = {"A": np.array([1.0, 0.1, 0.0]), "B": np.array([0.0, 1.0, 0.2])}
+
+
+class _WindowedEngine(diarize04.DiarizeEngine):
+    """Fake pyannote: per-window local labels (swapped in odd windows) + noisy embeddings."""
+
+    def __init__(self, chunk_sec: float, min_speakers: int = 0, max_speakers: int = 0) -> None:
+        self.device = "cpu"
+        self.diarizer = "fake"
+        self.min_speakers = min_speakers
+        self.max_speakers = max_speakers
+        self.clustering_threshold = 0.0
+        self.chunk_sec = chunk_sec
+        self.chunk_overlap_sec = 30.0
+        self.chunk_cluster_threshold = diarize04.CHUNK_CLUSTER_THRESHOLD
+        self._whisperx = None
+        self.window_calls = 0
+        self._rng = np.random.default_rng(7)
+
+    def _diarize_window(self, y16k):
+        start, end = float(y16k[0]), float(y16k[1])
+        swap = self.window_calls % 2 == 1
+        self.window_calls += 1
+        local = {"A": "SPEAKER_01" if swap else "SPEAKER_00", "B": "SPEAKER_00" if swap else "SPEAKER_01"}
+        turns = []
+        for t in _TRUTH:
+            s, e = max(t["start"], start), min(t["end"], end)
+            if e > s:
+                turns.append({"start": s - start, "end": e - start, "speaker": local[t["speaker"]]})
+        embeddings = {
+            local[spk]: vec + self._rng.normal(0.0, 0.05, size=vec.shape) for spk, vec in _VOICES.items()
+        }
+        return turns, embeddings
+
+
+def _run_chunked(engine):
+    with patch.object(diarize04, "read_audio_window_16k", side_effect=lambda path, s, e: np.array([s, e])):
+        return engine.detect_turns(None, "audio.wav", duration_sec=_DURATION)
+
+
+class TestPlanWindows(unittest.TestCase):
+    def test_owned_spans_tile_the_file(self) -> None:
+        windows = diarize04._plan_windows(_DURATION, 600.0, 30.0)
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(windows[0]["own_start"], 0.0)
+        self.assertEqual(windows[-1]["own_end"], _DURATION)
+        for prev, nxt in zip(windows, windows[1:]):
+            self.assertEqual(prev["own_end"], nxt["own_start"])
+            self.assertLess(nxt["start"], prev["end"])
+        self.assertTrue(all(w["end"] - w["start"] <= 600.0 for w in windows))
+
+
+class TestChunkedDiarization(unittest.TestCase):
+    def test_speakers_are_stitched_consistently_across_windows(self) -> None:
+        engine = _WindowedEngine(chunk_sec=400.0)
+        turns = _run_chunked(engine)
+
+        self.assertEqual(engine.window_calls, 4)
+        self.assertEqual({t["speaker"] for t in turns}, {"SPEAKER_00", "SPEAKER_01"})
+        mapping = {}
+        for truth in _TRUTH:
+            mid = (truth["start"] + truth["end"]) / 2.0
+            mapping.setdefault(truth["speaker"], set()).add(diarize04._speaker_at(mid, turns))
+        self.assertEqual(mapping, {"A": {"SPEAKER_00"}, "B": {"SPEAKER_01"}})
+        # Output is plain merged turns, so it feeds _merge_turns / assignment unchanged.
+        self.assertEqual(turns, diarize04._merge_turns(turns))
+        self.assertEqual(turns[-1]["end"], _DURATION)
+
+    def test_max_speakers_forces_merge(self) -> None:
+        entries = [
+            {"embedding": np.array([1.0, 0.0]), "weight": 10.0},
+            {"embedding": np.array([0.0, 1.0]), "weight": 10.0},
+            {"embedding": np.array([0.95, 0.05]), "weight": 5.0},
+        ]
+        self.assertEqual(diarize04._cluster_window_speakers(entries, 0.3), [0, 1, 0])
+        self.assertEqual(diarize04._cluster_window_speakers(entries, 0.3, max_speakers=1), [0, 0, 0])
+        self.assertEqual(diarize04._cluster_window_speakers(entries, 2.0, min_speakers=2), [0, 1, 0])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
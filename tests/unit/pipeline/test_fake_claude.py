@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Offline Claude stand-in (batch/fake-claude) and the llm-loadtest report helpers."""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+_BATCH_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+from fake_claude_responses import GARBLE_MARKER, STAGE_MARKERS, detect_stage, template_response  # noqa: E402
+from llm_outage import parse_reset_time  # noqa: E402
+
+_FAKE_CLAUDE = _BATCH_DIR / "fake-claude"
+
+
+def _load_script(name: str, filename: str) -> types.ModuleType:
+    path = _BATCH_DIR / filename
+    loader = importlib.machinery.SourceFileLoader(name, str(path))
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    module.__spec__ = importlib.util.spec_from_loader(name, loader)
+    loader.exec_module(module)
+    return module
+
+
+llm_loadtest = _load_script("llm_loadtest", "llm-loadtest")
+
+
+def _quality_prompt() -> str:
+    header = dict((key, marker) for key, marker in STAGE_MARKERS)["06e"]
+    return "\n".join([
+        header,
+        "[0] COACH: Hey, I noticed you near the park and had to say hi.",
+        f"[1] TARGET: yeah the uh {GARBLE_MARKER} mm the park",
+        "[2] COACH: What brings you over by the market today?",
+    ])
+
+
+class TestTemplates(unittest.TestCase):
+    def test_detects_stage_from_prompt_header(self) -> None:
+        self.assertEqual(detect_stage("Reply with exactly: ok"), "preflight")
+        self.assertEqual(detect_stage(_quality_prompt()), "06e")
+        self.assertEqual(detect_stage("Summarise this essay."), "unknown")
+        self.assertIsNone(template_response("unknown", "Summarise this essay."))
+
+    def test_quality_template_flags_only_garbled_segments(self) -> None:
+        payload = json.loads(template_response("06e", _quality_prompt()))
+        self.assertEqual([s["segment"] for s in payload["low_quality_segments"]], [1])
+        self.assertEqual(payload["low_quality_segments"][0]["quality_issue_type"], "garbled_speech")
+
+
+class TestFakeClaudeCli(unittest.TestCase):
+    def _run(self, tmp: Path, config: dict, prompt: str) -> subprocess.CompletedProcess:
+        config = {"log": str(tmp / "calls.jsonl"), "state_dir": str(tmp / "state"), **config}
+        config_path = tmp / "fake.json"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        env = dict(os.environ, FAKE_CLAUDE_CONFIG=str(config_path))
+        return subprocess.run(
+            [sys.executable, str(_FAKE_CLAUDE), "--model", "sonnet", "-p", "-", "--output-format", "text"],
+            input=prompt, capture_output=True, text=True, env=env, timeout=60,
+        )
+
+    def _log(self, tmp: Path) -> list:
+        return [json.loads(line) for line in (tmp / "calls.jsonl").read_text(encoding="utf-8").splitlines()]
+
+    def test_serves_template_and_logs_call(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            result = self._run(tmp, {}, _quality_prompt())
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn("low_quality_segments", result.stdout)
+            (row,) = self._log(tmp)
+            self.assertEqual((row["call"], row["stage"], row["model"], row["outcome"]), (1, "06e", "sonnet", "ok"))
+
+    def test_outage_answers_limit_with_parseable_reset_then_recovers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            config = {"outage": {"after_calls": 2, "duration_seconds": 600}}
+            self.assertEqual(self._run(tmp, config, "Reply with exactly: ok").stdout.strip(), "ok")
+            limited = self._run(tmp, config, "Reply with exactly: ok")
+            self.assertEqual(limited.returncode, 1)
+            self.assertIn("hit your limit", limited.stderr)
+            self.assertIsNotNone(parse_reset_time(limited.stderr))
+
+            config["outage"]["duration_seconds"] = 0
+            self.assertEqual(self._run(tmp, config, "Reply with exactly: ok").returncode, 0)
+            self.assertEqual([r["outcome"] for r in self._log(tmp)], ["ok", "limit", "ok"])
+
+    def test_injected_error_and_unknown_prompt_fail(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            failed = self._run(tmp, {"faults": {"error_rate": 1.0}}, _quality_prompt())
+            self.assertEqual(failed.returncode, 1)
+            self.assertIn("API Error", failed.stderr)
+            unknown = self._run(tmp, {}, "Summarise this essay.")
+            self.assertEqual(unknown.returncode, 1)
+            self.assertEqual([r["outcome"] for r in self._log(tmp)], ["error", "no_template"])
+
+
+class TestLoadTestReport(unittest.TestCase):
+    def test_summarises_calls_and_runner_output(self) -> None:
+        rows = [
+            {"stage": "06", "outcome": "ok", "arrived_at": 0.0, "queued_seconds": 0.0, "service_seconds": 4.0},
+            {"stage": "06", "outcome": "ok", "arrived_at": 1.0, "queued_seconds": 0.0, "service_seconds": 2.0},
+            {"stage": "07.window", "outcome": "limit", "arrived_at": 5.0, "queued_seconds": 1.0, "service_seconds": 0.0},
+            {"stage": "07.window", "outcome": "timeout", "arrived_at": 6.0, "queued_seconds": 0.0, "service_seconds": None},
+        ]
+        summary = llm_loadtest.summarize_calls(rows)
+        self.assertEqual(summary["outcomes"], {"limit": 1, "ok": 2, "timeout": 1})
+        self.assertEqual(summary["peak_concurrency"], 2)
+        self.assertEqual(summary["stages"]["06"]["latency_seconds"], {"p50": 2.0, "p95": 4.0, "p99": 4.0})
+
+        output = "  Passed:      3/4\n  Failed:      1\n  LLM parked:  1x, 2.5 min total, 3 capacity probe(s)\n"
+        runner = llm_loadtest.parse_runner_summary(output)
+        self.assertEqual((runner["passed"], runner["videos"], runner["failed"]), (3, 4, 1))
+        self.assertEqual(runner["parked"], {"count": 1, "minutes": 2.5, "probes": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
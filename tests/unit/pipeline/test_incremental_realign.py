@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Tests for content-hash incremental re-runs of stage 03 (align) and stage 04 (diarize)."""
+from __future__ import annotations
+
+import copy
+import importlib.machinery
+import importlib.util
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+
+def _load(name: str, filename: str) -> types.ModuleType:
+    path = _SCRIPTS_DIR / filename
+    loader = importlib.machinery.SourceFileLoader(name, str(path))
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    module.__spec__ = importlib.util.spec_from_loader(name, loader=loader)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+align03 = _load("align03", "03.EXT.align")
+diarize04 = _load("diarize04", "04.EXT.diarize")
+
+
+def _segments(n: int):
+    out = []
+    for i in range(n):
+        s = i * 6.0
+        words = [
+            {"word": "hey", "start": s, "end": s + 1.0},
+            {"word": "there", "start": s + 1.2, "end": s + 2.0},
+            {"word": "friend", "start": s + 3.0, "end": s + 4.0},
+            {"word": f"n{i}", "start": s + 4.2, "end": s + 5.0},
+        ]
+        out.append({"start": s, "end": s + 5.0, "text": f"hey there. friend n{i}", "words": words})
+    return out
+
+
+class _SplittingAlignEngine(align03.AlignEngine):
+    """Splits every segment into two 'sentences', like whisperx.align does."""
+
+    ALIGN_BATCH_SEGMENTS = 4
+
+    def __init__(self) -> None:
+        self.language = "en"
+        self.device = "cpu"
+        self.aligned_texts = []
+
+    def _align_batch(self, segments_batch, audio16k):
+        out = []
+        for seg in segments_batch:
+            self.aligned_texts.append(seg["text"])
+            first, second = seg["text"].split(". ", 1)
+            words = seg["words"]
+            out.append({"start": words[0]["start"], "end": words[1]["end"], "text": first + ".", "words": words[:2]})
+            out.append({"start": words[2]["start"], "end": words[-1]["end"], "text": second, "words": words[2:]})
+        return out
+
+
+class _FakeDiarizeEngine(diarize04.DiarizeEngine):
+    def __init__(self) -> None:
+        self.device = "cpu"
+        self.diarizer = "fake"
+        self.min_speakers = 0
+        self.max_speakers = 0
+        self.clustering_threshold = 0.0
+        self.chunk_sec = 0.0
+        self.chunk_overlap_sec = 0.0
+        self.chunk_cluster_threshold = 0.0
+        self._whisperx = None
+        self.turn_calls = 0
+
+    def detect_turns(self, audio16k, audio_path, duration_sec=None):
+        self.turn_calls += 1
+        # Speaker flips inside every segment, so each one is re-cut in two.
+        turns = []
+        for i in range(40):
+            s = i * 6.0
+            turns.append({"start": s, "end": s + 2.5, "speaker": "SPEAKER_00"})
+            turns.append({"start": s + 2.5, "end": s + 5.5, "speaker": "SPEAKER_01"})
+        return diarize04._merge_turns(turns)
+
+
+class TestIncrementalAlign(unittest.TestCase):
+    def _align(self, tmp: Path, segments, out_name: str, incremental: bool = True):
+        transcription = tmp / "in.full.json"
+        transcription.write_text(json.dumps({"text": "", "segments": segments}), encoding="utf-8")
+        audio = tmp / "audio.wav"
+        if not audio.exists():
+            audio.write_bytes(b"RIFF")
+        out_json = tmp / out_name / "Sample [AAAAAAAAAAA].full.json"
+        engine = _SplittingAlignEngine()
+        with patch.object(align03, "load_audio_16k_for_whisperx", return_value=np.zeros(16000 * 300)):
+            align03.align_transcription(transcription, audio, out_json, engine, incremental=incremental)
+        return engine, json.loads(out_json.read_text(encoding="utf-8"))
+
+    def test_only_changed_segments_are_realigned(self) -> None:
+        segments = _segments(10)
+        edited = copy.deepcopy(segments)
+        edited[3]["text"] = "hey there. friend fixed"
+        with tempfile.TemporaryDirectory() as tmp_str:
+            tmp = Path(tmp_str)
+            self._align(tmp, segments, "out")
+            engine, incremental = self._align(tmp, edited, "out")
+            _, full = self._align(tmp, edited, "full", incremental=False)
+
+        self.assertEqual(engine.aligned_texts, ["hey there. friend fixed"])
+        self.assertEqual(incremental["segments"], full["segments"])
+        self.assertEqual(len(incremental["segments"]), 20)
+        self.assertEqual(incremental["align_cache"]["segment_sources"][:8], [0, 0, 1, 1, 2, 2, 3, 3])
+
+    def test_unchanged_input_skips_alignment(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_str:
+            tmp = Path(tmp_str)
+            _, first = self._align(tmp, _segments(6), "out")
+            engine, second = self._align(tmp, _segments(6), "out")
+        self.assertEqual(engine.aligned_texts, [])
+        self.assertEqual(first["segments"], second["segments"])
+
+
+class TestIncrementalDiarize(unittest.TestCase):
+    def _diarize(self, tmp: Path, segments, out_name: str, engine, incremental: bool = True):
+        aligned = tmp / "aligned.full.json"
+        aligned.write_text(json.dumps({"text": "", "segments": segments}), encoding="utf-8")
+        audio = tmp / "audio.wav"
+        if not audio.exists():
+            audio.write_bytes(b"RIFF")
+        out_json = tmp / out_name / "Sample [AAAAAAAAAAA].full.json"
+        with patch.object(diarize04, "load_audio_16k", return_value=np.zeros(16000 * 300)):
+            diarize04.diarize_transcription(aligned, audio, out_json, engine, incremental=incremental)
+        return json.loads(out_json.read_text(encoding="utf-8"))
+
+    def test_cached_turns_and_untouched_segments_are_reused(self) -> None:
+        segments = _segments(8)
+        edited = copy.deepcopy(segments)
+        edited[5]["words"][3]["word"] = "fixed"
+        edited[5]["text"] = "hey there. friend fixed"
+        with tempfile.TemporaryDirectory() as tmp_str:
+            tmp = Path(tmp_str)
+            self._diarize(tmp, segments, "out", _FakeDiarizeEngine())
+            engine = _FakeDiarizeEngine()
+            with patch.object(diarize04, "_resegment_segments_by_turns",
+                              wraps=diarize04._resegment_segments_by_turns) as reseg:
+                incremental = self._diarize(tmp, edited, "out", engine)
+            full = self._diarize(tmp, edited, "full", _FakeDiarizeEngine(), incremental=False)
+
+        self.assertEqual(engine.turn_calls, 0)
+        self.assertEqual(len(reseg.call_args[0][0]), 1)
+        self.assertEqual(incremental["segments"], full["segments"])
+        self.assertEqual({s["speaker"] for s in incremental["segments"]}, {"SPEAKER_00", "SPEAKER_01"})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
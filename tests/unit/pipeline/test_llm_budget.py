@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Host-wide LLM budget (batch/llm_budget.py) and concurrent run-campaign sweeps."""
+from __future__ import annotations
+
+import asyncio
+import importlib.machinery
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_BATCH_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+import llm_budget  # noqa: E402
+from llm_budget import LLMBudget  # noqa: E402
+
+_LOADER = importlib.machinery.SourceFileLoader("run_campaign", str(_BATCH_DIR / "run-campaign"))
+_SPEC = importlib.util.spec_from_loader("run_campaign", _LOADER)
+assert _SPEC
+run_campaign = importlib.util.module_from_spec(_SPEC)
+sys.modules["run_campaign"] = run_campaign
+_LOADER.exec_module(run_campaign)
+
+
+class TestLLMBudget(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name) / "budget"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_capacity_is_enforced_and_slots_are_reused(self) -> None:
+        budget = LLMBudget(2, self.dir)
+        first, second = budget.try_acquire(), budget.try_acquire()
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertIsNone(budget.try_acquire())
+        self.assertEqual(budget.held(), 2)
+        LLMBudget.release(first)
+        third = budget.try_acquire()
+        self.assertIsNotNone(third)
+        LLMBudget.release(second)
+        LLMBudget.release(third)
+        self.assertEqual(budget.held(), 0)
+
+    def test_slot_of_killed_process_is_released(self) -> None:
+        holder = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                textwrap.dedent(
+                    f"""
+                    import sys, time
+                    sys.path.insert(0, {str(_BATCH_DIR)!r})
+                    from pathlib import Path
+                    from llm_budget import LLMBudget
+                    handle = LLMBudget(1, Path({str(self.dir)!r})).try_acquire()
+                    print("held" if handle else "none", flush=True)
+                    time.sleep(60)
+                    """
+                ),
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert holder.stdout is not None
+            self.assertEqual(holder.stdout.readline().strip(), "held")
+            budget = LLMBudget(1, self.dir)
+            with self.assertRaises(TimeoutError):
+                with budget.slot(timeout=0.3):
+                    pass
+        finally:
+            holder.kill()
+            holder.wait()
+        with budget.slot(timeout=2):
+            self.assertEqual(budget.held(), 1)
+
+    def test_async_slots_cap_concurrency(self) -> None:
+        budget = LLMBudget(2, self.dir)
+        active = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal active, peak
+            async with budget.async_slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.05)
+                active -= 1
+
+        async def main() -> None:
+            await asyncio.gather(*(call() for _ in range(5)))
+
+        with patch.object(llm_budget, "POLL_SECONDS", 0.01):
+            asyncio.run(main())
+        self.assertEqual(peak, 2)
+
+    def test_capacity_from_env_or_config(self) -> None:
+        cfg = Path(self._tmp.name) / "pipeline.config.json"
+        cfg.write_text('{"automation": {"max_aggregate_llm_calls": 7}}', encoding="utf-8")
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(llm_budget.BUDGET_ENV, None)
+            self.assertEqual(llm_budget.configured_capacity(cfg), 7)
+            os.environ[llm_budget.BUDGET_ENV] = "3"
+            self.assertEqual(llm_budget.configured_capacity(cfg), 3)
+            os.environ[llm_budget.BUDGET_ENV] = "0"
+            self.assertIsNone(llm_budget.configured_capacity(cfg))
+            self.assertIsNone(LLMBudget.from_config())
+
+
+class TestConcurrentCampaignSweep(unittest.TestCase):
+    def test_runs_overlap_and_results_land_in_state(self) -> None:
+        sids = ["P001.1", "P001.2", "P001.3"]
+        state = {
+            "invocation_count": 1,
+            "history": [],
+            "sub_batches": {sid: {"attempts": 0, "status": "pending"} for sid in sids},
+        }
+        running = 0
+        peak = 0
+
+        def fake_run(*, sid, parallel, from_stage, dry_run, line_prefix):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            time.sleep(0.05)
+            running -= 1
+            self.assertEqual(line_prefix, f"[{sid}] ")
+            return (0 if sid != "P001.2" else 1), ["Videos: 2 total, 2 passed, 0 quarantined"]
+
+        snapshot = {"status": "in_progress", "current_stage": "07", "note": ""}
+        with patch.object(run_campaign, "run_sub_batch", side_effect=fake_run), patch.object(
+            run_campaign, "read_sub_batch_status", return_value=snapshot
+        ), patch.object(run_campaign, "persist"):
+            run_campaign.run_sub_batches_concurrently(
+                state=state,
+                pending=sids,
+                iteration=1,
+                parallel=3,
+                from_stage=None,
+                workers=2,
+                state_path=Path("unused.json"),
+                plan_path=Path("unused.md"),
+            )
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(sorted(h["sub_batch"] for h in state["history"]), sids)
+        rows = state["sub_batches"]
+        self.assertTrue(all(rows[sid]["attempts"] == 1 for sid in sids))
+        self.assertTrue(rows["P001.1"]["terminal_complete"])
+        self.assertTrue(rows["P001.2"]["blocking_failure"])
+        self.assertFalse(rows["P001.2"].get("terminal_complete"))
+
+    def test_start_is_stamped_at_launch_and_worker_errors_stay_per_sub_batch(self) -> None:
+        sids = ["P002.1", "P002.2", "P002.3"]
+        state = {
+            "invocation_count": 1,
+            "history": [],
+            "sub_batches": {sid: {"attempts": 0, "status": "pending"} for sid in sids},
+        }
+        clock = iter(f"2026-01-01T00:00:{n:02d}Z" for n in range(60))
+        ran_at = {}
+
+        def fake_run(*, sid, parallel, from_stage, dry_run, line_prefix):
+            ran_at[sid] = run_campaign.now_iso()
+            if sid == "P002.1":
+                raise OSError("runner vanished")
+            return 0, ["Videos: 2 total, 2 passed, 0 quarantined"]
+
+        snapshot = {"status": "in_progress", "current_stage": "07", "note": ""}
+        with patch.object(run_campaign, "run_sub_batch", side_effect=fake_run), patch.object(
+            run_campaign, "read_sub_batch_status", return_value=snapshot
+        ), patch.object(run_campaign, "now_iso", side_effect=lambda: next(clock)), patch.object(
+            run_campaign, "persist"
+        ):
+            run_campaign.run_sub_batches_concurrently(
+                state=state,
+                pending=sids,
+                iteration=1,
+                parallel=3,
+                from_stage=None,
+                workers=1,
+                state_path=Path("unused.json"),
+                plan_path=Path("unused.md"),
+            )
+
+        rows = state["sub_batches"]
+        self.assertTrue(all(rows[sid]["attempts"] == 1 for sid in sids))
+        # One worker: a queued sub-batch starts after the previous one ran, not in the submit loop.
+        for prev, nxt in zip(sids, sids[1:]):
+            self.assertLess(ran_at[prev], rows[nxt]["last_run_started_at"])
+            self.assertLess(rows[nxt]["last_run_started_at"], ran_at[nxt])
+        self.assertEqual(rows["P002.1"]["last_exit_code"], 1)
+        self.assertTrue(rows["P002.1"]["blocking_failure"])
+        self.assertTrue(rows["P002.2"]["terminal_complete"])
+        self.assertTrue(rows["P002.3"]["terminal_complete"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Claude usage-limit park-and-resume (batch/llm_outage.py) and its pipeline-runner wiring."""
+from __future__ import annotations
+
+import asyncio
+import importlib.machinery
+import importlib.util
+import sys
+import types
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+_BATCH_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+from llm_outage import LLMOutageController, parse_reset_time  # noqa: E402
+
+_MODULE_PATH = _BATCH_DIR / "pipeline-runner"
+_LOADER = importlib.machinery.SourceFileLoader("pipeline_runner", str(_MODULE_PATH))
+pipeline_runner = types.ModuleType("pipeline_runner")
+pipeline_runner.__file__ = str(_MODULE_PATH)
+pipeline_runner.__spec__ = importlib.util.spec_from_loader("pipeline_runner", _LOADER)
+sys.modules["pipeline_runner"] = pipeline_runner
+_LOADER.exec_module(pipeline_runner)
+
+NOW = datetime(2026, 10, 19, 10, 0, tzinfo=timezone.utc).timestamp()
+
+
+class FakeClock:
+    """Wall clock that only moves when the controller sleeps."""
+
+    def __init__(self, start: float = NOW):
+        self.now = start
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def _controller(results, clock, **kwargs):
+    calls = []
+
+    async def probe():
+        calls.append(clock())
+        return results.pop(0)
+
+    ctl = LLMOutageController(probe, clock=clock, sleep=clock.sleep, **kwargs)
+    return ctl, calls
+
+
+class TestParseResetTime(unittest.TestCase):
+    def _utc(self, text):
+        ts = parse_reset_time(text, now=NOW)
+        return None if ts is None else datetime.fromtimestamp(ts, tz=timezone.utc)
+
+    def test_clock_formats(self) -> None:
+        self.assertEqual(self._utc("You've hit your limit · resets 5pm (Europe/Copenhagen)").hour, 15)
+        # 12:00 Copenhagen is exactly now -> next day.
+        self.assertEqual(self._utc("resets 12pm Europe/Copenhagen").day, 20)
+        self.assertEqual(self._utc("resets Oct 21, 3pm (UTC)"), datetime(2026, 10, 21, 15, tzinfo=timezone.utc))
+
+    def test_epoch_and_relative_formats(self) -> None:
+        self.assertEqual(parse_reset_time("Claude AI usage limit reached|1760882400", now=NOW), 1760882400.0)
+        self.assertEqual(parse_reset_time("rate limit; try again in 25 minutes", now=NOW), NOW + 1500)
+        self.assertIsNone(parse_reset_time("Claude preflight failed (exit 1)", now=NOW))
+
+
+class TestLLMOutageController(unittest.TestCase):
+    def test_parks_until_reset_then_backs_off_and_resumes_in_ticket_order(self) -> None:
+        clock = FakeClock()
+        ctl, calls = _controller(
+            [(False, "still limited"), (False, "still limited"), (True, None)],
+            clock,
+            max_wait_seconds=6 * 3600,
+            initial_backoff=60,
+            reset_grace=30,
+        )
+        released = []
+
+        async def main() -> None:
+            tickets = [ctl.ticket() for _ in range(3)]
+            ctl.trip("You've hit your limit · resets 11am (UTC)")
+            self.assertTrue(ctl.parked)
+
+            async def waiter(ticket):
+                ok = await ctl.wait_available(ticket)
+                released.append((ticket, ok))
+
+            await asyncio.gather(*(waiter(t) for t in reversed(tickets)))
+
+        asyncio.run(main())
+        self.assertEqual(released, [(0, True), (1, True), (2, True)])
+        self.assertEqual(clock.sleeps, [3630.0, 60.0, 120.0])
+        self.assertEqual(len(calls), 3)
+        self.assertFalse(ctl.parked)
+        self.assertEqual((ctl.park_count, ctl.parked_seconds), (1, 3810.0))
+
+    def test_gives_up_after_max_wait(self) -> None:
+        clock = FakeClock()
+        ctl, _ = _controller([(False, "limited")] * 10, clock, max_wait_seconds=300, initial_backoff=120)
+
+        async def main() -> bool:
+            ctl.trip("hit your limit")
+            return await ctl.wait_available(ctl.ticket())
+
+        self.assertFalse(asyncio.run(main()))
+        self.assertTrue(ctl.gave_up)
+        self.assertEqual(sum(clock.sleeps), 300)
+        self.assertFalse(ctl.can_park)
+
+    def test_park_budget_is_shared_across_outages(self) -> None:
+        clock = FakeClock()
+        results = [(True, None)] + [(False, "limited")] * 5
+        ctl, _ = _controller(results, clock, max_wait_seconds=300, initial_backoff=120)
+
+        async def main():
+            ctl.trip("hit your limit")
+            first = await ctl.wait_available(ctl.ticket())
+            ctl.trip("hit your limit")
+            return first, await ctl.wait_available(ctl.ticket())
+
+        self.assertEqual(asyncio.run(main()), (True, False))
+        self.assertEqual(clock.sleeps, [120.0, 120.0, 60.0])
+        self.assertEqual((ctl.park_count, ctl.parked_seconds), (2, 300.0))
+        self.assertFalse(ctl.can_park)
+
+    def test_concurrent_probes_share_one_call_and_cache(self) -> None:
+        clock = FakeClock()
+
+        async def main():
+            release = asyncio.Event()
+            calls = []
+
+            async def probe():
+                calls.append(1)
+                await release.wait()
+                return True, None
+
+            ctl = LLMOutageController(probe, max_wait_seconds=0, clock=clock, sleep=clock.sleep)
+            pending = [asyncio.create_task(ctl.probe()) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*pending)
+            cached = await ctl.probe()
+            clock.now += 31
+            await ctl.probe()
+            return results, cached, calls
+
+        results, cached, calls = asyncio.run(main())
+        self.assertEqual(results, [(True, None)] * 5)
+        self.assertEqual(cached, (True, None))
+        self.assertEqual(len(calls), 2)
+
+
+class TestRunVideoParking(unittest.TestCase):
+    def test_limit_parks_and_retries_stage_instead_of_failing(self) -> None:
+        vs = pipeline_runner.VideoState(video_id="AAAAAAAAAAA", source="src", folder="Clip [AAAAAAAAAAA]")
+        progress = {vs.video_id: "pending"}
+        stage = pipeline_runner.Stage("06e", "06e.LLM.quality-check", needs_llm=True)
+        clock = FakeClock()
+        subprocess_results = [
+            (1, "limit", "You've hit your limit · resets 11am (UTC)"),
+            (0, None, ""),
+        ]
+        outage_event = asyncio.Event()
+
+        async def run() -> LLMOutageController:
+            ctl, _ = _controller([(True, None)], clock, max_wait_seconds=6 * 3600)
+            with patch.object(pipeline_runner, "replay_upstream_gates_for_resume", return_value=False), patch.object(
+                pipeline_runner, "build_stage_command", return_value=["echo", "ignored"]
+            ), patch.object(
+                pipeline_runner, "run_contract_preflight", new=AsyncMock(return_value=0)
+            ), patch.object(
+                pipeline_runner, "run_subprocess", new=AsyncMock(side_effect=subprocess_results)
+            ) as mock_run:
+                await pipeline_runner.run_video(
+                    vs=vs,
+                    stages=[stage],
+                    semaphore=asyncio.Semaphore(1),
+                    stage_semaphores={},
+                    llm_outage_event=outage_event,
+                    stage_env=None,
+                    quarantine_file=None,
+                    preexisting_quarantine_ids=set(),
+                    dry_run=False,
+                    progress=progress,
+                    llm_outage=ctl,
+                )
+                self.assertEqual(mock_run.await_count, 2)
+            return ctl
+
+        ctl = asyncio.run(run())
+        self.assertEqual(vs.status, "done")
+        self.assertFalse(outage_event.is_set())
+        self.assertEqual(ctl.park_count, 1)
+        self.assertEqual(clock.sleeps, [3630.0])
+
+    def test_second_limit_after_resume_fails_the_video(self) -> None:
+        vs = pipeline_runner.VideoState(video_id="AAAAAAAAAAA", source="src", folder="Clip [AAAAAAAAAAA]")
+        stage = pipeline_runner.Stage("06e", "06e.LLM.quality-check", needs_llm=True)
+        clock = FakeClock()
+        subprocess_results = [(1, "limit", "You've hit your limit"), (1, "limit", "You've hit your limit")]
+        outage_event = asyncio.Event()
+
+        async def run() -> int:
+            ctl, _ = _controller([(True, None)] * 3, clock, max_wait_seconds=6 * 3600)
+            with patch.object(pipeline_runner, "replay_upstream_gates_for_resume", return_value=False), patch.object(
+                pipeline_runner, "build_stage_command", return_value=["echo", "ignored"]
+            ), patch.object(
+                pipeline_runner, "run_contract_preflight", new=AsyncMock(return_value=0)
+            ), patch.object(
+                pipeline_runner, "run_subprocess", new=AsyncMock(side_effect=subprocess_results)
+            ) as mock_run:
+                await pipeline_runner.run_video(
+                    vs=vs,
+                    stages=[stage],
+                    semaphore=asyncio.Semaphore(1),
+                    stage_semaphores={},
+                    llm_outage_event=outage_event,
+                    stage_env=None,
+                    quarantine_file=None,
+                    preexisting_quarantine_ids=set(),
+                    dry_run=False,
+                    progress={vs.video_id: "pending"},
+                    llm_outage=ctl,
+                )
+            await ctl.close()
+            return mock_run.await_count
+
+        self.assertEqual(asyncio.run(run()), 2)
+        self.assertEqual((vs.status, vs.error_stage), ("failed", "06e"))
+        self.assertTrue(vs.error_msg.startswith("claude_limit_exhausted"))
+        self.assertFalse(outage_event.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
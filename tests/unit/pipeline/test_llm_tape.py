@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Record/replay of Claude responses (batch/llm_tape.py, batch/claude-tape)."""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_BATCH_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+from llm_tape import LLMTape, replay_delay, tape_key  # noqa: E402
+
+PROMPT = "You are a strict JSON evaluator for transcript quality in a coaching-video pipeline.\n[0] COACH: hi"
+
+
+class TestLLMTape(unittest.TestCase):
+    def test_key_covers_model_and_prompt(self) -> None:
+        self.assertEqual(tape_key("sonnet", PROMPT), tape_key("sonnet", PROMPT))
+        self.assertNotEqual(tape_key("sonnet", PROMPT), tape_key("opus", PROMPT))
+        self.assertNotEqual(tape_key(None, PROMPT), tape_key(None, PROMPT + " "))
+
+    def test_replay_delay_modes(self) -> None:
+        self.assertEqual(replay_delay(4.0, "recorded"), 4.0)
+        self.assertEqual(replay_delay(4.0, "zero"), 0.0)
+        self.assertEqual(replay_delay(4.0, "0.25"), 1.0)
+        for bad in ("fast", "-1"):
+            with self.assertRaises(ValueError):
+                replay_delay(4.0, bad)
+
+    def test_store_and_load_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tape = LLMTape(Path(tmp))
+            key = tape_key("sonnet", PROMPT)
+            self.assertIsNone(tape.load(key))
+            tape.store(key, stage="06e", model="sonnet", prompt_chars=len(PROMPT), response="{}\n", latency_seconds=2.5)
+            entry = tape.load(key)
+            self.assertEqual((entry["response"], entry["latency_seconds"], entry["stage"]), ("{}\n", 2.5, "06e"))
+
+
+class TestClaudeTapeCli(unittest.TestCase):
+    def _call(self, env: dict, prompt: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(_BATCH_DIR / "claude-tape"), "--model", "sonnet", "-p", "-", "--output-format", "text"],
+            input=prompt, capture_output=True, text=True, env=env, timeout=60,
+        )
+
+    def test_records_through_real_binary_then_replays_offline(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            base = dict(os.environ, LLM_TAPE_DIR=str(tmp / "tape"), FAKE_CLAUDE_CONFIG="")
+            record_env = dict(base, LLM_TAPE_MODE="record", LLM_TAPE_REAL_BINARY=str(_BATCH_DIR / "fake-claude"))
+            recorded = self._call(record_env, PROMPT)
+            self.assertEqual(recorded.returncode, 0, recorded.stderr)
+
+            replay_env = dict(base, LLM_TAPE_MODE="replay", LLM_TAPE_LATENCY="zero", LLM_TAPE_REAL_BINARY="")
+            replayed = self._call(replay_env, PROMPT)
+            self.assertEqual((replayed.returncode, replayed.stdout), (0, recorded.stdout))
+
+            missing = self._call(replay_env, PROMPT + "\n[1] TARGET: hello")
+            self.assertEqual(missing.returncode, 1)
+            self.assertIn("no recorded response", missing.stderr)
+            self.assertEqual(self._call(replay_env, "Reply with exactly: ok").stdout.strip(), "ok")
+
+            rows = [json.loads(line) for line in (tmp / "tape" / "calls.jsonl").read_text(encoding="utf-8").splitlines()]
+            self.assertEqual(
+                [(r["mode"], r.get("stored", r.get("hit"))) for r in rows],
+                [("record", True), ("replay", True), ("replay", False), ("replay", False)],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
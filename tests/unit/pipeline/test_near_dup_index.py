@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Tests for the cross-video near-duplicate transcript index (batch/near_dup_index.py)."""
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+_BATCH_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+import near_dup_index as ndi  # noqa: E402
+
+_VOCAB = (
+    "hey excuse me i just saw you walking past and had to say you look great "
+    "where are you headed coffee cool what do you do for work nice that sounds fun "
+    "so tell me something interesting about you are you from around here no way"
+).split()
+
+
+def _transcript(seed: int, n_segments: int = 60):
+    rng = random.Random(seed)
+    return [
+        {"start": i * 5.0, "end": i * 5.0 + 4.5, "text": " ".join(rng.choice(_VOCAB) for _ in range(14))}
+        for i in range(n_segments)
+    ]
+
+
+def _write(data_root: Path, stage: str, source: str, folder: str, segments) -> Path:
+    path = data_root / stage / source / folder / f"{folder}.full.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"text": "", "segments": segments}), encoding="utf-8")
+    return path
+
+
+class TestNearDupIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.data_root = self.root / "data"
+        self.index_dir = self.root / "index"
+        self.original = _transcript(1)
+        _write(self.data_root, "04.EXT.diarize", "coach_a", "Infield [AAAAAAAAAAA]", self.original)
+        _write(self.data_root, "04.EXT.diarize", "coach_b", "Other [BBBBBBBBBBB]", _transcript(2))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _built(self) -> ndi.NearDupIndex:
+        ndi.update_index(lambda index: ndi.build_index(index, self.data_root), self.index_dir)
+        return ndi.load_index(self.index_dir)
+
+    def test_reupload_with_new_id_is_marked_reupload(self) -> None:
+        index = self._built()
+        self.assertEqual(set(index.videos), {"AAAAAAAAAAA", "BBBBBBBBBBB"})
+
+        # Same infield, re-transcribed with different timestamps and casing.
+        reupload = [
+            {"start": s["start"] + 1.3, "end": s["end"] + 1.3, "text": s["text"].upper() + "."}
+            for s in self.original
+        ]
+        _write(self.data_root, "02.EXT.transcribe", "coach_a", "Reupload [CCCCCCCCCCC]", reupload)
+        report = ndi.check_videos(
+            [("coach_a", "Reupload [CCCCCCCCCCC]", "CCCCCCCCCCC")], self.data_root, index
+        )
+
+        self.assertEqual(report["CCCCCCCCCCC"]["video_id"], "AAAAAAAAAAA")
+        self.assertTrue(report["CCCCCCCCCCC"]["reupload"])
+
+    def test_compilation_is_flagged_but_not_a_reupload(self) -> None:
+        index = self._built()
+        compilation = _transcript(7, 40) + self.original[:30] + _transcript(8, 40)
+        _write(self.data_root, "04.EXT.diarize", "coach_c", "Best of [DDDDDDDDDDD]", compilation)
+        report = ndi.check_videos(
+            [("coach_c", "Best of [DDDDDDDDDDD]", "DDDDDDDDDDD")], self.data_root, index, min_overlap=0.2
+        )
+
+        match = report["DDDDDDDDDDD"]
+        self.assertEqual(match["video_id"], "AAAAAAAAAAA")
+        self.assertGreater(match["reverse_overlap"], 0.4)
+        self.assertFalse(match["reupload"])
+
+    def test_unrelated_and_untranscribed_videos_are_not_reported(self) -> None:
+        index = self._built()
+        _write(self.data_root, "04.EXT.diarize", "coach_d", "Fresh [EEEEEEEEEEE]", _transcript(9))
+        report = ndi.check_videos(
+            [
+                ("coach_d", "Fresh [EEEEEEEEEEE]", "EEEEEEEEEEE"),
+                ("coach_d", "Not transcribed [FFFFFFFFFFF]", "FFFFFFFFFFF"),
+            ],
+            self.data_root,
+            index,
+        )
+        self.assertEqual(report, {})
+
+    def test_duplicate_pair_inside_one_batch_defers_to_first(self) -> None:
+        index = ndi.NearDupIndex.load(self.index_dir)
+        _write(self.data_root, "04.EXT.diarize", "coach_e", "Copy [GGGGGGGGGGG]", self.original)
+        report = ndi.check_videos(
+            [
+                ("coach_a", "Infield [AAAAAAAAAAA]", "AAAAAAAAAAA"),
+                ("coach_e", "Copy [GGGGGGGGGGG]", "GGGGGGGGGGG"),
+            ],
+            self.data_root,
+            index,
+        )
+        self.assertEqual(set(report), {"GGGGGGGGGGG"})
+        self.assertTrue(report["GGGGGGGGGGG"]["in_batch"])
+
+    def test_finished_transcripts_are_indexed_as_stages_write_them(self) -> None:
+        copy = _write(self.data_root, "02.EXT.transcribe", "coach_c", "Reupload [CCCCCCCCCCC]", self.original)
+        self.assertTrue(ndi.index_finished_transcript(copy, self.index_dir))
+        self.assertFalse(ndi.index_finished_transcript(copy, self.index_dir))
+        diarized = _write(self.data_root, "04.EXT.diarize", "coach_c", "Reupload [CCCCCCCCCCC]", self.original)
+        self.assertFalse(ndi.index_finished_transcript(copy, self.index_dir))
+        self.assertTrue(ndi.index_finished_transcript(diarized, self.index_dir))
+        self.assertFalse(ndi.index_finished_transcript(self.root / "elsewhere" / "x.full.json", self.index_dir))
+
+        index = ndi.NearDupIndex.load(self.index_dir)
+        self.assertEqual(index.videos["CCCCCCCCCCC"]["transcript"], str(diarized))
+        report = ndi.check_videos([("coach_a", "Infield [AAAAAAAAAAA]", "AAAAAAAAAAA")], self.data_root, index)
+        self.assertEqual(report["AAAAAAAAAAA"]["video_id"], "CCCCCCCCCCC")
+        self.assertIn("[reupload]", ndi.format_match("AAAAAAAAAAA", report["AAAAAAAAAAA"]))
+
+    def test_concurrent_writers_keep_each_others_rows(self) -> None:
+        transcripts = [
+            _write(self.data_root, "04.EXT.diarize", "coach_f", f"Clip [{letter * 11}]", _transcript(20 + i))
+            for i, letter in enumerate("HIJKLM")
+        ]
+        threads = [
+            threading.Thread(target=ndi.index_finished_transcript, args=(path, self.index_dir))
+            for path in transcripts
+        ]
+        rebuild = lambda index: ndi.build_index(index, self.data_root)  # noqa: E731
+        threads.append(threading.Thread(target=ndi.update_index, args=(rebuild, self.index_dir)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        index = ndi.load_index(self.index_dir)
+        self.assertEqual(len(index.videos), 8)
+        self.assertEqual(sorted(p.name for p in self.index_dir.iterdir()), [".lock", "index.json", "index.npz"])
+
+    def test_manifest_checks_do_not_write_the_index(self) -> None:
+        self._built()
+        before = {p.name: p.stat().st_mtime_ns for p in self.index_dir.iterdir()}
+        _write(self.data_root, "02.EXT.transcribe", "coach_c", "Reupload [CCCCCCCCCCC]", self.original)
+        report = ndi.check_videos(
+            [("coach_c", "Reupload [CCCCCCCCCCC]", "CCCCCCCCCCC")], self.data_root, ndi.load_index(self.index_dir)
+        )
+        self.assertEqual(report["CCCCCCCCCCC"]["video_id"], "AAAAAAAAAAA")
+        self.assertEqual({p.name: p.stat().st_mtime_ns for p in self.index_dir.iterdir()}, before)
+        self.assertNotIn("CCCCCCCCCCC", ndi.load_index(self.index_dir).videos)
+
+    def test_rebuild_skips_unchanged_and_drops_deleted(self) -> None:
+        index = self._built()
+        (self.data_root / "04.EXT.diarize" / "coach_b" / "Other [BBBBBBBBBBB]"
+         / "Other [BBBBBBBBBBB].full.json").unlink()
+        counts = ndi.build_index(index, self.data_root)
+        self.assertEqual(counts, {"indexed": 0, "unchanged": 1, "too_short": 0, "removed": 1})
+        self.assertEqual(set(index.videos), {"AAAAAAAAAAA"})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
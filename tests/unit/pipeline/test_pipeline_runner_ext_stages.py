@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import importlib.machinery
+import importlib.util
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+_MODULE_PATH = _SCRIPTS_DIR / "pipeline-runner"
+_SPEC = importlib.util.spec_from_loader(
+    "pipeline_runner",
+    loader=importlib.machinery.SourceFileLoader("pipeline_runner", str(_MODULE_PATH)),
+)
+pipeline_runner = types.ModuleType("pipeline_runner")
+pipeline_runner.__file__ = str(_MODULE_PATH)
+pipeline_runner.__spec__ = _SPEC
+sys.modules["pipeline_runner"] = pipeline_runner
+_LOADER = importlib.machinery.SourceFileLoader("pipeline_runner", str(_MODULE_PATH))
+_LOADER.exec_module(pipeline_runner)
+
+
+def _ext_stage(key: str) -> "pipeline_runner.Stage":
+    return next(stage for stage in pipeline_runner.STAGES if stage.key == key)
+
+
+class TestPipelineRunnerExtStages(unittest.TestCase):
+    def test_ext_stages_precede_llm_stages(self) -> None:
+        self.assertEqual(pipeline_runner.STAGE_KEYS[:5], ["02", "03", "04", "05", "06"])
+        self.assertEqual(_ext_stage("02").slot_pool, "gpu")
+        self.assertEqual(_ext_stage("05").slot_pool, "cpu")
+        self.assertFalse(any(stage.slot_pool for stage in pipeline_runner.STAGES if stage.needs_llm))
+
+    def test_ext_stage_command_does_not_overwrite(self) -> None:
+        cmd = pipeline_runner.build_stage_command(_ext_stage("02"), "/tmp/manifest.txt")
+        self.assertIn("--manifest", cmd)
+        self.assertNotIn("--overwrite", cmd)
+        self.assertNotIn("--quarantine-file", cmd)
+
+    def _run_ext_video(self, data_dir: Path, video_id: str, stage_keys, slot_semaphores):
+        vs = pipeline_runner.VideoState(video_id=video_id, source="src", folder=f"Sample [{video_id}]")
+        progress = {video_id: "pending"}
+        stages = [_ext_stage(key) for key in stage_keys]
+
+        async def _run() -> None:
+            with patch.object(pipeline_runner, "STAGE_OUTPUT_DIRS", {
+                key: data_dir / f"{key}.out" for key in pipeline_runner.EXT_STAGE_OUTPUT_SUFFIXES
+            }), patch.object(
+                pipeline_runner, "build_stage_command", return_value=["echo", "ignored"]
+            ), patch.object(
+                pipeline_runner, "run_contract_preflight", new=AsyncMock(return_value=0)
+            ), patch.object(
+                pipeline_runner, "run_subprocess", new=AsyncMock(return_value=(0, None, ""))
+            ):
+                await pipeline_runner.run_video(
+                    vs=vs,
+                    stages=stages,
+                    semaphore=asyncio.Semaphore(1),
+                    stage_semaphores={},
+                    llm_outage_event=asyncio.Event(),
+                    stage_env=None,
+                    quarantine_file=None,
+                    preexisting_quarantine_ids=set(),
+                    dry_run=False,
+                    progress=progress,
+                    slot_semaphores=slot_semaphores,
+                )
+
+        asyncio.run(_run())
+        return vs, progress
+
+    def test_missing_ext_artifact_quarantines(self) -> None:
+        video_id = "EEEEEEEEEEE"
+        with tempfile.TemporaryDirectory() as tmp:
+            vs, progress = self._run_ext_video(Path(tmp), video_id, ["02", "03"], None)
+
+        self.assertEqual(vs.status, "quarantined")
+        self.assertIn("stage02_output_missing", vs.quarantine_checks)
+        self.assertEqual(progress[video_id], "QUARANTINED")
+
+    def test_present_ext_artifacts_complete(self) -> None:
+        video_id = "FFFFFFFFFFF"
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            for key, suffix in pipeline_runner.EXT_STAGE_OUTPUT_SUFFIXES.items():
+                path = data_dir / f"{key}.out" / "src" / f"Sample [{video_id}]" / f"Sample [{video_id}]{suffix}"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("{}", encoding="utf-8")
+            slot_semaphores = {"gpu": asyncio.Semaphore(1), "cpu": asyncio.Semaphore(1)}
+            vs, progress = self._run_ext_video(data_dir, video_id, ["02", "03", "04", "05"], slot_semaphores)
+
+        self.assertEqual(vs.status, "done")
+        self.assertEqual(progress[video_id], "done")
+        self.assertFalse(vs.quarantine_checks)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
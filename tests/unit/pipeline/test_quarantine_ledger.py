@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Tests for the append-only quarantine ledger (batch/quarantine_ledger.py)."""
+from __future__ import annotations
+
+import json
+import multiprocessing
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+from batch.quarantine_helpers import load_quarantine_video_ids  # noqa: E402
+from batch.quarantine_ledger import QuarantineLedger, ledger_path_for  # noqa: E402
+
+
+def _vid(i: int) -> str:
+    return f"vid{i:08d}"
+
+
+def _append_worker(path_str: str, start: int, count: int) -> None:
+    ledger = QuarantineLedger(Path(path_str), compact_every=7)
+    for i in range(start, start + count):
+        ledger.record(_vid(i), {"video_id": _vid(i), "checks": ["stage07_block"]})
+
+
+class TestQuarantineLedger(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "P001.1.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_compaction_writes_current_json_shape_and_merges_rows(self) -> None:
+        self.path.write_text(json.dumps({
+            "version": 1,
+            "quarantine_level": "error",
+            "quarantined_video_ids": [_vid(1)],
+            "videos": [{"video_id": _vid(1), "checks": ["stage06b_reject"],
+                        "reasons": [{"check": "stage06b_reject", "message": "REJECT"}]}],
+        }), encoding="utf-8")
+        ledger = QuarantineLedger(self.path).refresh()
+        ledger.record(_vid(1), {"video_id": _vid(1), "checks": ["stage07_block"],
+                                "reasons": [{"check": "stage06b_reject", "message": "REJECT"},
+                                            {"check": "stage07_block", "message": "bad"}]})
+        ledger.record(_vid(2))
+        self.assertIn(_vid(2), ledger)
+        self.assertTrue(ledger.compact())
+
+        payload = json.loads(self.path.read_text(encoding="utf-8"))
+        self.assertEqual(payload["quarantined_video_ids"], [_vid(1), _vid(2)])
+        self.assertEqual(payload["quarantined_video_count"], 2)
+        self.assertEqual(payload["videos"][0]["checks"], ["stage06b_reject", "stage07_block"])
+        self.assertEqual(len(payload["videos"][0]["reasons"]), 2)
+        self.assertEqual(ledger_path_for(self.path).read_text(encoding="utf-8"), "")
+        self.assertFalse(ledger.compact())
+
+    def test_concurrent_writers_lose_nothing(self) -> None:
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=_append_worker, args=(str(self.path), n * 100, 25)) for n in range(4)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(30)
+            self.assertEqual(proc.exitcode, 0)
+
+        expected = {_vid(n * 100 + i) for n in range(4) for i in range(25)}
+        self.assertEqual(QuarantineLedger(self.path).refresh().video_ids, expected)
+        QuarantineLedger(self.path).compact(force=True)
+        payload = json.loads(self.path.read_text(encoding="utf-8"))
+        self.assertEqual(set(payload["quarantined_video_ids"]), expected)
+
+    def test_reader_follows_appends_and_foreign_compaction(self) -> None:
+        reader = QuarantineLedger(self.path).refresh()
+        writer = QuarantineLedger(self.path)
+        writer.record(_vid(1))
+        self.assertEqual(reader.refresh().video_ids, {_vid(1)})
+        writer.compact()
+        writer.record(_vid(2))
+        self.assertEqual(reader.refresh().video_ids, {_vid(1), _vid(2)})
+
+    def test_updates_only_append_until_compaction_is_due(self) -> None:
+        ledger = QuarantineLedger(self.path, compact_every=3, compact_max_age=60)
+        ledger.record(_vid(1))
+        ledger.record(_vid(2))
+        self.assertFalse(self.path.exists())
+        ledger.record(_vid(3))
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["quarantined_video_count"], 3)
+
+        ledger.record(_vid(4))
+        with patch("batch.quarantine_ledger.time.time", return_value=time.time() + 61):
+            ledger.record(_vid(5))
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["quarantined_video_count"], 5)
+        self.assertEqual(ledger_path_for(self.path).stat().st_size, 0)
+
+    def test_updater_appends_and_compacts_on_request(self) -> None:
+        updater = _SCRIPTS_DIR / "batch" / "quarantine_updater.py"
+        report = {"issues": [{"video_id": _vid(1), "issue_code": "stage07_block", "gate_decision": "block"}]}
+        subprocess.run(
+            [sys.executable, str(updater), "--quarantine-file", str(self.path), "--stage", "07"],
+            input=json.dumps(report), text=True, check=True, capture_output=True,
+        )
+        self.assertFalse(self.path.exists())
+        self.assertEqual(load_quarantine_video_ids(self.path), {_vid(1)})
+        subprocess.run(
+            [sys.executable, str(updater), "--quarantine-file", str(self.path), "--compact"],
+            text=True, check=True, capture_output=True,
+        )
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["quarantined_video_ids"], [_vid(1)])
+
+    def test_runner_and_stage_helpers_share_one_ledger_module(self) -> None:
+        batch_dir = _SCRIPTS_DIR / "batch"
+        runner = batch_dir / "pipeline-runner"
+        code = (
+            "import importlib.machinery, sys, types\n"
+            f"sys.path.insert(0, {str(batch_dir)!r})\n"
+            f"loader = importlib.machinery.SourceFileLoader('pipeline_runner', {str(runner)!r})\n"
+            "module = types.ModuleType('pipeline_runner')\n"
+            "module.__file__ = loader.path\n"
+            "loader.exec_module(module)\n"
+            "import batch.quarantine_helpers as helpers, quarantine_updater\n"
+            "assert 'quarantine_ledger' not in sys.modules\n"
+            "assert module.quarantine_ledger_for is helpers.quarantine_ledger_for\n"
+            "assert quarantine_updater.QuarantineLedger is sys.modules['batch.quarantine_ledger'].QuarantineLedger\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+
+    def test_replace_resets_state(self) -> None:
+        ledger = QuarantineLedger(self.path)
+        ledger.record_many([(_vid(1), None), (_vid(2), {"video_id": _vid(2), "checks": ["stage08_block"]})])
+        ledger.replace([{"video_id": _vid(2), "checks": ["stage06b_reject"]}])
+        self.assertEqual(QuarantineLedger(self.path).refresh().video_ids, {_vid(2)})
+        self.assertEqual(ledger.rows(), [{"video_id": _vid(2), "checks": ["stage06b_reject"]}])
+
+    def test_stage_helper_reads_uncompacted_ledger(self) -> None:
+        self.path.write_text(json.dumps([_vid(1)]), encoding="utf-8")
+        QuarantineLedger(self.path).record(_vid(2))
+        self.assertEqual(load_quarantine_video_ids(self.path), {_vid(1), _vid(2)})
+        QuarantineLedger(self.path).record(_vid(3))
+        self.assertEqual(load_quarantine_video_ids(self.path), {_vid(1), _vid(2), _vid(3)})
+
+    def test_stage_helper_raises_on_unreadable_file(self) -> None:
+        self.path.write_text("{not json", encoding="utf-8")
+        with self.assertRaises(RuntimeError):
+            load_quarantine_video_ids(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
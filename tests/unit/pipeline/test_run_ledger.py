@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""SQLite run ledger (batch/run_ledger.py) and its pipeline-runner / batch-status consumers."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.machinery
+import importlib.util
+import io
+import sqlite3
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_BATCH_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+from run_ledger import DEFAULT_LEDGER_PATH, RunLedger, resolve_ledger_path  # noqa: E402
+
+
+def _load_script(name: str, filename: str) -> types.ModuleType:
+    path = _BATCH_DIR / filename
+    loader = importlib.machinery.SourceFileLoader(name, str(path))
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    module.__spec__ = importlib.util.spec_from_loader(name, loader)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+pipeline_runner = _load_script("pipeline_runner", "pipeline-runner")
+batch_status = _load_script("batch_status", "batch-status")
+
+
+def _stage(ledger: RunLedger, run_id: str, video_id: str, stage: str, outcome: str, **kwargs) -> None:
+    fields = dict(
+        video_id=video_id, source="src", stage=stage, llm=stage == "06", started_at=100.0, finished_at=110.0,
+        wait_seconds=2.0, exec_seconds=8.0, attempts=1, exit_code=0, outcome=outcome,
+    )
+    fields.update(kwargs)
+    ledger.record_stage(run_id, "P001.1", **fields)
+
+
+class TestRunLedger(unittest.TestCase):
+    def test_resolve_path_from_flag_and_env(self) -> None:
+        with mock.patch.dict("os.environ", {"PIPELINE_RUN_LEDGER": ""}):
+            self.assertEqual(resolve_ledger_path(), DEFAULT_LEDGER_PATH)
+            self.assertIsNone(resolve_ledger_path("off"))
+            self.assertEqual(resolve_ledger_path("/tmp/x.sqlite"), Path("/tmp/x.sqlite"))
+        with mock.patch.dict("os.environ", {"PIPELINE_RUN_LEDGER": "0"}):
+            self.assertIsNone(resolve_ledger_path())
+
+    def test_latest_rows_throughput_and_totals(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = RunLedger(Path(tmp) / "ledger.sqlite")
+            first = ledger.start_run("P001.1", from_stage="06", to_stage="06b", started_at=0.0)
+            _stage(ledger, first, "AAAAAAAAAAA", "06", "pass", artifacts=["data/a.json"])
+            _stage(ledger, first, "AAAAAAAAAAA", "06b", "quarantined", gate="stage06b_flag_severe")
+            ledger.finish_run(first, exit_code=0, passed=0, failed=0, quarantined=1, finished_at=1800.0)
+            second = ledger.start_run("P001.1", started_at=3600.0)
+            _stage(ledger, second, "AAAAAAAAAAA", "06b", "pass", wait_seconds=10.0, exec_seconds=4.0, attempts=2)
+            ledger.finish_run(second, exit_code=0, passed=1, failed=0, quarantined=0, finished_at=5400.0)
+            ledger.close()
+
+            reader = RunLedger(Path(tmp) / "ledger.sqlite", readonly=True)
+            latest = reader.latest_stage_rows(["AAAAAAAAAAA", "BBBBBBBBBBB"])
+            self.assertEqual(latest[("AAAAAAAAAAA", "06b")]["outcome"], "pass")
+            self.assertEqual(latest[("AAAAAAAAAAA", "06")]["artifacts"], '["data/a.json"]')
+            self.assertEqual(reader.recorded_video_ids(["AAAAAAAAAAA", "BBBBBBBBBBB"]), {"AAAAAAAAAAA"})
+            self.assertEqual(reader.sub_batch_ids("P001"), ["P001.1"])
+            self.assertEqual(reader.sub_batch_ids("P002"), [])
+
+            by_stage = {row["stage"]: row for row in reader.stage_throughput(["P001.1"])}
+            self.assertEqual((by_stage["06b"]["executions"], by_stage["06b"]["passed"]), (2, 1))
+            self.assertEqual((by_stage["06b"]["quarantined"], by_stage["06b"]["attempts"]), (1, 3))
+            self.assertEqual(by_stage["06b"]["wait_max"], 10.0)
+            totals = reader.run_totals(["P001.1"])
+            self.assertEqual((totals["runs"], totals["passed"], totals["videos_per_hour"]), (2, 1, 1.0))
+
+    def test_missing_file_reads_as_empty_and_bad_path_disables_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            reader = RunLedger(Path(tmp) / "missing.sqlite", readonly=True)
+            self.assertEqual(reader.latest_stage_rows(["AAAAAAAAAAA"]), {})
+            self.assertEqual(reader.stage_throughput(), [])
+            self.assertFalse((Path(tmp) / "missing.sqlite").exists())
+
+            blocker = Path(tmp) / "file"
+            blocker.write_text("", encoding="utf-8")
+            writer = RunLedger(blocker / "ledger.sqlite")
+            with contextlib.redirect_stderr(io.StringIO()) as err:
+                run_id = writer.start_run("P001.1")
+                _stage(writer, run_id, "AAAAAAAAAAA", "06", "pass")
+            self.assertTrue(writer.disabled)
+            self.assertEqual(err.getvalue().count("ledger disabled"), 1)
+
+
+class TestRunnerLedgerRows(unittest.TestCase):
+    def _record(self, ledger: RunLedger, vs, execution) -> dict:
+        stage = next(s for s in pipeline_runner.STAGES if s.key == "06b")
+        asyncio.run(pipeline_runner.record_stage_execution(ledger, "run-1", "P001.1", vs, stage, execution))
+        return ledger.latest_stage_rows([vs.video_id])[(vs.video_id, "06b")]
+
+    def test_outcome_and_gate_follow_video_state(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = RunLedger(Path(tmp) / "ledger.sqlite")
+            vs = pipeline_runner.VideoState("AAAAAAAAAAA", "src", "Clip [AAAAAAAAAAA]")
+            pipeline_runner.add_quarantine_reason(vs, "stage06_speaker_collapse_overload", "old")
+            execution = pipeline_runner.StageExecution(checks_before=set(vs.quarantine_checks), attempts=1, exit_code=0)
+            vs.status = "quarantined"
+            pipeline_runner.add_quarantine_reason(vs, "stage06b_flag_severe", "severe flags")
+            row = self._record(ledger, vs, execution)
+            self.assertEqual((row["outcome"], row["gate"], row["detail"]), ("quarantined", "stage06b_flag_severe", "severe flags"))
+
+            failed = pipeline_runner.VideoState("BBBBBBBBBBB", "src", "Clip [BBBBBBBBBBB]", status="failed")
+            failed.error_msg = "llm_timeout_during_stage: timed out"
+            row = self._record(ledger, failed, pipeline_runner.StageExecution())
+            self.assertEqual((row["outcome"], row["gate"]), ("failed", "llm_timeout_during_stage"))
+
+            passed = pipeline_runner.VideoState("CCCCCCCCCCC", "src", "Clip [CCCCCCCCCCC]", status="running")
+            with mock.patch.object(pipeline_runner, "stage_artifact_paths", return_value=["data/x.verification.json"]):
+                row = self._record(ledger, passed, pipeline_runner.StageExecution())
+            self.assertEqual((row["outcome"], row["artifacts"]), ("pass", '["data/x.verification.json"]'))
+
+            checked = pipeline_runner.StageExecution(artifacts=["data/known.verification.json"])
+            with mock.patch.object(pipeline_runner, "stage_artifact_paths") as lookup:
+                row = self._record(ledger, passed, checked)
+            lookup.assert_not_called()
+            self.assertEqual(row["artifacts"], '["data/known.verification.json"]')
+
+
+class TestBatchStatusFromLedger(unittest.TestCase):
+    def _report(self, tmp: Path, ledger: RunLedger):
+        manifest = tmp / "P001.1.txt"
+        manifest.write_text(
+            "src | A [AAAAAAAAAAA]\nsrc | B [BBBBBBBBBBB]\nsrc | C [CCCCCCCCCCC]\n", encoding="utf-8"
+        )
+        index = batch_status.ArtifactIndex(tmp / "data")
+        with mock.patch.object(index, "has", wraps=index.has) as has, contextlib.redirect_stdout(io.StringIO()) as out:
+            batch_status.report_batch(manifest, index, ledger)
+        scanned = {call.args[1] for call in has.call_args_list if call.args[0] == "06b"}
+        return out.getvalue(), scanned
+
+    def _artifact(self, tmp: Path, vid: str) -> Path:
+        path = tmp / "data" / "06b.LLM.verify" / "src" / f"X [{vid}]" / f"X [{vid}].verification.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}", encoding="utf-8")
+        return path
+
+    def test_live_ledger_passes_answer_without_a_scan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            ledger = RunLedger(tmp / "ledger.sqlite")
+            run_id = ledger.start_run("P001.1", started_at=0.0)
+            _stage(ledger, run_id, "AAAAAAAAAAA", "06b", "pass", artifacts=[str(self._artifact(tmp, "AAAAAAAAAAA"))])
+            _stage(ledger, run_id, "BBBBBBBBBBB", "06b", "quarantined")
+            ledger.finish_run(run_id, exit_code=0, passed=1, failed=0, quarantined=1, finished_at=3600.0)
+
+            text, scanned = self._report(tmp, ledger)
+            self.assertIn("Stage 06b (verify         ):    1/3", text)
+            self.assertIn("(1 quarantined)", text)
+            self.assertIn("Throughput (run ledger, 1 finished run(s), 1.0 videos/h)", text)
+            self.assertEqual(scanned, {"[BBBBBBBBBBB]", "[CCCCCCCCCCC]"})
+
+    def test_stale_rows_fall_back_to_the_artifact_scan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            ledger = RunLedger(tmp / "ledger.sqlite")
+            run_id = ledger.start_run("P001.1", started_at=0.0)
+            # A's recorded output was deleted; B was quarantined, then fixed outside the runner.
+            gone = self._artifact(tmp, "AAAAAAAAAAA")
+            _stage(ledger, run_id, "AAAAAAAAAAA", "06b", "pass", artifacts=[str(gone)])
+            gone.unlink()
+            _stage(ledger, run_id, "BBBBBBBBBBB", "06b", "quarantined")
+            _stage(ledger, run_id, "CCCCCCCCCCC", "06b", "error")
+            self._artifact(tmp, "BBBBBBBBBBB")
+
+            text, scanned = self._report(tmp, ledger)
+            self.assertIn("Stage 06b (verify         ):    1/3", text)
+            self.assertNotIn("quarantined)", text)
+            self.assertEqual(scanned, {"[AAAAAAAAAAA]", "[BBBBBBBBBBB]", "[CCCCCCCCCCC]"})
+
+
+class TestLedgerSchema(unittest.TestCase):
+    def test_indexes_cover_status_and_throughput_queries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger = RunLedger(Path(tmp) / "ledger.sqlite")
+            ledger.start_run("P001.1")
+            ledger.close()
+            conn = sqlite3.connect(str(Path(tmp) / "ledger.sqlite"))
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            conn.close()
+            self.assertTrue({"stage_runs_by_video", "stage_runs_by_sub_batch", "runs_by_sub_batch"} <= names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Live Prometheus metrics for pipeline-runner (batch/runner_metrics.py)."""
+from __future__ import annotations
+
+import asyncio
+import importlib.machinery
+import importlib.util
+import sys
+import tempfile
+import types
+import unittest
+import urllib.request
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+_BATCH_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+from runner_metrics import RunnerMetrics, serve_metrics, stage_phase_samples  # noqa: E402
+
+_RUNNER_PATH = _BATCH_DIR / "pipeline-runner"
+_LOADER = importlib.machinery.SourceFileLoader("pipeline_runner", str(_RUNNER_PATH))
+pipeline_runner = types.ModuleType("pipeline_runner")
+pipeline_runner.__file__ = str(_RUNNER_PATH)
+pipeline_runner.__spec__ = importlib.util.spec_from_loader("pipeline_runner", _LOADER)
+sys.modules["pipeline_runner"] = pipeline_runner
+_LOADER.exec_module(pipeline_runner)
+
+
+class TestRunnerMetrics(unittest.TestCase):
+    def test_render_counters_histograms_and_live_gauges(self) -> None:
+        metrics = RunnerMetrics("P001.1", lambda: [("pipeline_runner_videos", {"state": "running"}, 3)])
+        metrics.observe_stage("06b", "quarantined", "stage06b_flag_severe", 42.0, 3.0, 1)
+        metrics.observe_stage("06b", "pass", None, 2.0, None, 1)
+        metrics.observe_llm_attempt("06b", 1, "timeout")
+        metrics.llm_line_observer("07")("[07.LLM.content] JSON parse error: Expecting value")
+        metrics.llm_line_observer("07")("window 3 done")
+        text = metrics.render()
+
+        self.assertIn("# TYPE pipeline_runner_stage_duration_seconds histogram", text)
+        self.assertIn('pipeline_runner_videos{sub_batch="P001.1",state="running"} 3', text)
+        self.assertIn(
+            'pipeline_runner_stage_executions_total{sub_batch="P001.1",stage="06b",outcome="quarantined"} 1', text
+        )
+        self.assertIn('pipeline_runner_quarantines_total{sub_batch="P001.1",stage="06b",check="stage06b_flag_severe"} 1', text)
+        self.assertIn('pipeline_runner_stage_duration_seconds_bucket{sub_batch="P001.1",stage="06b",le="5"} 1', text)
+        self.assertIn('pipeline_runner_stage_duration_seconds_bucket{sub_batch="P001.1",stage="06b",le="+Inf"} 2', text)
+        self.assertIn('pipeline_runner_stage_duration_seconds_sum{sub_batch="P001.1",stage="06b"} 44', text)
+        self.assertIn('pipeline_runner_stage_wait_seconds_count{sub_batch="P001.1",stage="06b"} 1', text)
+        self.assertIn('pipeline_runner_llm_attempts_total{sub_batch="P001.1",stage="06b",outcome="timeout"} 1', text)
+        self.assertIn('pipeline_runner_llm_parse_failures_total{sub_batch="P001.1",stage="07"} 1', text)
+
+    def test_stage_phases_from_progress_strings(self) -> None:
+        samples = {
+            (labels["stage"], labels["phase"]): value
+            for _, labels, value in stage_phase_samples(
+                ["06b(wait)", "06b(llm)", "06b(parked)", "02(gpu)", "06c", "done", "FAIL(llm_limit)"], ["02", "06b", "06c"]
+            )
+        }
+        self.assertEqual(
+            (samples[("06b", "queued")], samples[("06b", "running")], samples[("06b", "parked")]), (1, 1, 1)
+        )
+        self.assertEqual((samples[("02", "running")], samples[("06c", "running")], samples[("06c", "queued")]), (1, 1, 0))
+
+    def test_textfile_and_http_endpoint_serve_the_same_text(self) -> None:
+        metrics = RunnerMetrics("P001.1")
+        metrics.observe_llm_attempt("06", 0, None)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "runner.prom"
+            metrics.write_textfile(path)
+            self.assertEqual(path.read_text(encoding="utf-8"), metrics.render())
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ["runner.prom"])
+
+        server = serve_metrics(metrics, 0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=10) as response:
+                body = response.read().decode("utf-8")
+            self.assertIn('pipeline_runner_llm_attempts_total{sub_batch="P001.1",stage="06",outcome="ok"} 1', body)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestRunVideoMetrics(unittest.TestCase):
+    def test_run_video_counts_attempts_and_stage_outcomes(self) -> None:
+        vs = pipeline_runner.VideoState("AAAAAAAAAAA", "src", "Clip [AAAAAAAAAAA]")
+        stages = [pipeline_runner.Stage("06", "06.LLM.video-type", needs_llm=True)]
+        metrics = RunnerMetrics("P001.1")
+
+        async def _run() -> None:
+            with patch.object(pipeline_runner, "replay_upstream_gates_for_resume", return_value=False), patch.object(
+                pipeline_runner, "build_stage_command", return_value=["echo", "ignored"]
+            ), patch.object(pipeline_runner, "run_contract_preflight", new=AsyncMock(return_value=0)), patch.object(
+                pipeline_runner, "run_subprocess", new=AsyncMock(return_value=(0, None, ""))
+            ), patch.object(pipeline_runner, "evaluate_06_gate", return_value=(False, None, None)):
+                await pipeline_runner.run_video(
+                    vs=vs,
+                    stages=stages,
+                    semaphore=asyncio.Semaphore(1),
+                    stage_semaphores={},
+                    llm_outage_event=asyncio.Event(),
+                    stage_env=None,
+                    quarantine_file=None,
+                    preexisting_quarantine_ids=set(),
+                    dry_run=False,
+                    progress={vs.video_id: "pending"},
+                    run_metrics=metrics,
+                )
+
+        asyncio.run(_run())
+        text = metrics.render()
+        self.assertEqual(vs.status, "done")
+        self.assertIn('pipeline_runner_llm_attempts_total{sub_batch="P001.1",stage="06",outcome="ok"} 1', text)
+        self.assertIn('pipeline_runner_stage_executions_total{sub_batch="P001.1",stage="06",outcome="pass"} 1', text)
+        self.assertIn('pipeline_runner_stage_wait_seconds_count{sub_batch="P001.1",stage="06"} 1', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Tests for segment checkpoints: Stage 02 resume-after-crash and Stage 03 batch skip."""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+from batch.segment_checkpoint import (  # noqa: E402
+    SegmentCheckpoint,
+    WindowCheckpoint,
+    checkpoint_path_for,
+    window_checkpoint_path_for,
+    window_prompt_hash,
+)
+
+
+def _load(name: str, filename: str) -> types.ModuleType:
+    path = _SCRIPTS_DIR / filename
+    loader = importlib.machinery.SourceFileLoader(name, str(path))
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    module.__spec__ = importlib.util.spec_from_loader(name, loader=loader)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+transcribe02 = _load("transcribe02", "02.EXT.transcribe")
+align03 = _load("align03", "03.EXT.align")
+
+_SEGMENTS = [
+    {
+        "start": float(i) * 5.0,
+        "end": float(i) * 5.0 + 4.0,
+        "text": f"so then I opened with line number {i}",
+        "words": [{"word": "so", "start": float(i) * 5.0, "end": float(i) * 5.0 + 0.5}],
+    }
+    for i in range(60)
+]
+
+
+class _Crash(Exception):
+    pass
+
+
+class _SeekingEngine(transcribe02.BaseEngine):
+    """Yields _SEGMENTS from start_sec on; optionally dies after crash_after segments."""
+
+    name = "fake"
+    model_name = "fake-model"
+
+    def __init__(self, crash_after=None) -> None:
+        self.batched = False
+        self.decode_options = {"beam_size": 3}
+        self.crash_after = crash_after
+        self.start_secs = []
+
+    def transcribe(self, audio_path, batched=None, monitor=None, overrides=None, start_sec=0.0, on_segment=None):
+        self.start_secs.append(start_sec)
+        out = []
+        for seg in _SEGMENTS:
+            if seg["start"] < start_sec:
+                continue
+            if self.crash_after is not None and len(out) >= self.crash_after:
+                raise _Crash("simulated OOM")
+            if on_segment is not None:
+                on_segment(dict(seg))
+            out.append(dict(seg))
+        return {"text": "", "segments": out}
+
+
+class TestSegmentCheckpoint(unittest.TestCase):
+    def test_partial_path_does_not_match_full_json_glob(self) -> None:
+        path = checkpoint_path_for(Path("/x/Sample [AAAAAAAAAAA].full.json"))
+        self.assertEqual(path.name, "Sample [AAAAAAAAAAA].full.partial.json")
+        self.assertFalse(path.match("*.full.json"))
+
+    def test_fingerprint_mismatch_discards_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a.full.partial.json"
+            ckpt = SegmentCheckpoint(path, kind="transcribe", fingerprint={"model": "a"})
+            ckpt.commit([{"start": 0.0, "end": 1.0, "text": "hi"}])
+            ckpt.flush()
+
+            same = SegmentCheckpoint(path, kind="transcribe", fingerprint={"model": "a"})
+            self.assertTrue(same.load())
+            self.assertEqual(same.committed_until_sec, 1.0)
+
+            other = SegmentCheckpoint(path, kind="transcribe", fingerprint={"model": "b"})
+            self.assertFalse(other.load())
+            self.assertFalse(path.exists())
+
+
+class TestTranscribeResume(unittest.TestCase):
+    def _run(self, tmp: Path, engine, name: str):
+        audio = tmp / "audio.wav"
+        if not audio.exists():
+            audio.write_bytes(b"RIFF")
+        out_json = tmp / name / "Sample [AAAAAAAAAAA].full.json"
+        out_json.parent.mkdir(parents=True, exist_ok=True)
+        with patch.object(
+            transcribe02, "load_audio_mono", return_value=(np.zeros(16000 * 300, dtype=np.float32), 16000)
+        ):
+            transcribe02.transcribe_full_file_with_engine(
+                audio_path=str(audio),
+                out_json=str(out_json),
+                engine=engine,
+                progress_interval=60.0,
+                checkpoint_interval=1e-9,
+            )
+        return out_json
+
+    def test_resume_after_crash_matches_single_pass(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_str:
+            tmp = Path(tmp_str)
+            single = self._run(tmp, _SeekingEngine(), "single")
+            single_payload = json.loads(single.read_text(encoding="utf-8"))
+
+            with self.assertRaises(_Crash):
+                self._run(tmp, _SeekingEngine(crash_after=25), "resumed")
+            out_json = tmp / "resumed" / "Sample [AAAAAAAAAAA].full.json"
+            partial = checkpoint_path_for(out_json)
+            self.assertFalse(out_json.exists())
+            self.assertTrue(partial.exists())
+
+            engine = _SeekingEngine()
+            self._run(tmp, engine, "resumed")
+            resumed_payload = json.loads(out_json.read_text(encoding="utf-8"))
+
+        self.assertEqual(engine.start_secs, [_SEGMENTS[24]["end"]])
+        self.assertFalse(partial.exists())
+        self.assertEqual(resumed_payload["segments"], single_payload["segments"])
+        self.assertEqual(resumed_payload["text"], single_payload["text"])
+        self.assertEqual(set(resumed_payload), set(single_payload))
+        self.assertEqual(
+            resumed_payload["transcribe_meta"]["throughput"]["resumed_from_sec"], _SEGMENTS[24]["end"]
+        )
+
+
+class _FakeAlignEngine(align03.AlignEngine):
+    ALIGN_BATCH_SEGMENTS = 10
+
+    def __init__(self, crash_on_batch=None) -> None:
+        self.language = "en"
+        self.device = "cpu"
+        self.crash_on_batch = crash_on_batch
+        self.batches = 0
+
+    def _align_batch(self, segments_batch, audio16k):
+        self.batches += 1
+        if self.crash_on_batch is not None and self.batches == self.crash_on_batch:
+            raise _Crash("simulated CUDA error")
+        return [dict(seg) for seg in segments_batch]
+
+
+class TestAlignResume(unittest.TestCase):
+    def test_finished_batches_are_skipped_on_rerun(self) -> None:
+        segments = [dict(seg) for seg in _SEGMENTS[:35]]
+        with tempfile.TemporaryDirectory() as tmp_str:
+            tmp = Path(tmp_str)
+            transcription = tmp / "in.full.json"
+            transcription.write_text(json.dumps({"text": "", "segments": segments}), encoding="utf-8")
+            audio = tmp / "audio.wav"
+            audio.write_bytes(b"RIFF")
+            out_json = tmp / "out" / "Sample [AAAAAAAAAAA].full.json"
+
+            with patch.object(align03, "load_audio_16k_for_whisperx", return_value=np.zeros(16000 * 300)):
+                with self.assertRaises(_Crash):
+                    align03.align_transcription(transcription, audio, out_json, _FakeAlignEngine(crash_on_batch=3))
+                engine = _FakeAlignEngine()
+                align03.align_transcription(transcription, audio, out_json, engine)
+
+            payload = json.loads(out_json.read_text(encoding="utf-8"))
+            partial_left = checkpoint_path_for(out_json).exists()
+
+        self.assertEqual(engine.batches, 2)
+        self.assertEqual(len(payload["segments"]), 35)
+        self.assertFalse(partial_left)
+
+
+class TestWindowCheckpoint(unittest.TestCase):
+    FINGERPRINT = {"video_id": "AAAAAAAAAAA", "prompt_version": "x", "claude_model": None}
+
+    def test_stored_windows_survive_reload_and_fingerprint_change_drops_them(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_str:
+            out_json = Path(tmp_str) / "Sample [AAAAAAAAAAA].enriched.json"
+            path = window_checkpoint_path_for(out_json)
+            self.assertEqual(path.name, "Sample [AAAAAAAAAAA].enriched.windows.partial.json")
+            self.assertFalse(path.name.endswith(".enriched.json"))
+
+            key = window_prompt_hash("window 1 prompt")
+            first = WindowCheckpoint(path, dict(self.FINGERPRINT))
+            self.assertEqual(first.load(), 0)
+            first.record(key, 0, '{"enrichments": []}', 12.34567)
+
+            resumed = WindowCheckpoint(path, dict(self.FINGERPRINT))
+            self.assertEqual(resumed.load(), 1)
+            self.assertEqual(resumed.get(key)["elapsed_seconds"], 12.346)
+            self.assertIsNone(resumed.get(window_prompt_hash("window 1 prompt, edited")))
+
+            stale = WindowCheckpoint(path, {**self.FINGERPRINT, "prompt_version": "y"})
+            self.assertEqual(stale.load(), 0)
+            self.assertFalse(path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
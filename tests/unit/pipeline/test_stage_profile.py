@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Stage --profile hooks (batch/stage_profile.py), profile_summary and the runner's --profile-stage."""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import types
+import unittest
+from pathlib import Path
+
+_TRAINING_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+_BATCH_DIR = _TRAINING_DIR / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+from stage_profile import _pop_profile_args, profile_label  # noqa: E402
+
+_SUMMARY_SPEC = importlib.util.spec_from_file_location(
+    "profile_summary", _TRAINING_DIR / "validation" / "profile_summary.py"
+)
+profile_summary = importlib.util.module_from_spec(_SUMMARY_SPEC)
+assert _SUMMARY_SPEC and _SUMMARY_SPEC.loader
+_SUMMARY_SPEC.loader.exec_module(profile_summary)
+
+_RUNNER_PATH = _BATCH_DIR / "pipeline-runner"
+_LOADER = importlib.machinery.SourceFileLoader("pipeline_runner", str(_RUNNER_PATH))
+pipeline_runner = types.ModuleType("pipeline_runner")
+pipeline_runner.__file__ = str(_RUNNER_PATH)
+pipeline_runner.__spec__ = importlib.util.spec_from_loader("pipeline_runner", _LOADER)
+sys.modules["pipeline_runner"] = pipeline_runner
+_LOADER.exec_module(pipeline_runner)
+
+_PROFILED_SCRIPT = textwrap.dedent(
+    """
+    import sys
+    sys.path.insert(0, {training_dir!r})
+    from batch.stage_profile import enable_stage_profiling
+
+    enable_stage_profiling("06c")
+    assert sys.argv[1:] == ["--manifest", {manifest!r}], sys.argv
+
+
+    def hot_loop():
+        return [str(i) * 8 for i in range(20000)]
+
+
+    kept = hot_loop()
+    sys.exit(0)
+    """
+)
+
+
+class TestProfileArgs(unittest.TestCase):
+    def test_strips_only_profile_flags(self) -> None:
+        argv = ["--manifest", "m.txt", "--profile", "both", "--profile-dir=/tmp/p", "--overwrite"]
+        found = _pop_profile_args(argv)
+        self.assertEqual(argv, ["--manifest", "m.txt", "--overwrite"])
+        self.assertEqual((found["profile"], found["profile_dir"], found["profile_top"]), ("both", "/tmp/p", None))
+
+    def test_label_is_single_video_id_or_manifest_name(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            one = Path(tmp) / "pipeline-runner-abc.txt"
+            one.write_text("src | Clip [AAAAAAAAAAA]\n", encoding="utf-8")
+            many = Path(tmp) / "P001.1.txt"
+            many.write_text("src | A [AAAAAAAAAAA]\nsrc | B [BBBBBBBBBBB]\n", encoding="utf-8")
+            self.assertEqual(profile_label(["--manifest", str(one)]), "AAAAAAAAAAA")
+            self.assertEqual(profile_label(["--manifest", str(many)]), "P001.1")
+            self.assertEqual(profile_label(["data/x/Clip [CCCCCCCCCCC].json"]), "CCCCCCCCCCC")
+            self.assertEqual(profile_label([]), "run")
+
+
+class TestProfiledRun(unittest.TestCase):
+    def test_writes_profiles_at_exit_and_summary_aggregates_them(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            manifest = tmp / "one.txt"
+            manifest.write_text("src | Clip [AAAAAAAAAAA]\n", encoding="utf-8")
+            script = tmp / "stage.py"
+            script.write_text(_PROFILED_SCRIPT.format(training_dir=str(_TRAINING_DIR), manifest=str(manifest)))
+            env = dict(os.environ, PIPELINE_PROFILE_DIR=str(tmp / "profiles"))
+            for _ in range(2):
+                result = subprocess.run(
+                    [sys.executable, str(script), "--manifest", str(manifest), "--profile", "both"],
+                    capture_output=True, text=True, env=env, timeout=60,
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+
+            runs = profile_summary.load_runs(tmp / "profiles")
+            self.assertEqual(len(runs), 2)
+            self.assertEqual({r["label"] for r in runs}, {"AAAAAAAAAAA"})
+
+            summary = profile_summary.summarize(tmp / "profiles", None, 50, "cumulative")
+            stage = summary["stages"]["06c"]
+            self.assertEqual((stage["runs"], stage["videos"]), (2, 1))
+            hot = [row for row in stage["cpu_top"] if row["function"].endswith("(hot_loop)")]
+            self.assertEqual([(row["ncalls"], row["runs"]) for row in hot], [(2, 2)])
+            self.assertEqual(stage["memory"]["runs"], 2)
+            self.assertTrue(any(site["file"] == str(script) for site in stage["memory"]["sites"]))
+
+
+class TestRunnerProfileStage(unittest.TestCase):
+    def test_parses_modes_and_adds_flags_to_python_stages(self) -> None:
+        modes = pipeline_runner.parse_stage_profile_modes(["all=mem", "07=cpu"])
+        self.assertEqual((modes["06c"], modes["07"]), ("mem", "cpu"))
+        self.assertNotIn("09", modes)
+        for bad in ("07", "07=fast", "99=cpu"):
+            with self.assertRaises(ValueError):
+                pipeline_runner.parse_stage_profile_modes([bad])
+
+        stage = next(s for s in pipeline_runner.STAGES if s.key == "07")
+        cmd = pipeline_runner.build_stage_command(stage, "m.txt", profile_mode="cpu", profile_dir=Path("/tmp/p"))
+        self.assertEqual(cmd[-4:], ["--profile", "cpu", "--profile-dir", "/tmp/p"])
+        self.assertNotIn("--profile", pipeline_runner.build_stage_command(stage, "m.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Sub-batch contract completeness from one shared artifact scan (batch/subbatch_status.py)."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_BATCH_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "batch"
+if str(_BATCH_DIR) not in sys.path:
+    sys.path.insert(0, str(_BATCH_DIR))
+
+import subbatch_status  # noqa: E402
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{}", encoding="utf-8")
+
+
+class TestSubBatchStatus(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.data = root / "data"
+        self.batches = root / "batches"
+        self.batches.mkdir()
+        (self.batches / "P001.1.txt").write_text(
+            "# comment\n"
+            "src | Clip A [AAAAAAAAAAA]\n"
+            "src | Clip B [BBBBBBBBBBB]\n"
+            "other|no id\n",
+            encoding="utf-8",
+        )
+        (self.batches / "P001.2.txt").write_text("alt | Clip C [CCCCCCCCCCC]\n", encoding="utf-8")
+        (self.batches / "P001.status.json").write_text(
+            json.dumps({"sub_batches": {"P001.1": {"status": "done", "current_stage": "09", "note": "ok"}}}),
+            encoding="utf-8",
+        )
+
+        enriched = self.data / "07.LLM.content" / "src" / "Clip A [AAAAAAAAAAA]"
+        _touch(enriched / "Clip A [AAAAAAAAAAA].audio.asr.clean16k.enriched.json")
+        # Wrong pattern for stage 07: must not count.
+        _touch(self.data / "07.LLM.content" / "src" / "Clip B [BBBBBBBBBBB].enriched.validation.json")
+        _touch(self.data / "07.LLM.content" / "alt" / "Clip C [CCCCCCCCCCC].enriched.json")
+        for vid in ("AAAAAAAAAAA", "BBBBBBBBBBB"):
+            _touch(self.data / "06.LLM.video-type" / "src" / f"Clip [{vid}].conversations.json")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _statuses(self, **kwargs):
+        return subbatch_status.sub_batches_status(
+            ["P001.1", "P001.2"], data_root=self.data, batches=self.batches, detect_running=False, **kwargs
+        )
+
+    def test_stage_counts_follow_pattern_and_basename_contract(self) -> None:
+        s1 = self._statuses()["P001.1"]
+        self.assertEqual(s1.total_videos, 2)
+        self.assertEqual(s1.stages["06"].to_dict()["complete"], True)
+        st07 = s1.stages["07"]
+        self.assertEqual((st07.done, st07.total, st07.partial), (1, 2, True))
+        self.assertEqual(st07.missing, ["Clip B [BBBBBBBBBBB]"])
+        self.assertEqual(s1.stages["09"].done, 0)
+        self.assertEqual((s1.status, s1.current_stage, s1.note), ("done", "09", "ok"))
+
+    def test_each_stage_dir_is_walked_once_for_all_sub_batches(self) -> None:
+        real_walk = os.walk
+        walked = []
+
+        def counting_walk(top, *args, **kwargs):
+            walked.append(Path(top).name)
+            return real_walk(top, *args, **kwargs)
+
+        with patch.object(subbatch_status.os, "walk", side_effect=counting_walk):
+            statuses = self._statuses()
+        self.assertEqual(statuses["P001.2"].stages["07"].done, 1)
+        self.assertEqual(statuses["P001.2"].status, "unknown")
+        self.assertEqual(sorted(walked), sorted(set(walked)))
+
+    def test_symlinked_stage_dir_and_source_scope(self) -> None:
+        real = self.data.parent / "elsewhere" / "09.EXT.chunks"
+        _touch(real / "src" / "AAAAAAAAAAA.chunks.json")
+        (self.data / "09.EXT.chunks").symlink_to(real, target_is_directory=True)
+
+        index = subbatch_status.ArtifactIndex(self.data)
+        self.assertTrue(index.has("09", "AAAAAAAAAAA"))
+        self.assertTrue(index.has("07", "[CCCCCCCCCCC]", source="alt"))
+        self.assertFalse(index.has("07", "[CCCCCCCCCCC]", source="src"))
+
+    def test_running_pipeline_overrides_recorded_status(self) -> None:
+        index = subbatch_status.ArtifactIndex(self.data)
+        status = subbatch_status.sub_batch_status("P001.1", index, batches=self.batches, running={"P001.1"})
+        self.assertEqual(status.status, "in_progress")
+        text = subbatch_status.format_status_text(status)
+        self.assertIn("=== Sub-batch P001.1 Status (2 videos) ===", text)
+        self.assertIn("  🔶 Stage 07: 1/2\n      missing: Clip B [BBBBBBBBBBB]", text)
+        self.assertTrue(text.endswith("Overall status: in_progress"))
+
+
+if __name__ == "__main__":
+    unittest.main()
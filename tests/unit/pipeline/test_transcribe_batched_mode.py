@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for Stage 02 decode-mode plumbing (batched vs sequential) and transcribe_meta throughput."""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+_MODULE_PATH = _SCRIPTS_DIR / "02.EXT.transcribe"
+_LOADER = importlib.machinery.SourceFileLoader("transcribe02", str(_MODULE_PATH))
+_SPEC = importlib.util.spec_from_loader("transcribe02", loader=_LOADER)
+transcribe02 = types.ModuleType("transcribe02")
+transcribe02.__file__ = str(_MODULE_PATH)
+transcribe02.__spec__ = _SPEC
+sys.modules["transcribe02"] = transcribe02
+_LOADER.exec_module(transcribe02)
+
+
+class _FakeEngine(transcribe02.BaseEngine):
+    name = "fake"
+    model_name = "fake-model"
+
+    def __init__(self, batched: bool) -> None:
+        self.batched = batched
+        self.decode_options = {"beam_size": 3, "batch_size": 4}
+        self.calls = []
+
+    def transcribe(self, audio_path, batched=None, monitor=None, overrides=None, start_sec=0.0, on_segment=None):
+        self.calls.append(batched)
+        label = "batched" if batched else "sequential"
+        segments = [
+            {"start": float(i), "end": float(i) + 0.9, "text": f"{label} sentence number {i} is here"}
+            for i in range(0, 100)
+        ]
+        return {"text": "", "segments": segments}
+
+
+class TestTranscribeDecodeModes(unittest.TestCase):
+    def _run(self, engine, compare_modes):
+        with tempfile.TemporaryDirectory() as tmp:
+            out_json = Path(tmp) / "Sample [AAAAAAAAAAA].full.json"
+            with patch.object(
+                transcribe02, "load_audio_mono", return_value=(np.zeros(16000 * 100, dtype=np.float32), 16000)
+            ):
+                result = transcribe02.transcribe_full_file_with_engine(
+                    audio_path="audio.wav",
+                    out_json=str(out_json),
+                    engine=engine,
+                    progress_interval=60.0,
+                    compare_modes=compare_modes,
+                )
+            payload = json.loads(out_json.read_text(encoding="utf-8"))
+        return result, payload
+
+    def test_batched_mode_records_throughput_and_keeps_segment_shape(self) -> None:
+        engine = _FakeEngine(batched=True)
+        result, payload = self._run(engine, compare_modes=False)
+
+        self.assertEqual(engine.calls, [True])
+        self.assertEqual(set(payload), {"text", "segments", "transcribe_meta"})
+        self.assertEqual(set(payload["segments"][0]), {"start", "end", "text"})
+        self.assertTrue(payload["segments"][0]["text"].startswith("batched"))
+        throughput = payload["transcribe_meta"]["throughput"]
+        self.assertEqual(throughput["mode"], "batched")
+        self.assertEqual(throughput["batch_size"], 4)
+        self.assertEqual(throughput["audio_sec"], 100.0)
+        self.assertEqual(result["throughput"], throughput)
+        self.assertNotIn("throughput_compare", payload["transcribe_meta"])
+
+    def test_compare_modes_times_both_but_writes_primary(self) -> None:
+        engine = _FakeEngine(batched=False)
+        _, payload = self._run(engine, compare_modes=True)
+
+        self.assertEqual(engine.calls, [False, True])
+        self.assertTrue(payload["segments"][0]["text"].startswith("sequential"))
+        compare = payload["transcribe_meta"]["throughput_compare"]
+        self.assertEqual(set(compare), {"sequential", "batched"})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Tests for the Stage 02 streaming hallucination monitor and abort/restart decode loop."""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+_MODULE_PATH = _SCRIPTS_DIR / "02.EXT.transcribe"
+_LOADER = importlib.machinery.SourceFileLoader("transcribe02", str(_MODULE_PATH))
+_SPEC = importlib.util.spec_from_loader("transcribe02", loader=_LOADER)
+transcribe02 = types.ModuleType("transcribe02")
+transcribe02.__file__ = str(_MODULE_PATH)
+transcribe02.__spec__ = _SPEC
+sys.modules["transcribe02"] = transcribe02
+_LOADER.exec_module(transcribe02)
+
+
+def _feed(monitor, segments):
+    for seg in segments:
+        verdict = monitor.observe(seg)
+        if verdict:
+            return verdict
+    return None
+
+
+def _loop(text, start, count, step=8.0):
+    return [{"start": start + i * step, "end": start + i * step + step - 0.5, "text": text} for i in range(count)]
+
+
+def _speech(start, count, step=4.0):
+    return [
+        {"start": start + i * step, "end": start + i * step + step - 0.5, "text": f"so I walked up to her and said hi number {i}"}
+        for i in range(count)
+    ]
+
+
+class _LoopingEngine(transcribe02.BaseEngine):
+    """Loops on the first decode; clean once restarted with overrides (unless always_loop)."""
+
+    name = "fake"
+
+    def __init__(self, always_loop: bool = False) -> None:
+        self.batched = False
+        self.decode_options = {}
+        self.always_loop = always_loop
+        self.overrides_seen = []
+
+    def transcribe(self, audio_path, batched=None, monitor=None, overrides=None, start_sec=0.0, on_segment=None):
+        self.overrides_seen.append(overrides)
+        looping = self.always_loop or not overrides
+        segments = _speech(0.0, 10) + (_loop("I'm going to go to the next one.", 40.0, 40) if looping else _speech(40.0, 80))
+        out = []
+        for seg in segments:
+            if monitor is not None:
+                verdict = monitor.observe(seg)
+                if verdict is not None:
+                    raise transcribe02.DecodeAborted(verdict)
+            out.append(seg)
+        return {"text": "", "segments": out}
+
+
+class TestStreamingQualityMonitor(unittest.TestCase):
+    def test_clean_speech_never_aborts(self) -> None:
+        monitor = transcribe02.StreamingQualityMonitor(duration_sec=600.0)
+        self.assertIsNone(_feed(monitor, _speech(0.0, 150)))
+        self.assertGreater(monitor.wpm_so_far(), 0)
+
+    def test_sentence_loop_aborts_once_span_is_long(self) -> None:
+        monitor = transcribe02.StreamingQualityMonitor(duration_sec=7200.0)
+        verdict = _feed(monitor, _speech(0.0, 10) + _loop("I'm going to go to the next one.", 40.0, 40))
+        self.assertIsNotNone(verdict)
+        self.assertEqual(verdict["reason"], "repetition_runaway")
+        self.assertGreaterEqual(verdict["repeat_count"], transcribe02.STREAM_ABORT_REPEAT_SEGMENTS)
+        self.assertLess(verdict["at_sec"], 200.0)
+
+    def test_short_artifact_loop_gets_longer_grace(self) -> None:
+        monitor = transcribe02.StreamingQualityMonitor(duration_sec=7200.0)
+        # 30 x "Thank you." over ~4 minutes: edge-trim territory, not yet a runaway.
+        self.assertIsNone(_feed(monitor, _loop("Thank you.", 0.0, 30)))
+        verdict = _feed(monitor, _loop("Thank you.", 240.0, 60))
+        self.assertEqual(verdict["reason"], "repetition_runaway")
+
+    def test_wpm_spike_aborts(self) -> None:
+        monitor = transcribe02.StreamingQualityMonitor(duration_sec=600.0)
+        dense = [
+            {"start": float(i), "end": float(i) + 0.9, "text": " ".join(f"w{i}x{j}" for j in range(10))}
+            for i in range(90)
+        ]
+        verdict = _feed(monitor, dense)
+        self.assertEqual(verdict["reason"], "wpm_spike")
+
+
+class TestStreamingAbortRestart(unittest.TestCase):
+    def _run(self, engine):
+        with tempfile.TemporaryDirectory() as tmp:
+            out_json = Path(tmp) / "Sample [AAAAAAAAAAA].full.json"
+            with patch.object(
+                transcribe02, "load_audio_mono", return_value=(np.zeros(16000 * 400, dtype=np.float32), 16000)
+            ):
+                result = transcribe02.transcribe_full_file_with_engine(
+                    audio_path="audio.wav",
+                    out_json=str(out_json),
+                    engine=engine,
+                    progress_interval=60.0,
+                )
+            payload = json.loads(out_json.read_text(encoding="utf-8")) if out_json.exists() else None
+        return result, payload
+
+    def test_abort_then_clean_restart_writes_output(self) -> None:
+        engine = _LoopingEngine()
+        result, payload = self._run(engine)
+
+        self.assertEqual(engine.overrides_seen, [None, transcribe02.STREAM_RESTART_OVERRIDES])
+        self.assertEqual(len(result["decode_aborts"]), 1)
+        self.assertEqual(result["decode_aborts"][0]["attempt"], 1)
+        self.assertNotEqual(result["quality"]["severity"], "CRITICAL")
+        self.assertIsNotNone(payload)
+        self.assertEqual(len(payload["transcribe_meta"]["decode_aborts"]), 1)
+
+    def test_repeated_abort_is_critical_and_skips_write(self) -> None:
+        engine = _LoopingEngine(always_loop=True)
+        result, payload = self._run(engine)
+
+        self.assertEqual(len(engine.overrides_seen), 1 + transcribe02.STREAM_MAX_RESTARTS)
+        self.assertEqual(result["quality"]["severity"], "CRITICAL")
+        self.assertEqual(len(result["decode_aborts"]), 1 + transcribe02.STREAM_MAX_RESTARTS)
+        self.assertIsNone(payload)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import importlib.util
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -85,5 +86,89 @@ class TestValidateStageContract(unittest.TestCase):
             self.assertEqual(missing_ids, [raw_id])
 
 
+class TestStageContractPreflight(unittest.TestCase):
+    def test_scans_once_and_rescans_only_on_miss(self) -> None:
+        ids = ["AAAAAAAAAAA", "BBBBBBBBBBB", "CCCCCCCCCCC"]
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+
+            def write_06h(vid: str) -> None:
+                _write(root / "data/06h.DET.confidence-propagation/src" / f"V [{vid}]" / f"V [{vid}].conversations.json")
+
+            write_06h(ids[0])
+            write_06h(ids[1])
+            with patch.object(stage_contract, "repo_root", return_value=root):
+                preflight = stage_contract.StageContractPreflight()
+                self.assertEqual(preflight.check("07", {ids[0]})["summary"]["status"], "pass")
+                self.assertEqual(preflight.check("07", {ids[1]})["summary"]["status"], "pass")
+                self.assertEqual(preflight.scans, 1)
+
+                failed = preflight.check("07", {ids[2]})
+                self.assertEqual(failed["summary"]["status"], "fail")
+                self.assertEqual(failed["dependencies"][0]["missing_video_ids"], [ids[2]])
+                self.assertEqual(preflight.scans, 2)
+
+                write_06h(ids[2])
+                self.assertEqual(preflight.check("07", {ids[2]})["summary"]["status"], "pass")
+                self.assertEqual(preflight.scans, 3)
+
+                with self.assertRaises(ValueError):
+                    preflight.check("01", {ids[0]})
+
+    def test_noted_outputs_skip_the_rescan(self) -> None:
+        vid = "EEEEEEEEEEE"
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.object(stage_contract, "repo_root", return_value=Path(tmp)):
+                preflight = stage_contract.StageContractPreflight()
+                self.assertEqual(preflight.check("07", {vid})["summary"]["status"], "fail")
+                preflight.note_present("06h", vid)
+                self.assertEqual(preflight.check("07", {vid})["summary"]["status"], "pass")
+                self.assertEqual(preflight.scans, 1)
+
+    def test_scan_of_one_dependency_does_not_block_others(self) -> None:
+        scanning, release = threading.Event(), threading.Event()
+        real_collect = stage_contract._collect_stage_video_ids
+
+        def slow_collect(stage: str):
+            if stage == "06h":
+                scanning.set()
+                release.wait(10)
+            return real_collect(stage)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.object(stage_contract, "repo_root", return_value=Path(tmp)), patch.object(
+                stage_contract, "_collect_stage_video_ids", side_effect=slow_collect
+            ):
+                preflight = stage_contract.StageContractPreflight()
+                reports = []
+                worker = threading.Thread(target=lambda: reports.append(preflight.check("07", {"AAAAAAAAAAA"})))
+                worker.start()
+                self.assertTrue(scanning.wait(10))
+                # 06e needs 06d: answered while the 06h scan is still running.
+                self.assertEqual(preflight.check("06e", {"AAAAAAAAAAA"})["summary"]["status"], "fail")
+                preflight.note_present("06h", "AAAAAAAAAAA")
+                release.set()
+                worker.join(10)
+                self.assertEqual(reports[0]["summary"]["status"], "pass")
+                self.assertEqual(preflight.scans, 2)
+
+    def test_quarantine_file_changes_are_picked_up(self) -> None:
+        vid = "DDDDDDDDDDD"
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            quarantine = root / "quarantine.json"
+            with patch.object(stage_contract, "repo_root", return_value=root):
+                preflight = stage_contract.StageContractPreflight(quarantine)
+                report = preflight.check("06f", {vid})
+                self.assertEqual(report["summary"]["status"], "fail")
+                self.assertIsNone(report["inputs"]["quarantine_file"])
+
+                _write(quarantine, '{"quarantined_video_ids": ["%s"]}' % vid)
+                report = preflight.check("06f", {vid})
+                self.assertEqual(report["summary"]["status"], "pass")
+                self.assertEqual(report["summary"]["quarantined_video_count"], 1)
+                self.assertEqual(report["inputs"]["quarantine_file"], str(quarantine))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""In-process validator runs (validation/validator_api.py)."""
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_VALIDATION_DIR = Path(__file__).resolve().parents[3] / "scripts" / "training-data" / "validation"
+if str(_VALIDATION_DIR) not in sys.path:
+    sys.path.insert(0, str(_VALIDATION_DIR))
+
+import validate_chunks  # noqa: E402
+from validator_api import run_validator_json, run_validators_json  # noqa: E402
+
+
+def _write(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+class TestValidatorApi(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        patcher = patch.object(validate_chunks, "repo_root", return_value=self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        chunks_root = self.root / "data" / "09.EXT.chunks" / "src"
+        _write(chunks_root / "AAAAAAAAAAA.chunks.json", {
+            "version": 1, "channel": "src", "videoId": "AAAAAAAAAAA", "chunks": [],
+        })
+        self.manifest = self.root / "m.txt"
+        self.manifest.write_text("src | Clip [AAAAAAAAAAA]\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_returns_report_without_touching_caller_stdout(self) -> None:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            report, exit_code, _ = run_validator_json("validate_chunks", ["--manifest", str(self.manifest)])
+        self.assertEqual(out.getvalue(), "")
+        self.assertIsInstance(report, dict)
+        self.assertEqual(report["processed_files"], 1)
+        self.assertEqual(exit_code, 1 if report["issues_summary"]["errors"] else 0)
+
+    def test_early_exit_yields_no_report_and_stderr(self) -> None:
+        report, exit_code, stderr = run_validator_json(
+            "validate_chunks", ["--manifest", str(self.root / "missing.txt")]
+        )
+        self.assertIsNone(report)
+        self.assertEqual(exit_code, 2)
+        self.assertIn("Manifest not found", stderr)
+
+    def test_pool_results_keep_call_order(self) -> None:
+        calls = [
+            ("validate_chunks", ["--manifest", str(self.root / "missing.txt")]),
+            ("validate_chunks", ["--manifest", str(self.manifest)]),
+        ]
+        results = run_validators_json(calls, workers=2)
+        self.assertEqual([r[0] is None for r in results], [True, False])
+        self.assertEqual(results, run_validators_json(calls, workers=1))
+
+    def test_unknown_validator_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            run_validator_json("rm_rf", [])
+
+
+if __name__ == "__main__":
+    unittest.main()